@@ -0,0 +1,201 @@
+"""
+Offline `pull_kline` benchmark.
+
+Replays recorded vendor payloads (see `benchmarks/fixtures.py`) through the
+real adapters and reports, per source, `limit` and concurrency level:
+throughput (rows/s), latency percentiles, and peak traced memory. The
+per-call overhead and per-row cost of each source are fitted from the
+single-threaded latencies. Results can be saved as a baseline and compared
+against on later runs:
+
+    python -m benchmarks.bench_pull_kline --save       # write benchmarks/baseline.json
+    python -m benchmarks.bench_pull_kline --check      # exit 1 on a p50 regression
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+import polars as pl  # noqa: E402
+
+from unified_data.api import close_adapters, pull_kline  # noqa: E402
+from unified_data.models.enums import Exchange, MarketType, Status  # noqa: E402
+from unified_data.scheduler import RequestScheduler, SourceLimit, get_scheduler, set_scheduler  # noqa: E402
+
+from .fixtures import load_payloads, replay  # noqa: E402
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# source name -> (exchange, market type, period, ticker pattern). Every call
+# uses its own ticker so concurrent requests are not coalesced.
+SOURCES = {
+    "ccxt": (Exchange.BINANCE, MarketType.CRYPTO, "1h", "C{:04d}_USDT"),
+    "yfinance": (Exchange.YFINANCE, MarketType.STOCK, "1d", "S{:04d}"),
+    "akshare": (Exchange.AKSHARE, MarketType.STOCK, "1d", "60{:04d}"),
+}
+DEFAULT_LIMITS = (1, 100, 1000, 10_000)
+DEFAULT_CONCURRENCY = (1, 8)
+# A scenario whose p50 grows by more than this fraction counts as a regression
+REGRESSION_THRESHOLD = 0.25
+
+
+@dataclass
+class Result:
+    source: str
+    limit: int
+    concurrency: int
+    calls: int
+    rows: int
+    rows_per_s: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_kib: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.source}/limit={self.limit}/concurrency={self.concurrency}"
+
+
+def _pull(source: str, limit: int, call: int) -> tuple[float, int]:
+    exchange, market_type, period, pattern = SOURCES[source]
+    start = time.perf_counter()
+    res = pull_kline(pattern.format(call), market_type, period, limit=limit, exchange=exchange)
+    elapsed = time.perf_counter() - start
+    if res.status != Status.OK:
+        raise RuntimeError(f"{source} limit={limit} failed: {res.error}")
+    return elapsed, res.data.height
+
+
+def run_scenario(source: str, limit: int, concurrency: int, calls: int) -> Result:
+    """Time `calls` pull_kline requests spread over `concurrency` threads."""
+    # Warm up adapter construction and imports outside the measurement
+    _pull(source, limit, 0)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        samples = list(pool.map(lambda i: _pull(source, limit, i), range(calls)))
+        wall = time.perf_counter() - start
+    latencies = np.array([s[0] for s in samples]) * 1000
+    rows = sum(s[1] for s in samples)
+
+    # Separate pass: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    try:
+        _pull(source, limit, 0)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return Result(source, limit, concurrency, calls, rows, rows / wall, float(p50), float(p95), float(p99), peak / 1024)
+
+
+def fit_overhead(results: list[Result]) -> dict[str, dict[str, float]]:
+    """Per source, fit single-threaded p50 = overhead + rows * per_row."""
+    fits = {}
+    for source in {r.source for r in results}:
+        points = [(r.limit, r.p50_ms) for r in results if r.source == source and r.concurrency == 1]
+        if len(points) < 2:
+            continue
+        x, y = np.array(points, dtype=float).T
+        per_row, overhead = np.polyfit(x, y, 1)
+        fits[source] = {"overhead_ms": float(max(overhead, 0.0)), "per_row_us": float(per_row * 1000)}
+    return fits
+
+
+def run(sources, limits, concurrency, calls) -> list[Result]:
+    # Replayed calls must not be throttled by the public-endpoint rate limits
+    previous = get_scheduler()
+    set_scheduler(RequestScheduler({name: SourceLimit(rate=1e9, burst=1e9) for name in Exchange}))
+    # Per-request info logs would dominate the small-limit timings
+    logging.disable(logging.INFO)
+    results = []
+    try:
+        with replay(load_payloads()):
+            for source in sources:
+                for limit in limits:
+                    for workers in concurrency:
+                        results.append(run_scenario(source, limit, workers, calls))
+                        print(_format(results[-1]), flush=True)
+    finally:
+        close_adapters()
+        set_scheduler(previous)
+        logging.disable(logging.NOTSET)
+    return results
+
+
+def _format(r: Result) -> str:
+    return (
+        f"{r.key:<38} {r.rows_per_s:>12,.0f} rows/s  p50 {r.p50_ms:8.2f} ms  p95 {r.p95_ms:8.2f} ms  "
+        f"p99 {r.p99_ms:8.2f} ms  peak {r.peak_kib:9.0f} KiB"
+    )
+
+
+def compare(results: list[Result], baseline: dict, threshold: float) -> list[str]:
+    """Report p50 and throughput changes against a baseline; return regressed scenario keys."""
+    regressions = []
+    known = baseline.get("results", {})
+    print("\nChange vs baseline (p50 latency, rows/s):")
+    for r in results:
+        base = known.get(r.key)
+        if base is None:
+            continue
+        p50_change = r.p50_ms / base["p50_ms"] - 1
+        rate_change = r.rows_per_s / base["rows_per_s"] - 1
+        flag = ""
+        if p50_change > threshold:
+            regressions.append(r.key)
+            flag = "  REGRESSION"
+        print(f"{r.key:<38} p50 {p50_change:+7.1%}  rows/s {rate_change:+7.1%}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline pull_kline benchmark over recorded payloads")
+    parser.add_argument("--sources", nargs="+", default=list(SOURCES), choices=list(SOURCES))
+    parser.add_argument("--limits", nargs="+", type=int, default=list(DEFAULT_LIMITS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--calls", type=int, default=30, help="Requests per scenario")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any scenario regressed")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run(args.sources, args.limits, args.concurrency, args.calls)
+    fits = fit_overhead(results)
+    for source, fit in sorted(fits.items()):
+        print(f"{source}: per-call overhead {fit['overhead_ms']:.2f} ms, {fit['per_row_us']:.3f} us/row")
+
+    regressions = []
+    if args.baseline.exists() and not args.save:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    if args.save:
+        payload = {
+            "environment": {
+                "python": platform.python_version(),
+                "polars": pl.__version__,
+                "machine": platform.machine(),
+            },
+            "results": {r.key: asdict(r) for r in results},
+            "overhead": fits,
+        }
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+Recorded vendor payloads and a replay harness for offline benchmarks.
+
+`replay()` patches the vendor boundary (ccxt `fetch_ohlcv`, `yf.Ticker`,
+`ak.stock_zh_a_hist`) so `CCXTAdapter`, `YFinanceAdapter` and
+`AKShareAdapter` run their full code paths against in-memory payloads.
+Payloads come from `benchmarks/fixtures/*.parquet` when recorded with
+`python -m benchmarks.fixtures --record`, otherwise from deterministic
+synthetic data in the same shape as the vendor responses. Either way the
+timestamps are rebased so the newest bar is the current one, because
+requests without dates are resolved relative to now.
+"""
+import argparse
+import contextlib
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+HOUR_MS = 3_600_000
+
+# Rows per payload; large enough for the biggest benchmarked `limit`
+FIXTURE_ROWS = 30_000
+
+AKSHARE_STOCK_COLUMNS = ["日期", "股票代码", "开盘", "收盘", "最高", "最低", "成交量", "成交额", "振幅", "涨跌幅", "涨跌额", "换手率"]
+
+
+def _walk(n: int, seed: int) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.005, n))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.005, n))
+    volume = rng.integers(100, 10_000, n).astype(np.float64)
+    return open_, high, low, close, volume
+
+
+def synthetic_ccxt(n: int = FIXTURE_ROWS) -> pd.DataFrame:
+    """Hourly `fetch_ohlcv` rows as a frame (ts, open, high, low, close, volume)."""
+    o, h, l, c, v = _walk(n, seed=1)
+    ts = np.arange(n, dtype=np.int64) * HOUR_MS
+    return pd.DataFrame({"ts": ts, "open": o, "high": h, "low": l, "close": c, "volume": v})
+
+
+def synthetic_yfinance(n: int = FIXTURE_ROWS) -> pd.DataFrame:
+    """Daily `Ticker.history(auto_adjust=True)` frame with a tz-aware DatetimeIndex."""
+    o, h, l, c, v = _walk(n, seed=2)
+    index = pd.date_range(end="2024-01-01", periods=n, freq="D", tz="America/New_York", name="Date")
+    return pd.DataFrame(
+        {"Open": o, "High": h, "Low": l, "Close": c, "Volume": v.astype(np.int64), "Dividends": 0.0, "Stock Splits": 0.0},
+        index=index,
+    )
+
+
+def synthetic_akshare(n: int = FIXTURE_ROWS) -> pd.DataFrame:
+    """Daily `stock_zh_a_hist` frame with AKShare's Chinese column names."""
+    o, h, l, c, v = _walk(n, seed=3)
+    dates = pd.date_range(end="2024-01-01", periods=n, freq="D").date
+    return pd.DataFrame({
+        "日期": dates, "股票代码": "600519", "开盘": o, "收盘": c, "最高": h, "最低": l,
+        "成交量": v.astype(np.int64), "成交额": v * c, "振幅": 1.0, "涨跌幅": 0.1, "涨跌额": 0.1, "换手率": 0.5,
+    })[AKSHARE_STOCK_COLUMNS]
+
+
+def load_payloads() -> dict[str, pd.DataFrame]:
+    """Recorded payloads where available, synthetic ones otherwise."""
+    payloads = {"ccxt": synthetic_ccxt, "yfinance": synthetic_yfinance, "akshare": synthetic_akshare}
+    loaded = {}
+    for source, synth in payloads.items():
+        path = FIXTURE_DIR / f"{source}.parquet"
+        loaded[source] = pd.read_parquet(path) if path.exists() else synth()
+    return loaded
+
+
+class _Ccxt:
+    def __init__(self, frame: pd.DataFrame):
+        now_ms = int(time.time() * 1000)
+        last = now_ms - now_ms % HOUR_MS
+        self.rows = frame.to_numpy(dtype=np.float64)
+        self.rows[:, 0] += last - self.rows[-1, 0]
+        self.ts = self.rows[:, 0].astype(np.int64)
+
+    def fetch_ohlcv(self, symbol, timeframe="1h", since=None, limit=None, params=None):
+        limit = limit or 500
+        if since is None:
+            block = self.rows[-limit:]
+        else:
+            i = int(np.searchsorted(self.ts, since))
+            block = self.rows[i:i + limit]
+        # ccxt returns python lists with int timestamps
+        rows = block.tolist()
+        for row in rows:
+            row[0] = int(row[0])
+        return rows
+
+
+class _YFinanceTicker:
+    frame: pd.DataFrame
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+
+    def history(self, interval="1d", start=None, end=None, auto_adjust=True, **kwargs):
+        frame = self.frame
+        return frame.loc[self._bound(start, frame.index.tz):self._bound(end, frame.index.tz)].copy()
+
+    @staticmethod
+    def _bound(value, tz) -> pd.Timestamp | None:
+        if value is None:
+            return None
+        value = pd.Timestamp(value)
+        return value.tz_localize(tz) if value.tzinfo is None else value.tz_convert(tz)
+
+
+class _AKShare:
+    def __init__(self, frame: pd.DataFrame):
+        shift = datetime.now().date() - frame["日期"].iloc[-1]
+        self.frame = frame.assign(日期=frame["日期"] + shift)
+        self.dates = pd.to_datetime(self.frame["日期"]).dt.strftime("%Y%m%d").to_numpy()
+
+    def stock_zh_a_hist(self, symbol, period="daily", start_date="19700101", end_date="20500101", adjust=""):
+        lo = np.searchsorted(self.dates, start_date, side="left")
+        hi = np.searchsorted(self.dates, end_date, side="right")
+        return self.frame.iloc[lo:hi].reset_index(drop=True)
+
+
+def _rebase_yfinance(frame: pd.DataFrame) -> pd.DataFrame:
+    shift = pd.Timestamp.now(tz=frame.index.tz).normalize() - frame.index[-1].normalize()
+    frame = frame.copy()
+    frame.index = frame.index + shift
+    return frame
+
+
+@contextlib.contextmanager
+def replay(payloads: dict[str, pd.DataFrame] | None = None) -> Iterator[None]:
+    """Serve every adapter's vendor calls from `payloads`, with no network."""
+    import ccxt
+
+    payloads = payloads or load_payloads()
+    ccxt_feed = _Ccxt(payloads["ccxt"])
+    ticker_cls = type("Ticker", (_YFinanceTicker,), {"frame": _rebase_yfinance(payloads["yfinance"])})
+    ak_feed = _AKShare(payloads["akshare"])
+    with contextlib.ExitStack() as stack:
+        for cls in (ccxt.binance, ccxt.coinbase):
+            stack.enter_context(patch.object(cls, "fetch_ohlcv", lambda self, *a, **kw: ccxt_feed.fetch_ohlcv(*a, **kw)))
+        stack.enter_context(patch("unified_data.adapters.yfinance_adapter.yf.Ticker", ticker_cls))
+        stack.enter_context(patch("unified_data.adapters.akshare_adapter.ak.stock_zh_a_hist", ak_feed.stock_zh_a_hist))
+        yield
+
+
+def record() -> None:
+    """Capture real payloads from the live services into FIXTURE_DIR (needs network)."""
+    import akshare as ak
+    import ccxt
+    import yfinance as yf
+
+    FIXTURE_DIR.mkdir(exist_ok=True)
+    exchange = ccxt.binance()
+    since = int((datetime.now(timezone.utc) - timedelta(hours=FIXTURE_ROWS)).timestamp() * 1000)
+    rows = []
+    while len(rows) < FIXTURE_ROWS:
+        page = exchange.fetch_ohlcv("BTC/USDT", "1h", since=since, limit=1000)
+        if not page:
+            break
+        rows.extend(page)
+        since = page[-1][0] + HOUR_MS
+    pd.DataFrame(rows, columns=["ts", "open", "high", "low", "close", "volume"]).to_parquet(FIXTURE_DIR / "ccxt.parquet")
+    yf.Ticker("AAPL").history(period="max", interval="1d", auto_adjust=True).to_parquet(FIXTURE_DIR / "yfinance.parquet")
+    ak.stock_zh_a_hist(symbol="600519", period="daily", start_date="19700101", end_date="20500101", adjust="qfq").to_parquet(
+        FIXTURE_DIR / "akshare.parquet"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--record", action="store_true", help="Record live payloads into benchmarks/fixtures/")
+    if parser.parse_args().record:
+        record()
@@ -1,4 +1,40 @@
-from .api import pull_kline
-from .models.enums import MarketType, Exchange, Columns, TimeFramePeriod
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["pull_kline", "MarketType", "Exchange", "Columns", "TimeFramePeriod"]
+# Public names are resolved on first access so `import unified_data` stays
+# cheap: polars loads with the api, and vendor SDKs with their adapter.
+_LAZY_ATTRS = {
+    "pull_kline": ".api",
+    "pull_klines": ".api",
+    "pull_kline_async": ".api",
+    "update_kline": ".api",
+    "close_adapters": ".api",
+    "aclose_adapters": ".api",
+    "KlineStore": ".storage",
+    "KlineCache": ".cache",
+    "MarketType": ".models.enums",
+    "Exchange": ".models.enums",
+    "Columns": ".models.enums",
+    "TimeFramePeriod": ".models.enums",
+}
+
+__all__ = ["pull_kline", "pull_klines", "pull_kline_async", "update_kline", "close_adapters", "aclose_adapters", "KlineStore", "KlineCache", "MarketType", "Exchange", "Columns", "TimeFramePeriod"]
+
+if TYPE_CHECKING:
+    from .api import pull_kline, pull_klines, pull_kline_async, update_kline, close_adapters, aclose_adapters
+    from .storage import KlineStore
+    from .cache import KlineCache
+    from .models.enums import MarketType, Exchange, Columns, TimeFramePeriod
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
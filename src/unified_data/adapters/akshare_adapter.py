@@ -2,11 +2,30 @@ import akshare as ak
 import polars as pl
 from datetime import datetime
 from .base import BaseAdapter
-from ..models.enums import Columns, MarketType, TimeFramePeriod, Market
+from .normalize import from_pandas
+from ..models.enums import Columns, Exchange, MarketType, TimeFramePeriod, Market
+from ..metrics import span
+from ..scheduler import get_scheduler
 from ..utils import get_logger, calculate_start_date
 
 logger = get_logger("akshare_adapter")
 
+# AKShare column names (Chinese for stocks, English for futures) -> standard columns
+AKSHARE_COLUMNS = {
+    "日期": Columns.TIMESTAMP.value,
+    "date": Columns.TIMESTAMP.value,
+    "开盘": Columns.OPEN.value,
+    "open": Columns.OPEN.value,
+    "最高": Columns.HIGH.value,
+    "high": Columns.HIGH.value,
+    "最低": Columns.LOW.value,
+    "low": Columns.LOW.value,
+    "收盘": Columns.CLOSE.value,
+    "close": Columns.CLOSE.value,
+    "成交量": Columns.VOLUME.value,
+    "volume": Columns.VOLUME.value,
+}
+
 class AKShareAdapter(BaseAdapter):
     def detect_market(self, symbol: str) -> tuple[Market, str]:
         """
@@ -74,9 +93,9 @@ class AKShareAdapter(BaseAdapter):
                 # stock_zh_a_hist: daily data
                 adjust = "qfq" # Default forward adjust
                 if market == Market.A_SHARE:
-                    pdf = ak.stock_zh_a_hist(symbol=symbol, period=exch_period, start_date=start_str, end_date=end_str, adjust=adjust)
+                    pdf = get_scheduler().call(Exchange.AKSHARE, ak.stock_zh_a_hist, symbol=symbol, period=exch_period, start_date=start_str, end_date=end_str, adjust=adjust)
                 elif market == Market.HK:
-                    pdf = ak.stock_hk_hist(symbol=symbol, period=exch_period, start_date=start_str, end_date=end_str, adjust=adjust)
+                    pdf = get_scheduler().call(Exchange.AKSHARE, ak.stock_hk_hist, symbol=symbol, period=exch_period, start_date=start_str, end_date=end_str, adjust=adjust)
                 else:
                     logger.warning(f"Unknown market: {market}")
                     return pl.DataFrame()
@@ -84,63 +103,15 @@ class AKShareAdapter(BaseAdapter):
                 # Futures
                 # e.g. "RB0", "AU2412"
                 # try: ak.futures_zh_daily_sina(symbol=symbol)
-                pdf = ak.futures_zh_daily_sina(symbol=symbol)
+                pdf = get_scheduler().call(Exchange.AKSHARE, ak.futures_zh_daily_sina, symbol=symbol)
 
             if pdf is None or pdf.empty:
                 logger.warning(f"No data returned for {symbol}")
                 return pl.DataFrame()
 
             # 3. Normalize Columns
-            rename_map = {
-                "日期": Columns.TIMESTAMP.value,
-                "date": Columns.TIMESTAMP.value,
-                "开盘": Columns.OPEN.value,
-                "open": Columns.OPEN.value,
-                "最高": Columns.HIGH.value,
-                "high": Columns.HIGH.value,
-                "最低": Columns.LOW.value,
-                "low": Columns.LOW.value,
-                "收盘": Columns.CLOSE.value,
-                "close": Columns.CLOSE.value,
-                "成交量": Columns.VOLUME.value,
-                "volume": Columns.VOLUME.value,
-            }
-            
-            # Convert to Polars
-            df = pl.from_pandas(pdf)
-            
-            # Rename
-            existing_cols = df.columns
-            final_map = {k: v for k, v in rename_map.items() if k in existing_cols}
-            df = df.rename(final_map)
-            
-            # Date Parsing
-            if Columns.TIMESTAMP.value in df.columns:
-                col_type = df.schema[Columns.TIMESTAMP.value]
-                if col_type == pl.Utf8 or col_type == pl.String:
-                     df = df.with_columns(
-                        pl.col(Columns.TIMESTAMP.value).str.strptime(pl.Date, "%Y-%m-%d").cast(pl.Datetime).dt.timestamp("ms")
-                    )
-                elif col_type == pl.Date:
-                     df = df.with_columns(
-                        pl.col(Columns.TIMESTAMP.value).cast(pl.Datetime).dt.timestamp("ms")
-                    )
-            
-            # Add Symbol (Use original or exchanged? usually we want the standard one in output, 
-            # but usually we return what we asked for. 'ticker' arg is best.)
-            df = df.with_columns(pl.lit(ticker).alias(Columns.SYMBOL.value))
-
-             # Select strictly
-            required = [
-                Columns.TIMESTAMP.value, 
-                Columns.OPEN.value, 
-                Columns.HIGH.value, 
-                Columns.LOW.value, 
-                Columns.CLOSE.value, 
-                Columns.VOLUME.value,
-                Columns.SYMBOL.value
-            ]
-            df = df.select([c for c in required if c in df.columns])
+            with span("convert", exchange=Exchange.AKSHARE):
+                df = from_pandas(pdf, ticker, AKSHARE_COLUMNS)
 
             if limit > 0:
                 df = df.tail(limit)
@@ -1,6 +1,10 @@
 
 from ..models.enums import Columns, MarketType
+from ..utils import get_blocking_executor
 from datetime import datetime
+from functools import partial
+import asyncio
+import contextvars
 import polars as pl
 from abc import ABC, abstractmethod
 
@@ -25,6 +29,39 @@ class BaseAdapter(ABC):
         """
         pass
 
+    async def get_kline_async(
+        self, 
+        ticker: str, 
+        period: str, 
+        start_date: datetime | None = None, 
+        end_date: datetime | None = None, 
+        limit: int = 100,
+        market_type: MarketType | str | None = None
+    ) -> pl.DataFrame:
+        """
+        Async variant of `get_kline`.
+
+        The default runs the blocking `get_kline` on the shared bounded executor;
+        adapters with a native async client override this.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_blocking_executor(),
+            partial(contextvars.copy_context().run, self.get_kline, ticker, period, start_date, end_date, limit, market_type),
+        )
+
+    async def get_exchange_symbol_async(self, ticker: str, market_type: MarketType | str) -> str:
+        """Async variant of `get_exchange_symbol` (pure string mapping by default)."""
+        return self.get_exchange_symbol(ticker, market_type)
+
+    def close(self) -> None:
+        """Release sync resources (HTTP sessions, pools) held by the adapter."""
+        pass
+
+    async def aclose(self) -> None:
+        """Release async resources (sessions, connectors) held by the adapter."""
+        pass
+
     @abstractmethod
     def get_exchange_symbol(self, ticker: str, market_type: MarketType | str) -> str:
         """
@@ -1,15 +1,34 @@
 
+import asyncio
+import contextvars
+import time
 import polars as pl
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from .base import BaseAdapter
+from .normalize import from_ohlcv_rows
 from ..models.enums import Columns, MarketType, CcxtExchange
-from ..utils import get_logger
+from ..metrics import span
+from ..scheduler import get_scheduler
+from ..utils import get_logger, period_to_ms
 from .ccxt_strategies.base import BaseCCXTStrategy
 from .ccxt_strategies.binance import BinanceStrategy
 from .ccxt_strategies.coinbase import CoinbaseStrategy
 
 logger = get_logger("ccxt_adapter")
 
+# Max concurrent page requests per paginated fetch
+PAGINATION_WORKERS = 4
+
+@dataclass
+class _PagePlan:
+    windows: list[tuple[int | None, int]]
+    total: int
+    end_ms: int | None
+    from_start: bool
+
 class CCXTAdapter(BaseAdapter):
     def __init__(self, exchange_id: str | CcxtExchange = CcxtExchange.BINANCE):
         self.exchange_id = str(exchange_id).lower()
@@ -35,6 +54,12 @@ class CCXTAdapter(BaseAdapter):
         market_type: MarketType | str | None = None
     ) -> pl.DataFrame:
         
+        # Requests larger than one exchange page are split and fetched concurrently
+        plan = self._plan_pages(period, start_date, end_date, limit)
+        if plan is not None:
+            pages = list(self.iter_kline_pages(ticker, period, start_date, end_date, limit, market_type))
+            return self._stitch_pages(pages, plan)
+
         # 1. Parse ticker via strategy
         market_type = market_type or MarketType.CRYPTO
         symbol = self.strategy.get_exchange_symbol(ticker, market_type)
@@ -43,23 +68,16 @@ class CCXTAdapter(BaseAdapter):
         exchange = self.strategy.get_exchange()
         
         # 3. Handle Time parameters
-        since = None
-        if start_date:
-            if isinstance(start_date, str):
-                try:
-                    dt = datetime.fromisoformat(start_date)
-                    since = int(dt.timestamp() * 1000)
-                except ValueError:
-                    logger.warning(f"Could not parse start_date: {start_date}")
-            elif isinstance(start_date, datetime):
-                since = int(start_date.timestamp() * 1000)
+        since = self._parse_since(start_date)
 
         # Convert period via strategy
         exchange_period = self.strategy.to_exchange_period(period)
         logger.info(f"Fetching {symbol} {exchange_period} from CCXT ({self.exchange_id}) (since={since}, limit={limit})")
         
         try:
-            ohlcv = exchange.fetch_ohlcv(symbol, timeframe=exchange_period, since=since, limit=limit)
+            ohlcv = get_scheduler().call(
+                self.exchange_id, exchange.fetch_ohlcv, symbol, timeframe=exchange_period, since=since, limit=limit
+            )
         except Exception as e:
             logger.error(f"CCXT Error: {e}")
             raise
@@ -68,31 +86,209 @@ class CCXTAdapter(BaseAdapter):
             logger.warning(f"No data returned for {symbol}")
             return pl.DataFrame()
 
-        # 4. Convert to Polars DataFrame
-        data = {
-            Columns.TIMESTAMP.value: [x[0] for x in ohlcv],
-            Columns.OPEN.value: [x[1] for x in ohlcv],
-            Columns.HIGH.value: [x[2] for x in ohlcv],
-            Columns.LOW.value: [x[3] for x in ohlcv],
-            Columns.CLOSE.value: [x[4] for x in ohlcv],
-            Columns.VOLUME.value: [x[5] for x in ohlcv],
-            Columns.SYMBOL.value: [ticker] * len(ohlcv)
-        }
-        
-        df = pl.DataFrame(data)
-        
-        # Optional: Cast types if needed
-        df = df.with_columns(
-            pl.col(Columns.TIMESTAMP.value).cast(pl.Int64),
-            pl.col(Columns.OPEN.value).cast(pl.Float64),
-            pl.col(Columns.HIGH.value).cast(pl.Float64),
-            pl.col(Columns.LOW.value).cast(pl.Float64),
-            pl.col(Columns.CLOSE.value).cast(pl.Float64),
-            pl.col(Columns.VOLUME.value).cast(pl.Float64)
+        return self._to_frame(ohlcv, ticker, self.exchange_id)
+
+    def iter_kline_pages(
+        self,
+        ticker: str,
+        period: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 100,
+        market_type: MarketType | str | None = None
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Fetch a request page by page, yielding each page's frame as soon as it
+        arrives (in completion order, not time order).
+
+        Pages are fetched concurrently, bounded by PAGINATION_WORKERS; the
+        shared exchange instance applies its own rate limiting to every call.
+        """
+        market_type = market_type or MarketType.CRYPTO
+        symbol = self.strategy.get_exchange_symbol(ticker, market_type)
+        exchange = self.strategy.get_exchange()
+        exchange_period = self.strategy.to_exchange_period(period)
+        plan = self._plan_pages(period, start_date, end_date, limit)
+        if plan is None:
+            plan = self._single_page(period, start_date, end_date, limit)
+        windows = plan.windows
+        logger.info(f"Fetching {symbol} {exchange_period} from CCXT ({self.exchange_id}) in {len(windows)} pages")
+
+        def fetch(window: tuple[int, int]) -> list[list]:
+            since, page_limit = window
+            return get_scheduler().call(
+                self.exchange_id, exchange.fetch_ohlcv, symbol, timeframe=exchange_period, since=since, limit=page_limit
+            )
+
+        workers = max(1, min(PAGINATION_WORKERS, len(windows)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"ccxt-pages-{self.exchange_id}") as pool:
+            # Pages inherit the caller's scheduling priority
+            futures = [pool.submit(contextvars.copy_context().run, fetch, w) for w in windows]
+            try:
+                for future in as_completed(futures):
+                    ohlcv = future.result()
+                    if ohlcv:
+                        yield self._to_frame(ohlcv, ticker, self.exchange_id)
+            except Exception as e:
+                logger.error(f"CCXT Error: {e}")
+                raise
+            finally:
+                # Stop queued pages if the consumer abandons the generator early
+                for f in futures:
+                    f.cancel()
+
+    async def get_kline_async(
+        self, 
+        ticker: str, 
+        period: str, 
+        start_date: datetime | None = None, 
+        end_date: datetime | None = None, 
+        limit: int = 100,
+        market_type: MarketType | str | None = None
+    ) -> pl.DataFrame:
+        """Native async fetch through the strategy's ccxt.async_support exchange."""
+        market_type = market_type or MarketType.CRYPTO
+        symbol = await self.strategy.get_exchange_symbol_async(ticker, market_type)
+        exchange = self.strategy.get_async_exchange()
+        since = self._parse_since(start_date)
+        exchange_period = self.strategy.to_exchange_period(period)
+
+        plan = self._plan_pages(period, start_date, end_date, limit)
+        if plan is not None:
+            logger.info(f"Fetching {symbol} {exchange_period} from CCXT async ({self.exchange_id}) in {len(plan.windows)} pages")
+            semaphore = asyncio.Semaphore(PAGINATION_WORKERS)
+
+            async def fetch(window: tuple[int, int]) -> list[list]:
+                async with semaphore:
+                    return await get_scheduler().acall(
+                        self.exchange_id, exchange.fetch_ohlcv, symbol,
+                        timeframe=exchange_period, since=window[0], limit=window[1]
+                    )
+
+            try:
+                results = await asyncio.gather(*(fetch(w) for w in plan.windows))
+            except Exception as e:
+                logger.error(f"CCXT Error: {e}")
+                raise
+            return self._stitch_pages([self._to_frame(r, ticker, self.exchange_id) for r in results if r], plan)
+
+        logger.info(f"Fetching {symbol} {exchange_period} from CCXT async ({self.exchange_id}) (since={since}, limit={limit})")
+
+        try:
+            ohlcv = await get_scheduler().acall(
+                self.exchange_id, exchange.fetch_ohlcv, symbol, timeframe=exchange_period, since=since, limit=limit
+            )
+        except Exception as e:
+            logger.error(f"CCXT Error: {e}")
+            raise
+
+        if not ohlcv:
+            logger.warning(f"No data returned for {symbol}")
+            return pl.DataFrame()
+
+        return self._to_frame(ohlcv, ticker, self.exchange_id)
+
+    def _plan_pages(
+        self,
+        period: str,
+        start_date: datetime | str | None,
+        end_date: datetime | str | None,
+        limit: int,
+    ) -> _PagePlan | None:
+        """
+        Split a request into page-sized (since, limit) windows using the
+        timeframe duration. Returns None when one fetch_ohlcv call suffices.
+
+        Mirrors the single-call semantics: with only a start, the first `limit`
+        bars from it; with start and end, the last `limit` bars of the range;
+        with neither, the latest `limit` bars.
+        """
+        page_size = self.strategy.max_page_size
+        tf_ms = period_to_ms(period)
+        since = self._parse_since(start_date)
+        end_ms = self._parse_since(end_date)
+
+        if since is not None and end_ms is not None:
+            total = (end_ms - since) // tf_ms + 1
+            if 0 < limit < total:
+                since = end_ms - (limit - 1) * tf_ms
+                total = limit
+            from_start = False
+        elif since is not None:
+            total = limit
+            from_start = True
+        else:
+            if end_ms is None:
+                end_ms = int(time.time() * 1000)
+            total = limit
+            since = end_ms - (limit - 1) * tf_ms
+            since -= since % tf_ms
+            from_start = False
+
+        if total is None or total <= page_size:
+            return None
+
+        windows = [
+            (since + offset * tf_ms, min(page_size, total - offset))
+            for offset in range(0, total, page_size)
+        ]
+        return _PagePlan(windows=windows, total=total, end_ms=end_ms, from_start=from_start)
+
+    def _single_page(self, period, start_date, end_date, limit) -> _PagePlan:
+        """Plan for a request that fits one page (used when streaming small requests)."""
+        return _PagePlan(
+            windows=[(self._parse_since(start_date), limit)],
+            total=limit,
+            end_ms=self._parse_since(end_date),
+            from_start=start_date is not None,
         )
 
+    @staticmethod
+    def _stitch_pages(pages: list[pl.DataFrame], plan: _PagePlan) -> pl.DataFrame:
+        """Concatenate page frames, dedupe on timestamp and trim to the plan."""
+        if not pages:
+            return pl.DataFrame()
+        df = (
+            pl.concat(pages)
+            .unique(subset=[Columns.TIMESTAMP.value], keep="last")
+            .sort(Columns.TIMESTAMP.value)
+        )
+        if plan.end_ms is not None:
+            df = df.filter(pl.col(Columns.TIMESTAMP.value) <= plan.end_ms)
+        if plan.total and plan.total > 0:
+            df = df.head(plan.total) if plan.from_start else df.tail(plan.total)
         return df
 
+    @staticmethod
+    def _parse_since(start_date: datetime | str | None) -> int | None:
+        """Convert a start date into the ms timestamp ccxt expects."""
+        since = None
+        if start_date:
+            if isinstance(start_date, str):
+                try:
+                    dt = datetime.fromisoformat(start_date)
+                    since = int(dt.timestamp() * 1000)
+                except ValueError:
+                    logger.warning(f"Could not parse start_date: {start_date}")
+            elif isinstance(start_date, datetime):
+                since = int(start_date.timestamp() * 1000)
+        return since
+
+    @staticmethod
+    def _to_frame(ohlcv: list[list], ticker: str, exchange_id: str = "ccxt") -> pl.DataFrame:
+        """Convert ccxt OHLCV rows to the standard column layout."""
+        with span("convert", exchange=exchange_id):
+            return from_ohlcv_rows(ohlcv, ticker)
+
+    async def get_exchange_symbol_async(self, ticker: str, market_type: str) -> str:
+        return await self.strategy.get_exchange_symbol_async(ticker, market_type)
+
+    def close(self) -> None:
+        self.strategy.close()
+
+    async def aclose(self) -> None:
+        await self.strategy.aclose()
+
     def get_exchange_symbol(self, ticker: str, market_type: str) -> str:
         return self.strategy.get_exchange_symbol(ticker, market_type)
 
@@ -1,23 +1,101 @@
+import asyncio
+import threading
 from abc import ABC, abstractmethod
 
 import ccxt
+import ccxt.async_support as ccxt_async
+import requests
+from requests.adapters import HTTPAdapter
 from ...models.enums import MarketType
+from .markets import MARKETS_CACHE, SymbolIndex
+
+# Keep-alive connections retained per host by the shared sync exchange session
+HTTP_POOL_MAXSIZE = 16
 
 class BaseCCXTStrategy(ABC):
-    """Abstract base class for CCXT exchange strategies."""
+    """Abstract base class for CCXT exchange strategies.
+
+    Strategy instances are shared across threads by the adapter registry, so
+    the exchange objects (and their HTTP sessions and loaded markets) live for
+    the lifetime of the process until `close()` is called.
+    """
+
+    # ccxt exchange id, also the key into the shared markets cache
+    exchange_id: str = ""
+    # Max candles the exchange returns per fetch_ohlcv call
+    max_page_size: int = 500
     
     def __init__(self):
+        self._lock = threading.RLock()
         self._exchange = self._initialize_exchange()
+        self._configure_session(self._exchange)
+        self._async_exchange: ccxt_async.Exchange | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+
+    @staticmethod
+    def _configure_session(exchange: ccxt.Exchange) -> None:
+        """Size the requests connection pool for concurrent use of one exchange."""
+        session = getattr(exchange, "session", None)
+        if isinstance(session, requests.Session):
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
 
     @abstractmethod
     def _initialize_exchange(self) -> ccxt.Exchange:
         """Initialize and return the specific CCXT exchange instance."""
         pass
 
+    @abstractmethod
+    def _initialize_async_exchange(self) -> ccxt_async.Exchange:
+        """Initialize and return the ccxt.async_support exchange instance."""
+        pass
+
     def get_exchange(self) -> ccxt.Exchange:
         """Return the initialized exchange instance."""
         return self._exchange
 
+    def get_async_exchange(self) -> ccxt_async.Exchange:
+        """Return the async exchange instance for the running event loop.
+
+        Must be called from within a running event loop. ccxt binds its HTTP
+        session to the loop it was opened on, so a new instance is created
+        when the caller's loop differs from the one it was built for.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._async_exchange is None or self._async_loop is not loop:
+                self._async_exchange = self._initialize_async_exchange()
+                self._async_loop = loop
+            return self._async_exchange
+
+    def get_symbol_index(self) -> SymbolIndex | None:
+        """Markets index for this exchange from the process-wide markets cache."""
+        return MARKETS_CACHE.get_index(self.exchange_id, self._exchange)
+
+    async def get_symbol_index_async(self) -> SymbolIndex | None:
+        """Async counterpart of `get_symbol_index`, loading through the async exchange."""
+        return await MARKETS_CACHE.get_index_async(self.exchange_id, self.get_async_exchange())
+
+    def close(self) -> None:
+        """Close the sync exchange's HTTP session."""
+        with self._lock:
+            close = getattr(self._exchange, "close", None)
+            if callable(close):
+                close()
+
+    async def aclose(self) -> None:
+        """Close the async exchange session, if one was opened on this loop."""
+        with self._lock:
+            exchange, self._async_exchange = self._async_exchange, None
+            loop, self._async_loop = self._async_loop, None
+        if exchange is not None and loop is asyncio.get_running_loop():
+            await exchange.close()
+
+    async def get_exchange_symbol_async(self, ticker: str, market_type: MarketType | str) -> str:
+        """Async variant of `get_exchange_symbol` (pure string mapping by default)."""
+        return self.get_exchange_symbol(ticker, market_type)
+
     @abstractmethod
     def get_exchange_symbol(self, ticker: str, market_type: MarketType | str) -> str:
         """Convert standard ticker to exchange-specific symbol."""
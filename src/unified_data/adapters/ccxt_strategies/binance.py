@@ -1,13 +1,20 @@
 import ccxt
-from ...models.enums import MarketType, TimeFramePeriod
+import ccxt.async_support as ccxt_async
+from ...models.enums import CcxtExchange, MarketType, TimeFramePeriod
 from .base import BaseCCXTStrategy
 
 class BinanceStrategy(BaseCCXTStrategy):
     """Binance specific implementation."""
 
+    exchange_id = CcxtExchange.BINANCE
+    max_page_size = 1000
+
     def _initialize_exchange(self) -> ccxt.Exchange:
         return ccxt.binance()
 
+    def _initialize_async_exchange(self) -> ccxt_async.Exchange:
+        return ccxt_async.binance()
+
     def get_exchange_symbol(self, ticker: str, market_type: MarketType | str) -> str:
         # Standard: BTC_USDT -> CCXT: BTC/USDT
         ticker = ticker.upper()
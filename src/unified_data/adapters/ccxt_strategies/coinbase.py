@@ -1,13 +1,20 @@
 import ccxt
-from ...models.enums import MarketType, TimeFramePeriod
+import ccxt.async_support as ccxt_async
+from ...models.enums import CcxtExchange, MarketType, TimeFramePeriod
 from .base import BaseCCXTStrategy
 
 class CoinbaseStrategy(BaseCCXTStrategy):
     """Coinbase specific implementation."""
 
+    exchange_id = CcxtExchange.COINBASE
+    max_page_size = 300
+
     def _initialize_exchange(self) -> ccxt.Exchange:
         return ccxt.coinbase()
 
+    def _initialize_async_exchange(self) -> ccxt_async.Exchange:
+        return ccxt_async.coinbase()
+
     def get_exchange_symbol(self, ticker: str, market_type: MarketType | str) -> str:
         # Standard: BTC_USDT -> CCXT: BTC/USDT
         # Coinbase usually pairs with USD, not USDT for fiat pairs, but accepts standard slash format
@@ -17,22 +24,24 @@ class CoinbaseStrategy(BaseCCXTStrategy):
         # Check if we need to fallback from USDT to USD
         # Only check if the symbol ends with /USDT
         if symbol.endswith("/USDT"):
-            # Ensure markets are loaded
-            if not self._exchange.markets:
-                try:
-                    self._exchange.load_markets()
-                except Exception:
-                    # If network fails, fallback to default symbol
-                    return symbol
-                    
-            if symbol not in self._exchange.markets:
-                # Try replacing USDT with USD
-                alt_symbol = symbol.replace("/USDT", "/USD")
-                if alt_symbol in self._exchange.markets:
-                    return alt_symbol
+            # Markets come from the shared cache (or a snapshot), loaded at most once per TTL
+            index = self.get_symbol_index()
+            if index is None:
+                # If network fails, fallback to default symbol
+                return symbol
+            return index.resolve(symbol)
                     
         return symbol
 
+    async def get_exchange_symbol_async(self, ticker: str, market_type: MarketType | str) -> str:
+        symbol = ticker.upper().replace("_", "/")
+        if symbol.endswith("/USDT"):
+            index = await self.get_symbol_index_async()
+            if index is None:
+                return symbol
+            return index.resolve(symbol)
+        return symbol
+
     def to_exchange_period(self, period: str) -> str:
         # Coinbase specific timeframes if different, otherwise standard
         
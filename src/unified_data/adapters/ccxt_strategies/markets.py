@@ -0,0 +1,196 @@
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ...scheduler import get_scheduler
+from ...utils import get_logger, atomic_write
+
+logger = get_logger("ccxt_markets")
+
+# How long loaded markets are trusted before being reloaded from the exchange
+MARKETS_TTL_SECONDS = 6 * 3600
+
+
+@dataclass(frozen=True)
+class SymbolIndex:
+    """Precomputed symbol lookups for one exchange's markets."""
+    symbols: frozenset[str]
+    usdt_fallbacks: dict[str, str] = field(default_factory=dict)
+    loaded_at: float = 0.0
+
+    @classmethod
+    def from_symbols(cls, symbols, loaded_at: float | None = None) -> "SymbolIndex":
+        symbols = frozenset(symbols)
+        # X/USDT -> X/USD for every base listed only against USD
+        fallbacks = {
+            f"{s[:-4]}/USDT": s
+            for s in symbols
+            if s.endswith("/USD") and f"{s[:-4]}/USDT" not in symbols
+        }
+        return cls(symbols, fallbacks, time.time() if loaded_at is None else loaded_at)
+
+    def resolve(self, symbol: str) -> str:
+        """Return the listed symbol, applying the USDT -> USD fallback when needed."""
+        if symbol in self.symbols:
+            return symbol
+        return self.usdt_fallbacks.get(symbol, symbol)
+
+
+@dataclass
+class _Entry:
+    index: SymbolIndex
+    # The exchange.markets dict the index was built from, if any
+    source: object | None = None
+
+
+class MarketsCache:
+    """
+    Process-wide markets cache shared by all CCXT strategies.
+
+    Indexes are keyed by exchange id and reused by every strategy instance, so
+    only the first resolution (per TTL) pays for `load_markets()`. With a
+    snapshot directory configured, loaded symbol lists are persisted to disk
+    and a cold process can resolve symbols without touching the network.
+    """
+
+    def __init__(self, ttl: float = MARKETS_TTL_SECONDS, snapshot_dir: str | os.PathLike | None = None):
+        self.ttl = ttl
+        self.snapshot_dir = Path(snapshot_dir).expanduser() if snapshot_dir else None
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+
+    def configure(self, ttl: float | None = None, snapshot_dir: str | os.PathLike | None = None) -> None:
+        """Change the TTL and/or snapshot directory."""
+        if ttl is not None:
+            self.ttl = ttl
+        if snapshot_dir is not None:
+            self.snapshot_dir = Path(snapshot_dir).expanduser()
+
+    def invalidate(self, exchange_id: str | None = None) -> None:
+        """Drop cached indexes (all of them, or one exchange's)."""
+        with self._lock:
+            if exchange_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(exchange_id, None)
+
+    def get_index(self, exchange_id: str, exchange) -> SymbolIndex | None:
+        """
+        Return the symbol index for a sync ccxt exchange, loading markets only
+        when neither the exchange, the cache nor a snapshot has fresh ones.
+        Returns None if nothing is available and loading fails.
+        """
+        index = self._lookup(exchange_id, exchange.markets)
+        if index is not None:
+            return index
+
+        with self._load_lock(exchange_id):
+            # Another thread may have loaded while we waited
+            index = self._lookup(exchange_id, exchange.markets)
+            if index is not None:
+                return index
+            try:
+                get_scheduler().call(exchange_id, exchange.load_markets, reload=bool(exchange.markets))
+            except Exception as e:
+                logger.warning(f"Could not load {exchange_id} markets: {e}")
+                return self._stale(exchange_id)
+            return self._remember(exchange_id, exchange.markets, save=True)
+
+    async def get_index_async(self, exchange_id: str, exchange) -> SymbolIndex | None:
+        """Async counterpart of `get_index` for ccxt.async_support exchanges."""
+        index = self._lookup(exchange_id, exchange.markets)
+        if index is not None:
+            return index
+        try:
+            # ccxt.async_support shares one in-flight load between concurrent callers
+            await get_scheduler().acall(exchange_id, exchange.load_markets, reload=bool(exchange.markets))
+        except Exception as e:
+            logger.warning(f"Could not load {exchange_id} markets: {e}")
+            return self._stale(exchange_id)
+        return self._remember(exchange_id, exchange.markets, save=True)
+
+    def _lookup(self, exchange_id: str, markets) -> SymbolIndex | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(exchange_id)
+            if markets:
+                if entry is not None and entry.source is markets:
+                    return entry.index if now - entry.index.loaded_at < self.ttl else None
+                # Markets were loaded outside the cache (e.g. by ccxt during a fetch)
+                return self._remember_locked(exchange_id, markets)
+            if entry is not None and now - entry.index.loaded_at < self.ttl:
+                return entry.index
+
+        snapshot = self._read_snapshot(exchange_id)
+        if snapshot is not None and now - snapshot.loaded_at < self.ttl:
+            with self._lock:
+                self._entries[exchange_id] = _Entry(snapshot)
+            return snapshot
+        return None
+
+    def _stale(self, exchange_id: str) -> SymbolIndex | None:
+        """Best available index regardless of age, used when loading fails."""
+        with self._lock:
+            entry = self._entries.get(exchange_id)
+        if entry is not None:
+            return entry.index
+        return self._read_snapshot(exchange_id)
+
+    def _remember(self, exchange_id: str, markets, save: bool = False) -> SymbolIndex:
+        with self._lock:
+            index = self._remember_locked(exchange_id, markets)
+        if save:
+            self._write_snapshot(exchange_id, index)
+        return index
+
+    def _remember_locked(self, exchange_id: str, markets) -> SymbolIndex:
+        index = SymbolIndex.from_symbols(markets.keys())
+        self._entries[exchange_id] = _Entry(index, source=markets)
+        return index
+
+    def _load_lock(self, exchange_id: str) -> threading.Lock:
+        with self._lock:
+            return self._load_locks.setdefault(exchange_id, threading.Lock())
+
+    def _snapshot_path(self, exchange_id: str) -> Path | None:
+        if self.snapshot_dir is None:
+            return None
+        return self.snapshot_dir / f"{exchange_id}_markets.json"
+
+    def _read_snapshot(self, exchange_id: str) -> SymbolIndex | None:
+        path = self._snapshot_path(exchange_id)
+        if path is None or not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text())
+            return SymbolIndex.from_symbols(payload["symbols"], loaded_at=float(payload["loaded_at"]))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable markets snapshot {path}: {e}")
+            return None
+
+    def _write_snapshot(self, exchange_id: str, index: SymbolIndex) -> None:
+        path = self._snapshot_path(exchange_id)
+        if path is None:
+            return
+        payload = json.dumps({
+            "exchange": exchange_id,
+            "loaded_at": index.loaded_at,
+            "symbols": sorted(index.symbols),
+        }).encode()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, lambda f: f.write(payload))
+        except OSError as e:
+            logger.warning(f"Could not write markets snapshot {path}: {e}")
+
+
+MARKETS_CACHE = MarketsCache()
+
+
+def configure_markets_cache(ttl: float | None = None, snapshot_dir: str | os.PathLike | None = None) -> None:
+    """Configure the shared markets cache (TTL in seconds, optional snapshot directory)."""
+    MARKETS_CACHE.configure(ttl=ttl, snapshot_dir=snapshot_dir)
@@ -0,0 +1,104 @@
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+
+from ..models.enums import Columns
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Standard output schema shared by every adapter
+KLINE_SCHEMA: dict[str, pl.DataType] = {
+    Columns.TIMESTAMP.value: pl.Int64,
+    Columns.OPEN.value: pl.Float64,
+    Columns.HIGH.value: pl.Float64,
+    Columns.LOW.value: pl.Float64,
+    Columns.CLOSE.value: pl.Float64,
+    Columns.VOLUME.value: pl.Float64,
+    Columns.SYMBOL.value: pl.String,
+}
+
+_OHLCV = [
+    Columns.TIMESTAMP.value,
+    Columns.OPEN.value,
+    Columns.HIGH.value,
+    Columns.LOW.value,
+    Columns.CLOSE.value,
+    Columns.VOLUME.value,
+]
+
+
+def empty_frame() -> pl.DataFrame:
+    """Zero-row frame in the standard schema."""
+    return pl.DataFrame(schema=KLINE_SCHEMA)
+
+
+def from_ohlcv_rows(rows: Sequence[Sequence[float | None]], ticker: str) -> pl.DataFrame:
+    """
+    Build a standard frame from ccxt-style `[ts, o, h, l, c, v]` rows.
+
+    The rows are converted to one float64 block in a single pass; polars then
+    takes the columns from that buffer instead of six per-column Python lists.
+    Missing values (None) come back as nulls, as before.
+    """
+    if len(rows) == 0:
+        return empty_frame()
+    block = np.asarray(rows, dtype=np.float64)
+    df = pl.from_numpy(block[:, :6], schema=_OHLCV, orient="row")
+    return df.select(
+        pl.col(Columns.TIMESTAMP.value).cast(pl.Int64),
+        *(pl.col(c).fill_nan(None) for c in _OHLCV[1:]),
+        pl.lit(ticker, dtype=pl.String).alias(Columns.SYMBOL.value),
+    )
+
+
+def from_pandas(pdf: "pd.DataFrame", ticker: str, aliases: Mapping[str, str]) -> pl.DataFrame:
+    """
+    Build a standard frame from a vendor pandas frame.
+
+    The pandas index is kept as a column by the Arrow conversion (no
+    `reset_index` copy) and numeric buffers are shared with polars; renaming,
+    casting and column selection then happen in a single `select`.
+    `aliases` maps lowercase vendor column names to standard column names.
+    """
+    # Only pandas-based sources pay for pyarrow's import
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(pdf, preserve_index=True)
+    return normalize(pl.from_arrow(table), ticker, aliases)
+
+
+def normalize(df: pl.DataFrame, ticker: str, aliases: Mapping[str, str]) -> pl.DataFrame:
+    """Rename, cast and select `df` into the standard schema in one pass."""
+    # Case-insensitive match of vendor names; the first alias found wins
+    sources: dict[str, str] = {}
+    for name in df.columns:
+        target = aliases.get(name.lower())
+        if target is not None and target not in sources:
+            sources[target] = name
+
+    exprs = []
+    for target in _OHLCV:
+        name = sources.get(target)
+        if name is None:
+            continue
+        if target == Columns.TIMESTAMP.value:
+            exprs.append(_timestamp_ms(pl.col(name), df.schema[name]).alias(target))
+        else:
+            exprs.append(pl.col(name).cast(pl.Float64).alias(target))
+    exprs.append(pl.lit(ticker, dtype=pl.String).alias(Columns.SYMBOL.value))
+    return df.select(exprs)
+
+
+def _timestamp_ms(col: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+    """Expression converting a vendor date/time column to epoch milliseconds."""
+    if dtype == pl.String:
+        return col.str.to_datetime(time_unit="ms").dt.epoch("ms")
+    if dtype == pl.Date:
+        return col.cast(pl.Datetime("ms")).dt.epoch("ms")
+    if isinstance(dtype, pl.Datetime):
+        # Timezone-aware values convert to UTC epoch
+        return col.dt.epoch("ms")
+    return col.cast(pl.Int64)
@@ -2,11 +2,25 @@ import yfinance as yf
 import polars as pl
 from datetime import datetime
 from .base import BaseAdapter
-from ..models.enums import Columns, MarketType, TimeFramePeriod
+from .normalize import from_pandas
+from ..models.enums import Columns, Exchange, MarketType, TimeFramePeriod
+from ..metrics import span
+from ..scheduler import get_scheduler
 from ..utils import get_logger, calculate_start_date
 
 logger = get_logger("yfinance_adapter")
 
+# Lowercase yfinance column names -> standard columns
+YFINANCE_COLUMNS = {
+    "date": Columns.TIMESTAMP.value,
+    "datetime": Columns.TIMESTAMP.value,
+    "open": Columns.OPEN.value,
+    "high": Columns.HIGH.value,
+    "low": Columns.LOW.value,
+    "close": Columns.CLOSE.value,
+    "volume": Columns.VOLUME.value,
+}
+
 class YFinanceAdapter(BaseAdapter):
     def get_kline(
         self, 
@@ -44,7 +58,9 @@ class YFinanceAdapter(BaseAdapter):
             
             # Fetch history
             # auto_adjust=True handles splits/dividends and returns 'Close' as adjusted
-            pdf = ticker_obj.history(
+            pdf = get_scheduler().call(
+                Exchange.YFINANCE,
+                ticker_obj.history,
                 interval=interval,
                 start=start_date,
                 end=end_date,
@@ -55,62 +71,11 @@ class YFinanceAdapter(BaseAdapter):
                 logger.warning(f"No data returned for {symbol}")
                 return pl.DataFrame()
                 
-            # yf.Ticker.history returns a DataFrame with DatetimeIndex
-            # Columns are typically: Open, High, Low, Close, Volume, Dividends, Stock Splits
-            # It comes flattened (no MultiIndex) for single ticker
-            
-            # Reset index to get Date/Datetime as column
-            pdf = pdf.reset_index()
-            
-            # 2. Convert to Polars
-            df = pl.from_pandas(pdf)
-            
-            # 3. Standardize Columns
-            # YF cols: Date (or Datetime), Open, High, Low, Close, Adj Close, Volume
-            # Standardize names to lowercase first to be safe
-            df = df.select(pl.all().name.to_lowercase())
-            
-            # Rename map
-            rename_map = {
-                "date": Columns.TIMESTAMP.value,
-                "datetime": Columns.TIMESTAMP.value,
-                "open": Columns.OPEN.value,
-                "high": Columns.HIGH.value,
-                "low": Columns.LOW.value,
-                "close": Columns.CLOSE.value,
-                "volume": Columns.VOLUME.value,
-            }
-            
-            # Filter valid keys that exist in df
-            existing_cols = df.columns
-            final_map = {k: v for k, v in rename_map.items() if k in existing_cols}
-            
-            df = df.rename(final_map)
-            
-            # Ensure TIMESTAMP is proper int (ms) if it's datetime
-            # YF usually gives Date or Datetime
-            if Columns.TIMESTAMP.value in df.columns:
-                df = df.with_columns(
-                   pl.col(Columns.TIMESTAMP.value).cast(pl.Datetime).dt.timestamp("ms").alias(Columns.TIMESTAMP.value)
-                )
+            # yf.Ticker.history returns a DataFrame with a DatetimeIndex (Date or Datetime)
+            # and Open, High, Low, Close, Volume, Dividends, Stock Splits columns
+            with span("convert", exchange=Exchange.YFINANCE):
+                df = from_pandas(pdf, ticker, YFINANCE_COLUMNS)
 
-            # Add Symbol
-            df = df.with_columns(pl.lit(ticker).alias(Columns.SYMBOL.value))
-            
-            # Select only required columns (handling missing optional ones gracefully if needed)
-            # For now select strictly
-            required = [
-                Columns.TIMESTAMP.value, 
-                Columns.OPEN.value, 
-                Columns.HIGH.value, 
-                Columns.LOW.value, 
-                Columns.CLOSE.value, 
-                Columns.VOLUME.value,
-                Columns.SYMBOL.value
-            ]
-            
-            df = df.select([c for c in required if c in df.columns])
-            
             # Apply limit
             if limit > 0:
                 df = df.tail(limit)
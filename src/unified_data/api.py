@@ -1,15 +1,52 @@
+import asyncio
+import contextvars
+import threading
 import polars as pl
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from datetime import datetime
-from .models.enums import MarketType, Exchange, Columns, Status
-from .models.types import KlineData
+from functools import partial
+from .models.enums import MarketType, Exchange, CcxtExchange, Columns, Status
+from .models.types import KlineData, BatchKlineData, KlineUpdate
 from .adapters.base import BaseAdapter
-from .utils import get_logger
+from .cache import CacheKey, KlineCache
+from .coalesce import REQUEST_COALESCER
+from .lazy import scan_klines
+from .metrics import BYTES_TOTAL, ROWS_TOTAL, count, span
+from .resample import bucket_start, can_derive, resample_kline
+from .storage import KlineStore
+from .utils import get_logger, get_blocking_executor, calculate_start_date, period_to_ms, to_datetime
 
 logger = get_logger("data_api")
 
+# Max in-flight requests per source for pull_klines
+SOURCE_CONCURRENCY: dict[str, int] = {
+    Exchange.BINANCE: 8,
+    Exchange.COINBASE: 4,
+    Exchange.YFINANCE: 8,
+    Exchange.AKSHARE: 2,
+}
+DEFAULT_CONCURRENCY = 4
+
+# Process-wide adapter registry, keyed by resolved exchange name. Adapters are
+# shared across threads so HTTP sessions and loaded markets are reused.
+_ADAPTERS: dict[str, BaseAdapter] = {}
+_ADAPTERS_LOCK = threading.Lock()
+
 def _get_adapter(market_type: str, exchange: Exchange | None) -> tuple[BaseAdapter, str]:
     """Factory to get the correct adapter instance and the resolved exchange name."""
-    
+    exchange = _resolve_exchange(market_type, exchange)
+    with _ADAPTERS_LOCK:
+        adapter = _ADAPTERS.get(exchange)
+        if adapter is None:
+            with span("adapter", exchange=exchange):
+                adapter = _create_adapter(exchange)
+            _ADAPTERS[exchange] = adapter
+    return adapter, exchange
+
+def _resolve_exchange(market_type: str, exchange: Exchange | None) -> str:
+    """Resolve the exchange a request routes to, without creating its adapter."""
     # Default routing logic
     if exchange is None:
         if market_type == MarketType.CRYPTO:
@@ -23,22 +60,117 @@ def _get_adapter(market_type: str, exchange: Exchange | None) -> tuple[BaseAdapt
         else:
             raise ValueError(f"Unsupported market type: {market_type}")
 
-    # Dispatch to specific adapters
-    # Note: Imports are inside to avoid circular deps or heavy load if not needed
+    # Default CCXT routing to Coinbase as per new requirement
     if exchange == Exchange.CCXT:
+        exchange = Exchange.COINBASE
+
+    if exchange not in (*CcxtExchange, Exchange.YFINANCE, Exchange.AKSHARE):
+        raise ValueError(f"Unsupported exchange: {exchange}")
+    return exchange
+
+def _create_adapter(exchange: str) -> BaseAdapter:
+    """Build a new adapter for a resolved exchange name."""
+    # Note: Imports are inside to avoid circular deps or heavy load if not needed
+    if exchange in CcxtExchange:
         from .adapters.ccxt_adapter import CCXTAdapter
-        # Default CCXT routing to Coinbase as per new requirement
-        exchange = Exchange.COINBASE if exchange == Exchange.CCXT else exchange
-        return CCXTAdapter(exchange_id=exchange), exchange
+        return CCXTAdapter(exchange_id=exchange)
     elif exchange == Exchange.YFINANCE:
         from .adapters.yfinance_adapter import YFinanceAdapter
-        return YFinanceAdapter(), exchange
+        return YFinanceAdapter()
     elif exchange == Exchange.AKSHARE:
         from .adapters.akshare_adapter import AKShareAdapter
-        return AKShareAdapter(), exchange
+        return AKShareAdapter()
+    raise ValueError(f"Unsupported exchange: {exchange}")
 
-    else:
-        raise ValueError(f"Unsupported exchange: {exchange}")
+def close_adapters() -> None:
+    """
+    Close and drop every pooled adapter. The next request builds fresh
+    instances, so this also serves as a reset (e.g. after fork or in tests).
+    """
+    with _ADAPTERS_LOCK:
+        adapters = list(_ADAPTERS.values())
+        _ADAPTERS.clear()
+    for adapter in adapters:
+        try:
+            adapter.close()
+        except Exception as e:
+            logger.warning(f"Failed to close adapter {adapter!r}: {e}")
+
+async def aclose_adapters() -> None:
+    """Async counterpart of `close_adapters`, also closing async sessions on the running loop."""
+    with _ADAPTERS_LOCK:
+        adapters = list(_ADAPTERS.values())
+        _ADAPTERS.clear()
+    for adapter in adapters:
+        try:
+            await adapter.aclose()
+            adapter.close()
+        except Exception as e:
+            logger.warning(f"Failed to close adapter {adapter!r}: {e}")
+
+def _resolve_window(
+    start_date: datetime | str | None,
+    end_date: datetime | str | None,
+    limit: int,
+    period: str,
+    now: datetime | None = None,
+) -> tuple[datetime, datetime]:
+    """Concrete [start, end] of a request, estimating the start from `limit` if omitted."""
+    end_dt = to_datetime(end_date) or now or datetime.now()
+    start_dt = to_datetime(start_date) or calculate_start_date(end_dt, limit, period)
+    return start_dt, end_dt
+
+def _fetch_via_store(
+    adapter: BaseAdapter,
+    store: KlineStore,
+    exchange_name: str,
+    symbol: str,
+    period: str,
+    start_date: datetime | str | None,
+    end_date: datetime | str | None,
+    limit: int,
+    columns: list[str] | None = None,
+) -> pl.DataFrame:
+    """
+    Serve a kline request from the local store, fetching only the time ranges
+    that have not been covered yet from the adapter.
+    """
+    now = datetime.now()
+    start_dt, end_dt = _resolve_window(start_date, end_date, limit, period, now)
+    start_ms = int(start_dt.timestamp() * 1000)
+    end_ms = int(end_dt.timestamp() * 1000)
+    period_ms = period_to_ms(period)
+    # The still-forming bar is never recorded as covered so it gets refreshed
+    closed_ms = int(now.timestamp() * 1000) - period_ms
+
+    with store.lock(exchange_name, symbol, period):
+        for gap_start, gap_end in store.missing_ranges(exchange_name, symbol, period, start_ms, end_ms):
+            logger.info(f"Store miss for {symbol} {period}: fetching [{gap_start}, {gap_end}]")
+            n_bars = (gap_end - gap_start) // period_ms + 1
+            fetched = adapter.get_kline(
+                symbol,
+                period,
+                datetime.fromtimestamp(gap_start / 1000),
+                datetime.fromtimestamp(gap_end / 1000),
+                n_bars,
+            )
+            # Trust an empty answer as "nothing there"; otherwise only claim
+            # coverage up to the last bar returned, in case the source truncated.
+            if fetched.is_empty():
+                covered_end = gap_end
+            else:
+                covered_end = min(gap_end, fetched[Columns.TIMESTAMP.value].max() + period_ms - 1)
+            covered_end = min(covered_end, closed_ms)
+            covered = (gap_start, covered_end) if covered_end >= gap_start else None
+            with span("store_write", exchange=exchange_name):
+                store.write(exchange_name, symbol, period, fetched, covered=covered)
+
+        with span("store_read", exchange=exchange_name):
+            df = store.read(exchange_name, symbol, period, start_ms, end_ms, columns)
+
+    if limit > 0:
+        df = df.tail(limit)
+    return df
 
 def pull_kline(
     ticker: str, 
@@ -47,7 +179,11 @@ def pull_kline(
     start_date: datetime | str | None = None, 
     end_date: datetime | str | None = None, 
     limit: int = 200,
-    exchange: str | None = None
+    exchange: str | None = None,
+    store: KlineStore | None = None,
+    derive_from: str | None = None,
+    lazy: bool = False,
+    cache: KlineCache | None = None
 ) -> KlineData:
     """
     Main entry point to pull kline data.
@@ -60,32 +196,501 @@ def pull_kline(
         end_date: End datetime object or string.
         limit: Max records.
         exchange: Optional exchange name.
+        store: Optional local KlineStore. When given, known ranges are served
+            from disk and only missing ranges are fetched from the source.
+        derive_from: Optional finer period (e.g. '1h' for a '4h' or '1d'
+            request). When given, `period` bars are aggregated locally from
+            `derive_from` bars (served from `store` when possible) instead of
+            being fetched natively. Buckets are UTC-aligned.
+        lazy: Return a `pl.LazyFrame` that fetches on `collect()`. Filters on
+            `Columns.TIMESTAMP` narrow the window requested from the source or
+            store (`limit` then applies to that narrowed window) and column
+            selections are pushed into store scans. Fetch errors surface when
+            collecting.
+        cache: Optional in-memory KlineCache. Repeated identical requests are
+            served from memory until their period-dependent TTL expires.
+            Not used for lazy requests.
 
     Returns:
-        KlineData: Object containing status, data (polars.DataFrame), and error message.
+        KlineData: Object containing status, data (polars.DataFrame, or
+        polars.LazyFrame when `lazy`), and error message.
     """
     logger.info(f"Pulling kline for {ticker} ({market_type}) exchange={exchange}")
     
     try:
         adapter, exchange_name = _get_adapter(market_type, exchange)
-        
-        # Convert standard ticker to exchange symbol
-        exchange_ticker = adapter.get_exchange_symbol(ticker, market_type)
-        
-        df = adapter.get_kline(exchange_ticker, period, start_date, end_date, limit)
-        
-        if df.is_empty():
-             logger.warning(f"No data returned for {ticker}")
-             return KlineData(status=Status.FAILED, error="No data returned", data=df)
+    except Exception as e:
+        logger.error(f"Failed to pull data: {e}")
+        return KlineData(status=Status.FAILED, error=str(e))
 
-        df = df.with_columns([
-            pl.lit(exchange_name).alias(Columns.EXCHANGE.value),
-            pl.lit(ticker).alias(Columns.SYMBOL.value)  # Ensure standard ticker is returned
-        ])
+    if lazy:
+        return _lazy_kline_data(
+            adapter, exchange_name, ticker, market_type, period, start_date, end_date, limit, store, derive_from
+        )
 
-        return KlineData(status=Status.OK, data=df)
+    return _pull_with_adapter(
+        adapter, exchange_name, ticker, market_type, period, start_date, end_date, limit, store, derive_from, cache
+    )
 
+def _pull_with_adapter(
+    adapter: BaseAdapter,
+    exchange_name: str,
+    ticker: str,
+    market_type: str,
+    period: str,
+    start_date: datetime | str | None,
+    end_date: datetime | str | None,
+    limit: int,
+    store: KlineStore | None,
+    derive_from: str | None = None,
+    cache: KlineCache | None = None,
+) -> KlineData:
+    """Run one kline request against an already resolved adapter."""
+    try:
+        with span("pull_kline", exchange=exchange_name):
+            return _pull_frame(adapter, exchange_name, ticker, market_type, period, start_date, end_date,
+                               limit, store, derive_from, cache)
     except Exception as e:
         logger.error(f"Failed to pull data: {e}")
         # Return empty dataframe on error for safety, or just default which is empty
         return KlineData(status=Status.FAILED, error=str(e))
+
+def _pull_frame(
+    adapter: BaseAdapter,
+    exchange_name: str,
+    ticker: str,
+    market_type: str,
+    period: str,
+    start_date: datetime | str | None,
+    end_date: datetime | str | None,
+    limit: int,
+    store: KlineStore | None,
+    derive_from: str | None,
+    cache: KlineCache | None,
+) -> KlineData:
+    # Convert standard ticker to exchange symbol
+    with span("resolve_symbol", exchange=exchange_name):
+        exchange_ticker = adapter.get_exchange_symbol(ticker, market_type)
+
+    key = _cache_key(exchange_name, exchange_ticker, period, start_date, end_date, limit, derive_from)
+    df = cache.get(key) if cache is not None else None
+    if df is None:
+        def fetch(bounds: tuple[int, int] | None) -> pl.DataFrame:
+            if bounds is None:
+                return _fetch_frame(adapter, store, exchange_name, exchange_ticker, period,
+                                    start_date, end_date, limit, derive_from)
+            start, end, n_bars = _range_request(bounds, period)
+            return _fetch_frame(adapter, store, exchange_name, exchange_ticker, period,
+                                start, end, n_bars, derive_from)
+
+        # Concurrent identical or overlapping requests share one fetch
+        series, exact = _flight_keys(key, store)
+        with span("fetch", exchange=exchange_name):
+            df = REQUEST_COALESCER.run(series, exact, _explicit_window(key), limit, fetch)
+        _count_fetched(df, exchange_name)
+        if cache is not None and not df.is_empty():
+            cache.put(key, df)
+    with span("standardize", exchange=exchange_name):
+        return _to_kline_data(df, ticker, exchange_name)
+
+def _count_fetched(df: pl.DataFrame, exchange_name: str) -> None:
+    count(ROWS_TOTAL, df.height, exchange=exchange_name)
+    count(BYTES_TOTAL, df.estimated_size(), exchange=exchange_name)
+
+def _cache_key(
+    exchange_name: str,
+    exchange_ticker: str,
+    period: str,
+    start_date: datetime | str | None,
+    end_date: datetime | str | None,
+    limit: int,
+    derive_from: str | None,
+) -> CacheKey:
+    """Normalized KlineCache key; equal requests with differently typed dates share a key."""
+    start_dt, end_dt = to_datetime(start_date), to_datetime(end_date)
+    return (
+        str(exchange_name),
+        exchange_ticker,
+        period,
+        int(start_dt.timestamp() * 1000) if start_dt else None,
+        int(end_dt.timestamp() * 1000) if end_dt else None,
+        limit,
+        derive_from,
+    )
+
+def _flight_keys(key: CacheKey, store: KlineStore | None) -> tuple[tuple, tuple]:
+    """Coalescer keys: the series (exchange, symbol, period, derive_from, store) and the exact request."""
+    store_root = str(store.root) if store is not None else None
+    exchange_name, exchange_ticker, period, _, _, _, derive_from = key
+    return (exchange_name, exchange_ticker, period, derive_from, store_root), (key, store_root)
+
+def _explicit_window(key: CacheKey) -> tuple[int, int] | None:
+    """The request's [start_ms, end_ms] if both ends were given, else None."""
+    start_ms, end_ms = key[3], key[4]
+    return (start_ms, end_ms) if start_ms is not None and end_ms is not None else None
+
+def _range_request(bounds: tuple[int, int], period: str) -> tuple[datetime, datetime, int]:
+    """Start, end and bar count for fetching every bar in an inclusive ms range."""
+    n_bars = (bounds[1] - bounds[0]) // period_to_ms(period) + 1
+    return datetime.fromtimestamp(bounds[0] / 1000), datetime.fromtimestamp(bounds[1] / 1000), n_bars
+
+def _fetch_frame(
+    adapter: BaseAdapter,
+    store: KlineStore | None,
+    exchange_name: str,
+    exchange_ticker: str,
+    period: str,
+    start_date: datetime | str | None,
+    end_date: datetime | str | None,
+    limit: int,
+    derive_from: str | None,
+    columns: list[str] | None = None,
+) -> pl.DataFrame:
+    """Fetch bars for an exchange symbol natively, from the store, or by resampling."""
+    if derive_from:
+        return _derive_kline(
+            adapter, store, exchange_name, exchange_ticker, period, derive_from, start_date, end_date, limit
+        )
+    if store is not None:
+        return _fetch_via_store(
+            adapter, store, exchange_name, exchange_ticker, period, start_date, end_date, limit, columns
+        )
+    return adapter.get_kline(exchange_ticker, period, start_date, end_date, limit)
+
+def _lazy_kline_data(
+    adapter: BaseAdapter,
+    exchange_name: str,
+    ticker: str,
+    market_type: str,
+    period: str,
+    start_date: datetime | str | None,
+    end_date: datetime | str | None,
+    limit: int,
+    store: KlineStore | None,
+    derive_from: str | None,
+) -> KlineData:
+    """Wrap a kline request in a LazyFrame that fetches on collect (see `pull_kline`)."""
+    from .adapters.normalize import KLINE_SCHEMA
+
+    start_dt, end_dt = _resolve_window(start_date, end_date, limit, period)
+    period_ms = period_to_ms(period)
+
+    def fetch(bounds: tuple[int, int] | None, columns: list[str] | None) -> pl.DataFrame:
+        exchange_ticker = adapter.get_exchange_symbol(ticker, market_type)
+        if bounds is None:
+            df = _fetch_frame(adapter, store, exchange_name, exchange_ticker, period,
+                              start_date, end_date, limit, derive_from, columns)
+        else:
+            # Fetch the whole narrowed window, then apply the limit locally
+            start, end, n_bars = _range_request(bounds, period)
+            df = _fetch_frame(adapter, store, exchange_name, exchange_ticker, period,
+                              start, end, n_bars, derive_from, columns)
+            if limit > 0:
+                df = df.tail(limit)
+        logger.info(f"Lazy kline for {ticker} materialized {len(df)} rows")
+        return _tag_frame(df, ticker, exchange_name)
+
+    schema = {**KLINE_SCHEMA, Columns.EXCHANGE.value: pl.String}
+    start_ms = int(start_dt.timestamp() * 1000)
+    end_ms = int(end_dt.timestamp() * 1000)
+    return KlineData(status=Status.OK, data=scan_klines(fetch, schema, start_ms, end_ms, period_ms))
+
+def _derive_kline(
+    adapter: BaseAdapter,
+    store: KlineStore | None,
+    exchange_name: str,
+    symbol: str,
+    period: str,
+    derive_from: str,
+    start_date: datetime | str | None,
+    end_date: datetime | str | None,
+    limit: int,
+) -> pl.DataFrame:
+    """Build `period` bars by resampling `derive_from` bars covering the same range."""
+    if not can_derive(derive_from, period):
+        raise ValueError(f"Cannot derive {period} bars from {derive_from} bars")
+
+    start_dt, end_dt = _resolve_window(start_date, end_date, limit, period)
+    # Start on a bucket boundary so the first bar is not partial
+    start_dt = bucket_start(start_dt, period)
+    n_bars = int((end_dt - start_dt).total_seconds() * 1000) // period_to_ms(derive_from) + 1
+
+    logger.info(f"Deriving {symbol} {period} from {derive_from} bars ({n_bars} source bars)")
+    if store is not None:
+        fine = _fetch_via_store(adapter, store, exchange_name, symbol, derive_from, start_dt, end_dt, 0)
+    else:
+        fine = adapter.get_kline(symbol, derive_from, start_dt, end_dt, n_bars)
+
+    with span("resample", exchange=exchange_name):
+        df = resample_kline(fine, period)
+    if limit > 0:
+        df = df.tail(limit)
+    return df
+
+def _to_kline_data(df: pl.DataFrame, ticker: str, exchange_name: str) -> KlineData:
+    """Wrap an adapter frame into KlineData, tagging exchange and standard ticker."""
+    if df.is_empty():
+         logger.warning(f"No data returned for {ticker}")
+         return KlineData(status=Status.FAILED, error="No data returned", data=df)
+
+    return KlineData(status=Status.OK, data=_tag_frame(df, ticker, exchange_name))
+
+def _tag_frame(df: pl.DataFrame, ticker: str, exchange_name: str) -> pl.DataFrame:
+    """Add the exchange column and the standard ticker as symbol."""
+    return df.with_columns([
+        pl.lit(exchange_name).alias(Columns.EXCHANGE.value),
+        pl.lit(ticker).alias(Columns.SYMBOL.value)  # Ensure standard ticker is returned
+    ])
+
+async def pull_kline_async(
+    ticker: str,
+    market_type: str,
+    period: str,
+    start_date: datetime | str | None = None,
+    end_date: datetime | str | None = None,
+    limit: int = 200,
+    exchange: str | None = None,
+    store: KlineStore | None = None,
+    derive_from: str | None = None,
+    cache: KlineCache | None = None
+) -> KlineData:
+    """
+    Async variant of `pull_kline`.
+
+    CCXT sources use ccxt.async_support natively; blocking sources (yfinance,
+    AKShare), store-backed and derived requests run on the shared bounded
+    executor.
+    Arguments and return value are the same as `pull_kline`. Async sessions
+    stay open for reuse; call `aclose_adapters()` before the loop shuts down.
+    """
+    logger.info(f"Pulling kline (async) for {ticker} ({market_type}) exchange={exchange}")
+
+    try:
+        adapter, exchange_name = _get_adapter(market_type, exchange)
+    except Exception as e:
+        logger.error(f"Failed to pull data: {e}")
+        return KlineData(status=Status.FAILED, error=str(e))
+
+    try:
+        if store is not None or derive_from:
+            # Store IO and sync source fetches for derivation are blocking
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                get_blocking_executor(),
+                partial(contextvars.copy_context().run, _pull_with_adapter, adapter, exchange_name, ticker, market_type,
+                        period, start_date, end_date, limit, store, derive_from, cache),
+            )
+
+        with span("pull_kline", exchange=exchange_name):
+            with span("resolve_symbol", exchange=exchange_name):
+                exchange_ticker = await adapter.get_exchange_symbol_async(ticker, market_type)
+            key = _cache_key(exchange_name, exchange_ticker, period, start_date, end_date, limit, derive_from)
+            df = cache.get(key) if cache is not None else None
+            if df is None:
+                async def fetch(bounds: tuple[int, int] | None) -> pl.DataFrame:
+                    if bounds is None:
+                        return await adapter.get_kline_async(exchange_ticker, period, start_date, end_date, limit)
+                    return await adapter.get_kline_async(exchange_ticker, period, *_range_request(bounds, period))
+
+                series, exact = _flight_keys(key, store)
+                with span("fetch", exchange=exchange_name):
+                    df = await REQUEST_COALESCER.arun(series, exact, _explicit_window(key), limit, fetch)
+                _count_fetched(df, exchange_name)
+                if cache is not None and not df.is_empty():
+                    cache.put(key, df)
+            with span("standardize", exchange=exchange_name):
+                return _to_kline_data(df, ticker, exchange_name)
+
+    except Exception as e:
+        logger.error(f"Failed to pull data: {e}")
+        return KlineData(status=Status.FAILED, error=str(e))
+
+def pull_klines(
+    tickers: Sequence[str | tuple[str, ...]],
+    market_type: str,
+    period: str,
+    start_date: datetime | str | None = None,
+    end_date: datetime | str | None = None,
+    limit: int = 200,
+    exchange: str | None = None,
+    store: KlineStore | None = None,
+    max_workers: dict[str, int] | None = None,
+    derive_from: str | None = None,
+    cache: KlineCache | None = None
+) -> BatchKlineData:
+    """
+    Pull kline data for many tickers concurrently.
+
+    Tickers are grouped by the source they resolve to and each group runs on
+    its own bounded thread pool, so a slow or strict source cannot starve the
+    others.
+
+    Args:
+        tickers: Standardized tickers. An item may also be a tuple
+            `(ticker, market_type)` or `(ticker, market_type, exchange)` to
+            override the defaults below for that ticker.
+        market_type: Default market type for plain ticker strings.
+        period: Time period (e.g., '1d', '1h').
+        start_date: Start datetime object or string.
+        end_date: End datetime object or string.
+        limit: Max records per ticker.
+        exchange: Default exchange name for plain ticker strings.
+        store: Optional local KlineStore (see `pull_kline`).
+        max_workers: Per-source concurrency caps overriding SOURCE_CONCURRENCY.
+        derive_from: Optional finer period to resample from (see `pull_kline`).
+        cache: Optional in-memory KlineCache (see `pull_kline`).
+
+    Returns:
+        BatchKlineData: Concatenated data for all successful tickers plus
+        per-ticker statuses and error messages.
+    """
+    caps = {**SOURCE_CONCURRENCY, **(max_workers or {})}
+    statuses: dict[str, Status] = {}
+    errors: dict[str, str] = {}
+
+    # 1. Resolve every ticker and group by source
+    groups: dict[str, tuple[BaseAdapter, list[tuple[str, str]]]] = {}
+    order: list[str] = []
+    for item in tickers:
+        ticker, mt, exch = item, market_type, exchange
+        if isinstance(item, tuple):
+            ticker, mt = item[0], item[1]
+            exch = item[2] if len(item) > 2 else exchange
+        if ticker in statuses:
+            continue
+        order.append(ticker)
+        try:
+            adapter, exchange_name = _get_adapter(mt, exch)
+        except Exception as e:
+            statuses[ticker] = Status.FAILED
+            errors[ticker] = str(e)
+            continue
+        statuses[ticker] = Status.FAILED
+        groups.setdefault(exchange_name, (adapter, []))[1].append((ticker, mt))
+
+    logger.info(f"Pulling klines for {len(order)} tickers across sources {list(groups)}")
+
+    # 2. Fan out, one bounded pool per source
+    results: dict[str, KlineData] = {}
+    with ExitStack() as stack:
+        futures = {}
+        for exchange_name, (adapter, items) in groups.items():
+            workers = max(1, min(caps.get(exchange_name, DEFAULT_CONCURRENCY), len(items)))
+            pool = stack.enter_context(
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"pull_klines-{exchange_name}")
+            )
+            for ticker, mt in items:
+                # Workers inherit the caller's scheduling priority
+                future = pool.submit(
+                    contextvars.copy_context().run,
+                    _pull_with_adapter, adapter, exchange_name, ticker, mt,
+                    period, start_date, end_date, limit, store, derive_from, cache
+                )
+                futures[future] = ticker
+
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    # 3. Assemble in input order
+    frames = []
+    for ticker in order:
+        res = results.get(ticker)
+        if res is None:
+            continue
+        statuses[ticker] = res.status
+        if res.status == Status.OK:
+            frames.append(res.data)
+        else:
+            errors[ticker] = res.error
+
+    data = pl.concat(frames, how="diagonal_relaxed") if frames else pl.DataFrame()
+    status = Status.OK if frames else Status.FAILED
+    return BatchKlineData(status=status, data=data, statuses=statuses, errors=errors)
+
+def update_kline(
+    ticker: str,
+    market_type: str,
+    period: str,
+    since_df: pl.DataFrame | None = None,
+    exchange: str | None = None,
+    store: KlineStore | None = None,
+    limit: int = 0
+) -> KlineUpdate:
+    """
+    Bring a known kline series up to date, fetching only bars after it.
+
+    The source is asked for bars from the last known timestamp onward. That
+    bar (possibly still forming when it was fetched) is replaced and newer
+    bars are appended.
+
+    Args:
+        ticker: Standardized ticker symbol.
+        market_type: 'crypto', 'stock', 'futures' (use MarketType enum).
+        period: Time period (e.g., '1d', '1h').
+        since_df: Bars already held by the caller (e.g. a previous
+            `pull_kline(...).data` or `update_kline(...).data`).
+        exchange: Optional exchange name.
+        store: Optional local KlineStore. Without `since_df`, the stored
+            series is the known data; the delta is written to the store
+            either way.
+        limit: Keep only the last `limit` bars in `data` (0 keeps all).
+            Also the size of the initial pull when nothing is known yet
+            (200 if 0).
+
+    Returns:
+        KlineUpdate: status, merged `data`, the `delta` and error message.
+    """
+    logger.info(f"Updating kline for {ticker} ({market_type}) exchange={exchange}")
+
+    try:
+        adapter, exchange_name = _get_adapter(market_type, exchange)
+        exchange_ticker = adapter.get_exchange_symbol(ticker, market_type)
+        ts = Columns.TIMESTAMP.value
+
+        if since_df is not None and not since_df.is_empty():
+            last_ts = since_df[ts].max()
+        elif since_df is None and store is not None:
+            last_ts = store.last_timestamp(exchange_name, exchange_ticker, period)
+        else:
+            last_ts = None
+
+        if last_ts is None:
+            # Nothing known yet: this is the initial pull
+            fetched = _fetch_frame(adapter, store, exchange_name, exchange_ticker, period,
+                                   None, None, limit or 200, None)
+        elif store is not None:
+            fetched = _fetch_via_store(adapter, store, exchange_name, exchange_ticker, period,
+                                       datetime.fromtimestamp(last_ts / 1000), None, 0)
+        else:
+            n_bars = (int(datetime.now().timestamp() * 1000) - last_ts) // period_to_ms(period) + 2
+            fetched = adapter.get_kline(exchange_ticker, period, datetime.fromtimestamp(last_ts / 1000), None, n_bars)
+
+        delta = fetched if last_ts is None or fetched.is_empty() else fetched.filter(pl.col(ts) >= last_ts)
+        if not delta.is_empty():
+            delta = _tag_frame(delta, ticker, exchange_name)
+
+        if since_df is not None:
+            known = since_df
+        elif store is not None and last_ts is not None:
+            # Only read back as much of the stored series as the caller keeps
+            start_ms = last_ts - limit * period_to_ms(period) if limit > 0 else None
+            known = _tag_frame(store.read(exchange_name, exchange_ticker, period, start_ms), ticker, exchange_name)
+        else:
+            known = pl.DataFrame()
+
+        frames = [f for f in (known, delta) if not f.is_empty()]
+        data = (
+            pl.concat(frames, how="diagonal_relaxed").unique(subset=[ts], keep="last").sort(ts)
+            if frames else pl.DataFrame()
+        )
+        if limit > 0:
+            data = data.tail(limit)
+
+        logger.info(f"Update for {ticker}: {len(delta)} bars from {last_ts}")
+        if data.is_empty():
+            return KlineUpdate(status=Status.FAILED, error="No data returned")
+        return KlineUpdate(status=Status.OK, data=data, delta=delta)
+
+    except Exception as e:
+        logger.error(f"Failed to update data: {e}")
+        return KlineUpdate(status=Status.FAILED, error=str(e))
@@ -0,0 +1,314 @@
+"""
+Multi-process bulk backfill.
+
+Normalizing large vendor responses is CPU-bound and holds the GIL, so
+`pull_klines` stops scaling past a few threads. `backfill` shards a universe
+of tickers by source and runs each source's shards on its own process pool.
+Every worker process keeps its own pooled adapters, requests in the backfill
+priority lane, and writes each ticker's bars straight to Parquet or Arrow IPC;
+only small status records travel back to the parent. The parent records
+finished tickers in a checkpoint manifest, so an interrupted run resumes where
+it stopped:
+
+    python -m unified_data.backfill universe.txt --market-type stock --period 1d \\
+        --start 2015-01-01 --end 2024-12-31 --out data/backfill
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote
+
+from .api import DEFAULT_CONCURRENCY, SOURCE_CONCURRENCY, _get_adapter, _pull_with_adapter, _resolve_exchange
+from .models.enums import Exchange, Priority, Status
+from .models.types import BackfillReport
+from .scheduler import SourceLimit, get_scheduler, request_priority
+from .utils import atomic_write, get_logger, to_datetime
+
+logger = get_logger("backfill")
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+# Output format -> file suffix
+FORMATS = {"parquet": ".parquet", "ipc": ".arrow"}
+# Tickers per task; also the checkpoint granularity
+DEFAULT_SHARD_SIZE = 16
+
+
+def load_universe(path: str | os.PathLike) -> list[str | tuple[str, ...]]:
+    """
+    Read a universe file: one `ticker[,market_type[,exchange]]` per line.
+
+    Blank lines, `#` comments and a leading `ticker,...` header are ignored.
+    Omitted fields fall back to the defaults passed to `backfill`.
+    """
+    items: list[str | tuple[str, ...]] = []
+    for line in Path(path).expanduser().read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        fields = [f.strip() for f in line.split(",")]
+        if not items and fields[0].lower() == "ticker":
+            continue
+        while fields and not fields[-1]:
+            fields.pop()
+        items.append(fields[0] if len(fields) == 1 else tuple(f or None for f in fields))
+    return items
+
+
+def output_path(out_dir: str | os.PathLike, exchange: str, ticker: str, period: str, fmt: str = "parquet") -> Path:
+    """Where `backfill` writes one ticker's bars."""
+    # Tickers such as 'BTC/USDT' or 'GC=F' are not path-safe
+    name = quote(ticker, safe="") + FORMATS[fmt]
+    return Path(out_dir).expanduser() / quote(exchange, safe="") / quote(period, safe="") / name
+
+
+def backfill(
+    universe: str | os.PathLike | Sequence[str | tuple[str, ...]],
+    market_type: str,
+    period: str,
+    start_date: datetime | str,
+    end_date: datetime | str,
+    out_dir: str | os.PathLike,
+    exchange: str | None = None,
+    processes: dict[str, int] | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    fmt: str = "parquet",
+    resume: bool = True,
+    mp_context: str = "spawn",
+    worker_init: Callable[[], None] | None = None,
+) -> BackfillReport:
+    """
+    Download full history for a universe of tickers into `out_dir`.
+
+    Args:
+        universe: Path to a universe file (see `load_universe`) or a sequence
+            of tickers in the `pull_klines` form.
+        market_type: Default market type for tickers that do not set one.
+        period: Time period (e.g., '1d', '1h').
+        start_date: Start datetime object or string.
+        end_date: End datetime object or string.
+        out_dir: Output root; bars go to `<out_dir>/<exchange>/<period>/`
+            and the checkpoint manifest to `<out_dir>/manifest.json`.
+        exchange: Default exchange for tickers that do not set one.
+        processes: Per-source worker process caps overriding
+            SOURCE_CONCURRENCY. Each process gets an equal share of the
+            source's rate limit, so the source's total budget is unchanged.
+        shard_size: Tickers per worker task.
+        fmt: 'parquet' or 'ipc' (Arrow IPC / Feather v2).
+        resume: Skip tickers the manifest already records as done. When
+            False the manifest is started afresh.
+        mp_context: multiprocessing start method for the worker pools.
+        worker_init: Optional picklable callable run once in every worker
+            process after start-up (e.g. to configure the scheduler).
+
+    Returns:
+        BackfillReport: Per-ticker statuses, errors and output files.
+
+    Raises:
+        ValueError: If `fmt` is unknown, or the existing manifest was written
+            for a different period, date range or format.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported backfill format: {fmt} (expected one of {list(FORMATS)})")
+    out = Path(out_dir).expanduser()
+    out.mkdir(parents=True, exist_ok=True)
+    run = {
+        "period": period,
+        "start": to_datetime(start_date).isoformat(),
+        "end": to_datetime(end_date).isoformat(),
+        "format": fmt,
+    }
+    manifest_path = out / MANIFEST_FILE
+    manifest = _load_manifest(manifest_path, run, resume)
+    if isinstance(universe, (str, os.PathLike)):
+        universe = load_universe(universe)
+
+    # 1. Resolve every ticker and group the pending ones by source
+    report = BackfillReport(status=Status.FAILED)
+    groups: dict[str, list[tuple[str, str]]] = {}
+    for item in universe:
+        ticker, mt, exch = item, market_type, exchange
+        if isinstance(item, tuple):
+            ticker, mt = item[0], item[1] or market_type
+            exch = (item[2] if len(item) > 2 else None) or exchange
+        if ticker in report.statuses:
+            continue
+        done = manifest["tickers"].get(ticker)
+        if done is not None and done["status"] == Status.OK:
+            report.statuses[ticker] = Status.OK
+            report.files[ticker] = str(out / done["path"])
+            report.skipped.append(ticker)
+            continue
+        try:
+            exchange_name = _resolve_exchange(mt, exch)
+        except Exception as e:
+            report.statuses[ticker] = Status.FAILED
+            report.errors[ticker] = str(e)
+            continue
+        report.statuses[ticker] = Status.FAILED
+        groups.setdefault(exchange_name, []).append((ticker, mt))
+
+    pending = sum(len(items) for items in groups.values())
+    logger.info(
+        f"Backfilling {pending} tickers across sources {list(groups)} "
+        f"({len(report.skipped)} already done)"
+    )
+
+    # 2. One process pool per source, each worker holding a share of its rate limit
+    caps = {**SOURCE_CONCURRENCY, **(processes or {})}
+    context = multiprocessing.get_context(mp_context)
+    scheduler = get_scheduler()
+    with ExitStack() as stack:
+        futures = {}
+        for exchange_name, items in groups.items():
+            shards = [items[i:i + shard_size] for i in range(0, len(items), shard_size)]
+            workers = max(1, min(caps.get(exchange_name, DEFAULT_CONCURRENCY), len(shards), os.cpu_count() or 1))
+            limit = scheduler.limit(exchange_name)
+            share = SourceLimit(rate=limit.rate / workers, burst=max(1.0, limit.burst / workers))
+            pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(exchange_name, share, worker_init)
+            ))
+            for shard in shards:
+                future = pool.submit(_run_shard, exchange_name, shard, period, run["start"], run["end"], str(out), fmt)
+                futures[future] = shard
+
+        # 3. Checkpoint after every finished shard
+        for future in as_completed(futures):
+            try:
+                records = future.result()
+            except Exception as e:
+                logger.error(f"Backfill shard failed: {e!r}")
+                records = [_record(ticker, Status.FAILED, error=repr(e)) for ticker, _ in futures[future]]
+            for rec in records:
+                ticker = rec["ticker"]
+                manifest["tickers"][ticker] = {k: v for k, v in rec.items() if k != "ticker"}
+                report.statuses[ticker] = Status(rec["status"])
+                if rec["path"]:
+                    report.files[ticker] = str(out / rec["path"])
+                if rec["error"]:
+                    report.errors[ticker] = rec["error"]
+            _save_manifest(manifest_path, manifest)
+
+    if Status.OK in report.statuses.values():
+        report.status = Status.OK
+    return report
+
+
+def _init_worker(source: str, limit: SourceLimit, worker_init: Callable[[], None] | None) -> None:
+    # A fresh process has the default scheduler; apply this worker's share
+    get_scheduler().configure(source, limit.rate, limit.burst)
+    if worker_init is not None:
+        worker_init()
+
+
+def _run_shard(
+    exchange_name: str,
+    items: list[tuple[str, str]],
+    period: str,
+    start: str,
+    end: str,
+    out_dir: str,
+    fmt: str,
+) -> list[dict]:
+    """Worker entry point: fetch and write one shard, returning status records only."""
+    records = []
+    with request_priority(Priority.BACKFILL):
+        for ticker, market_type in items:
+            records.append(_backfill_one(exchange_name, ticker, market_type, period, start, end, out_dir, fmt))
+    return records
+
+
+def _backfill_one(
+    exchange_name: str,
+    ticker: str,
+    market_type: str,
+    period: str,
+    start: str,
+    end: str,
+    out_dir: str,
+    fmt: str,
+) -> dict:
+    try:
+        adapter, _ = _get_adapter(market_type, exchange_name)
+    except Exception as e:
+        return _record(ticker, Status.FAILED, error=str(e))
+
+    # limit=0: the whole [start, end] range, not just its tail
+    res = _pull_with_adapter(adapter, exchange_name, ticker, market_type, period, start, end, 0, None)
+    if res.status != Status.OK:
+        return _record(ticker, Status.FAILED, error=res.error)
+
+    path = output_path(out_dir, exchange_name, ticker, period, fmt)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        atomic_write(path, res.data.write_parquet if fmt == "parquet" else res.data.write_ipc)
+    except Exception as e:
+        return _record(ticker, Status.FAILED, error=f"Failed to write {path}: {e}")
+    return _record(ticker, Status.OK, rows=res.data.height, path=path.relative_to(out_dir).as_posix())
+
+
+def _record(ticker: str, status: Status, rows: int = 0, path: str | None = None, error: str = "") -> dict:
+    return {"ticker": ticker, "status": status.value, "rows": rows, "path": path, "error": error}
+
+
+def _load_manifest(path: Path, run: dict, resume: bool) -> dict:
+    fresh = {"version": MANIFEST_VERSION, "run": run, "tickers": {}}
+    if not resume or not path.exists():
+        return fresh
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable backfill manifest {path}: {e}")
+        return fresh
+    if manifest.get("run") != run:
+        raise ValueError(
+            f"{path} belongs to a different backfill ({manifest.get('run')}); "
+            f"use another output directory or resume=False"
+        )
+    return manifest
+
+
+def _save_manifest(path: Path, manifest: dict) -> None:
+    payload = json.dumps(manifest, indent=2).encode()
+    atomic_write(path, lambda f: f.write(payload))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk-download kline history for a universe of tickers")
+    parser.add_argument("universe", type=Path, help="File with one ticker[,market_type[,exchange]] per line")
+    parser.add_argument("--market-type", required=True, help="Default market type (crypto, stock, futures)")
+    parser.add_argument("--exchange", help="Default exchange")
+    parser.add_argument("--period", default="1d")
+    parser.add_argument("--start", required=True, help="Start date, e.g. 2015-01-01")
+    parser.add_argument("--end", required=True, help="End date, e.g. 2024-12-31")
+    parser.add_argument("--out", type=Path, required=True, help="Output directory")
+    parser.add_argument("--format", choices=list(FORMATS), default="parquet")
+    parser.add_argument("--processes", type=int, help="Worker processes per source (default: SOURCE_CONCURRENCY)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint manifest and start over")
+    args = parser.parse_args(argv)
+
+    processes = None
+    if args.processes:
+        processes = {source: args.processes for source in Exchange}
+    report = backfill(
+        args.universe, args.market_type, args.period, args.start, args.end, args.out,
+        exchange=args.exchange, processes=processes, shard_size=args.shard_size, fmt=args.format,
+        resume=not args.restart,
+    )
+    ok = sum(status == Status.OK for status in report.statuses.values())
+    print(f"{ok}/{len(report.statuses)} tickers done ({len(report.skipped)} from checkpoint), output in {args.out}")
+    for ticker, error in report.errors.items():
+        print(f"  {ticker}: {error}")
+    return 0 if ok == len(report.statuses) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+import math
+from array import array
+from collections.abc import Iterable
+
+import numpy as np
+import polars as pl
+
+from .adapters.normalize import KLINE_SCHEMA
+from .models.enums import Columns
+from .models.types import Tick
+from .resample import _calendar_unit
+from .utils import get_logger, period_to_ms
+
+logger = get_logger("bar_builder")
+
+_NO_TS = -(2**63)
+
+BAR_SCHEMA: dict[str, pl.DataType] = {**KLINE_SCHEMA, Columns.EXCHANGE.value: pl.String}
+
+
+class BarBuilder:
+    """
+    Incremental OHLCV aggregator that turns streaming ticks into `period` bars.
+
+    Buckets are UTC-aligned and labelled by their start, like adapter and
+    `resample_kline` output. State is array-backed: every symbol owns a row
+    with two bar slots (consecutive buckets alternate between them), so at
+    most the forming bar and the previous one, still inside its grace
+    window, are open per symbol.
+
+    A bar closes once a tick at or after `bar end + grace_ms` arrives for its
+    symbol, or when `advance(now_ms)` passes that point (one vectorized pass
+    over every symbol). Late ticks for a still-open bar update it in
+    timestamp order; ticks for an already closed bar are dropped and counted
+    in `late_dropped`. Closed bars are collected until `drain()`.
+
+    With `cumulative_volume=True`, tick volumes are running totals (as in
+    TqSdk quotes) and each bar gets the increase over its ticks.
+    """
+
+    def __init__(
+        self,
+        period: str,
+        grace_ms: int = 0,
+        cumulative_volume: bool = False,
+        exchange: str | None = None,
+    ):
+        if _calendar_unit(period) is not None:
+            raise ValueError(f"Cannot build calendar period {period} from ticks; build '1d' bars and resample them")
+        self.period = period
+        self.period_ms = period_to_ms(period)
+        if not 0 <= grace_ms < self.period_ms:
+            raise ValueError(f"grace_ms must be in [0, {self.period_ms}) for period {period}")
+        self.grace_ms = grace_ms
+        self.cumulative_volume = cumulative_volume
+        self.exchange = exchange
+        self.late_dropped = 0
+
+        self._index: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._exchanges: list[str | None] = []
+        # Flat typed arrays; slot s of symbol row i lives at 2 * i + s
+        self._start = array("q")
+        self._first_ts = array("q")
+        self._last_ts = array("q")
+        self._open = array("d")
+        self._high = array("d")
+        self._low = array("d")
+        self._close = array("d")
+        self._vol = array("d")
+        # Per row: latest tick time seen, end of the last closed bar, last running volume
+        self._watermark = array("q")
+        self._closed_until = array("q")
+        self._last_cum = array("d")
+
+        self._out_ts: list[int] = []
+        self._out_values: list[tuple[float, float, float, float, float]] = []
+        self._out_rows: list[int] = []
+
+    def _row(self, symbol: str, exchange: str | None) -> int:
+        i = len(self._symbols)
+        self._index[symbol] = i
+        self._symbols.append(symbol)
+        self._exchanges.append(exchange or self.exchange)
+        for column, fill in (
+            (self._start, -1), (self._first_ts, 0), (self._last_ts, 0), (self._open, 0.0),
+            (self._high, 0.0), (self._low, 0.0), (self._close, 0.0), (self._vol, 0.0),
+        ):
+            column.extend((fill, fill))
+        self._watermark.append(_NO_TS)
+        self._closed_until.append(_NO_TS)
+        self._last_cum.append(math.nan)
+        return i
+
+    @property
+    def symbols(self) -> int:
+        return len(self._symbols)
+
+    def add(self, symbol: str, ts: int, price: float, volume: float = 0.0, exchange: str | None = None) -> None:
+        """Fold one tick (`ts` in ms since epoch) into its symbol's bars."""
+        if price is None or price != price:
+            return
+        i = self._index.get(symbol)
+        if i is None:
+            i = self._row(symbol, exchange)
+        if ts > self._watermark[i]:
+            self._watermark[i] = ts
+            self._close_due(i, ts)
+
+        if volume is None or volume != volume:
+            volume = 0.0
+        elif self.cumulative_volume:
+            prev = self._last_cum[i]
+            self._last_cum[i] = volume
+            # A drop in the running total means the session reset
+            volume = 0.0 if prev != prev else (volume - prev if volume >= prev else volume)
+
+        period_ms = self.period_ms
+        bucket = ts - ts % period_ms
+        if bucket < self._closed_until[i]:
+            self.late_dropped += 1
+            return
+
+        k = 2 * i + (bucket // period_ms) % 2
+        if self._start[k] != bucket:
+            self._start[k] = bucket
+            self._first_ts[k] = self._last_ts[k] = ts
+            self._open[k] = self._high[k] = self._low[k] = self._close[k] = price
+            self._vol[k] = volume
+            return
+        if price > self._high[k]:
+            self._high[k] = price
+        elif price < self._low[k]:
+            self._low[k] = price
+        if ts >= self._last_ts[k]:
+            self._last_ts[k] = ts
+            self._close[k] = price
+        elif ts < self._first_ts[k]:
+            self._first_ts[k] = ts
+            self._open[k] = price
+        self._vol[k] += volume
+
+    def add_ticks(self, ticks: Iterable[Tick]) -> None:
+        """Fold a batch of `Tick`s; usable directly as a `sub_live_price` callback."""
+        add = self.add
+        for tick in ticks:
+            add(tick.symbol, tick.ts, tick.price, tick.volume, tick.exchange)
+
+    def advance(self, now_ms: int) -> int:
+        """Close every bar whose grace window ended by `now_ms`; returns how many closed."""
+        if not self._symbols:
+            return 0
+        # Zero-copy views over the slot arrays for one vectorized pass
+        start = np.frombuffer(self._start, dtype=np.int64)
+        due = np.nonzero((start >= 0) & (start <= now_ms - self.period_ms - self.grace_ms))[0]
+        if not len(due):
+            return 0
+        due = due[np.argsort(start[due], kind="stable")]
+        starts = start[due]
+        values = np.column_stack([
+            np.frombuffer(column, dtype=np.float64)[due]
+            for column in (self._open, self._high, self._low, self._close, self._vol)
+        ])
+        rows = due // 2
+
+        self._out_ts.extend(starts.tolist())
+        self._out_values.extend(map(tuple, values.tolist()))
+        self._out_rows.extend(rows.tolist())
+        closed_until = np.frombuffer(self._closed_until, dtype=np.int64)
+        np.maximum.at(closed_until, rows, starts + self.period_ms)
+        start[due] = -1
+        del start, closed_until
+        return len(due)
+
+    def flush(self) -> int:
+        """Close every open bar, including forming ones (e.g. at shutdown)."""
+        return self.advance(np.iinfo(np.int64).max // 2)
+
+    def drain(self) -> pl.DataFrame:
+        """Closed bars since the last drain, sorted by symbol and time, in the standard schema."""
+        if not self._out_ts:
+            return pl.DataFrame(schema=BAR_SCHEMA)
+        values = np.asarray(self._out_values, dtype=np.float64)
+        rows = np.asarray(self._out_rows, dtype=np.int64)
+        symbols = pl.Series(self._symbols, dtype=pl.String)
+        exchanges = pl.Series(self._exchanges, dtype=pl.String)
+        df = pl.DataFrame({
+            Columns.TIMESTAMP.value: np.asarray(self._out_ts, dtype=np.int64),
+            Columns.OPEN.value: values[:, 0],
+            Columns.HIGH.value: values[:, 1],
+            Columns.LOW.value: values[:, 2],
+            Columns.CLOSE.value: values[:, 3],
+            Columns.VOLUME.value: values[:, 4],
+            Columns.SYMBOL.value: symbols.gather(rows),
+            Columns.EXCHANGE.value: exchanges.gather(rows),
+        })
+        self._out_ts, self._out_values, self._out_rows = [], [], []
+        return df.sort([Columns.SYMBOL.value, Columns.TIMESTAMP.value])
+
+    def _close_due(self, i: int, now_ms: int) -> None:
+        """Per-symbol counterpart of `advance`, driven by the symbol's own ticks."""
+        cutoff = now_ms - self.period_ms - self.grace_ms
+        start = self._start
+        k0, k1 = 2 * i, 2 * i + 1
+        for k in ((k0, k1) if start[k0] <= start[k1] else (k1, k0)):
+            bar_start = start[k]
+            if 0 <= bar_start <= cutoff:
+                self._out_ts.append(bar_start)
+                self._out_values.append((self._open[k], self._high[k], self._low[k], self._close[k], self._vol[k]))
+                self._out_rows.append(i)
+                if bar_start + self.period_ms > self._closed_until[i]:
+                    self._closed_until[i] = bar_start + self.period_ms
+                start[k] = -1
@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import polars as pl
+
+from .utils import get_logger, period_to_ms
+
+logger = get_logger("kline_cache")
+
+# (exchange, exchange symbol, period, start_ms, end_ms, limit, derive_from)
+CacheKey = tuple[str, str, str, int | None, int | None, int, str | None]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+
+@dataclass
+class _Entry:
+    df: pl.DataFrame
+    size: int
+    expires_at: float
+
+
+class KlineCache:
+    """
+    In-memory LRU cache of kline frames for hot, repeated requests.
+
+    Entries expire by period: requests that may include the still-forming
+    bar (no end date, or an end date within one period of now) live for a
+    small fraction of the period, while fully closed ranges live for
+    `closed_ttl`. The least recently used entries are evicted once the
+    frames' `estimated_size()` exceeds `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        live_ttl_fraction: float = 0.05,
+        max_live_ttl: float = 60.0,
+        closed_ttl: float = 24 * 3600.0,
+    ):
+        self.max_bytes = max_bytes
+        self.live_ttl_fraction = live_ttl_fraction
+        self.max_live_ttl = max_live_ttl
+        self.closed_ttl = closed_ttl
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def ttl(self, period: str, end_ms: int | None, now: float | None = None) -> float:
+        """Seconds a result for `period` bars ending at `end_ms` stays fresh."""
+        now = time.time() if now is None else now
+        period_ms = period_to_ms(period)
+        if end_ms is not None and end_ms + period_ms <= now * 1000:
+            return self.closed_ttl
+        return max(1.0, min(self.max_live_ttl, period_ms / 1000 * self.live_ttl_fraction))
+
+    def get(self, key: CacheKey) -> pl.DataFrame | None:
+        """Cached frame for `key`, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._drop(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.df
+
+    def put(self, key: CacheKey, df: pl.DataFrame) -> None:
+        """Cache `df` under `key`, evicting least recently used entries to fit the budget."""
+        size = df.estimated_size()
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {key}: {size} bytes exceeds the {self.max_bytes} byte budget")
+            return
+        expires_at = time.monotonic() + self.ttl(key[2], key[4])
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(df, size, expires_at)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Snapshot of hit/miss/eviction counters and current usage."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def _drop(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
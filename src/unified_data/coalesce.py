@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+import polars as pl
+
+from .models.enums import Columns
+from .utils import get_logger
+
+logger = get_logger("coalesce")
+
+# How long the first caller for a range waits for overlapping callers to join
+COALESCE_WINDOW_SECONDS = 0.005
+
+# fetch(None) runs the caller's own request; fetch((start_ms, end_ms)) fetches
+# every bar in the merged range
+RangeFetch = Callable[[tuple[int, int] | None], pl.DataFrame]
+AsyncRangeFetch = Callable[[tuple[int, int] | None], Awaitable[pl.DataFrame]]
+
+
+@dataclass(eq=False)
+class _Flight:
+    exact: Hashable
+    start_ms: int | None
+    end_ms: int | None
+    future: Future = field(default_factory=Future)
+    open: bool = True
+    merged: int = 0
+    range_mode: bool = False
+
+
+@dataclass(frozen=True)
+class _Ticket:
+    flight: _Flight
+    leader: bool
+
+
+class RequestCoalescer:
+    """
+    Single-flight registry for kline fetches.
+
+    Identical concurrent requests share one fetch and the same immutable
+    frame. Requests with an explicit [start, end] window are merged too:
+    while the first caller waits `window` seconds, overlapping callers widen
+    its range, and once it is in flight, callers whose window it contains
+    attach to it. Merged fetches request every bar of the union and each
+    caller gets its own slice (with `limit` applied as a tail).
+    """
+
+    def __init__(self, window: float = COALESCE_WINDOW_SECONDS):
+        self.window = window
+        self._flights: dict[Hashable, list[_Flight]] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def run(
+        self,
+        series: Hashable,
+        exact: Hashable,
+        window_ms: tuple[int, int] | None,
+        limit: int,
+        fetch: RangeFetch,
+    ) -> pl.DataFrame:
+        """Fetch through the registry (blocking)."""
+        ticket = self._join(series, exact, window_ms)
+        if not ticket.leader:
+            return self._slice(ticket.flight, ticket.flight.future.result(), window_ms, limit)
+
+        flight = ticket.flight
+        if window_ms is not None and self.window > 0:
+            time.sleep(self.window)
+        bounds = self._close(flight)
+        try:
+            df = fetch(bounds)
+        except BaseException as e:
+            self._finish(series, flight, error=e)
+            raise
+        self._finish(series, flight, result=df)
+        return self._slice(flight, df, window_ms, limit)
+
+    async def arun(
+        self,
+        series: Hashable,
+        exact: Hashable,
+        window_ms: tuple[int, int] | None,
+        limit: int,
+        fetch: AsyncRangeFetch,
+    ) -> pl.DataFrame:
+        """Async counterpart of `run`; shares flights with blocking callers."""
+        ticket = self._join(series, exact, window_ms)
+        if not ticket.leader:
+            df = await asyncio.wrap_future(ticket.flight.future)
+            return self._slice(ticket.flight, df, window_ms, limit)
+
+        flight = ticket.flight
+        if window_ms is not None and self.window > 0:
+            await asyncio.sleep(self.window)
+        bounds = self._close(flight)
+        try:
+            df = await fetch(bounds)
+        except BaseException as e:
+            self._finish(series, flight, error=e)
+            raise
+        self._finish(series, flight, result=df)
+        return self._slice(flight, df, window_ms, limit)
+
+    def _join(self, series: Hashable, exact: Hashable, window_ms: tuple[int, int] | None) -> _Ticket:
+        with self._lock:
+            flights = self._flights.setdefault(series, [])
+            for flight in flights:
+                if flight.exact == exact:
+                    self.coalesced += 1
+                    return _Ticket(flight, leader=False)
+            if window_ms is not None:
+                start, end = window_ms
+                for flight in flights:
+                    if flight.start_ms is None:
+                        continue
+                    if flight.open and start <= flight.end_ms and end >= flight.start_ms:
+                        flight.start_ms = min(flight.start_ms, start)
+                        flight.end_ms = max(flight.end_ms, end)
+                        flight.merged += 1
+                        self.coalesced += 1
+                        return _Ticket(flight, leader=False)
+                    if flight.range_mode and flight.start_ms <= start and end <= flight.end_ms:
+                        self.coalesced += 1
+                        return _Ticket(flight, leader=False)
+            flight = _Flight(exact, *(window_ms or (None, None)))
+            flights.append(flight)
+            return _Ticket(flight, leader=True)
+
+    def _close(self, flight: _Flight) -> tuple[int, int] | None:
+        """Stop merging into `flight`; return the merged range, or None to run the leader's own request."""
+        with self._lock:
+            flight.open = False
+            # Solo flights keep the caller's exact request semantics
+            flight.range_mode = flight.start_ms is not None and flight.merged > 0
+            if flight.range_mode:
+                logger.info(f"Coalesced {flight.merged + 1} overlapping requests into one fetch")
+                return flight.start_ms, flight.end_ms
+            return None
+
+    def _finish(
+        self, series: Hashable, flight: _Flight, result: pl.DataFrame | None = None, error: BaseException | None = None
+    ) -> None:
+        with self._lock:
+            flights = self._flights.get(series, [])
+            if flight in flights:
+                flights.remove(flight)
+            if not flights:
+                self._flights.pop(series, None)
+        if error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result(result)
+
+    @staticmethod
+    def _slice(flight: _Flight, df: pl.DataFrame, window_ms: tuple[int, int] | None, limit: int) -> pl.DataFrame:
+        if not flight.range_mode or window_ms is None or df.is_empty():
+            return df
+        df = df.filter(pl.col(Columns.TIMESTAMP.value).is_between(*window_ms))
+        return df.tail(limit) if limit > 0 else df
+
+
+REQUEST_COALESCER = RequestCoalescer()
@@ -0,0 +1,101 @@
+from collections.abc import Callable, Iterator
+
+import polars as pl
+from polars.io.plugins import register_io_source
+
+from .models.enums import Columns
+
+# Upper bound on the probe grid used to evaluate timestamp predicates
+PROBE_MAX_ROWS = 1_000_000
+
+# fetch(bounds, columns) -> frame; bounds is an inclusive (start_ms, end_ms)
+# window narrowed by the query's timestamp filters, or None if not narrowed
+KlineFetch = Callable[[tuple[int, int] | None, list[str] | None], pl.DataFrame]
+
+
+def conjuncts(predicate: pl.Expr) -> list[pl.Expr]:
+    """Split a predicate into its top-level AND-ed terms."""
+    children = predicate.meta.pop()
+    if len(children) == 2 and any(
+        (a & b).meta.eq(predicate) for a, b in (children, children[::-1])
+    ):
+        return [term for child in children for term in conjuncts(child)]
+    return [predicate]
+
+
+def timestamp_bounds(predicate: pl.Expr, start_ms: int, end_ms: int, step_ms: int) -> tuple[int, int] | None:
+    """
+    Narrow [start_ms, end_ms] to the part a predicate can select.
+
+    Only AND-ed terms that reference nothing but the timestamp column are
+    used. They are evaluated on a grid of bar boundaries (any expression
+    works, not just comparisons), and the result is widened by one step
+    because source bars need not sit on the grid. Returns None if no term
+    constrains the timestamp, and a range with start > end if none can match.
+    """
+    ts = Columns.TIMESTAMP.value
+    terms = [t for t in conjuncts(predicate) if set(t.meta.root_names()) == {ts}]
+    if not terms or end_ms < start_ms:
+        return None
+
+    step = max(step_ms, -(-(end_ms - start_ms) // PROBE_MAX_ROWS))
+    first = start_ms - start_ms % step
+    hits = (
+        pl.select(pl.int_range(first, end_ms + step, step, dtype=pl.Int64).alias(ts))
+        .filter(pl.all_horizontal(terms))
+        .select(pl.col(ts).min().alias("lo"), pl.col(ts).max().alias("hi"))
+        .row(0)
+    )
+    if hits[0] is None:
+        return end_ms + 1, end_ms
+    return max(start_ms, hits[0] - step + 1), min(end_ms, hits[1] + step - 1)
+
+
+def scan_klines(
+    fetch: KlineFetch,
+    schema: dict[str, pl.DataType],
+    start_ms: int,
+    end_ms: int,
+    step_ms: int,
+) -> pl.LazyFrame:
+    """
+    LazyFrame over a kline request that is only executed on `collect()`.
+
+    Timestamp filters in the query narrow the requested window before
+    `fetch` is called, and the selected columns are passed along so storage
+    scans can skip the rest. The full predicate and projection are then
+    applied to the fetched bars.
+    """
+    def source(
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,
+    ) -> Iterator[pl.DataFrame]:
+        bounds = None
+        if predicate is not None:
+            bounds = timestamp_bounds(predicate, start_ms, end_ms, step_ms)
+        if bounds is not None and bounds[0] > bounds[1]:
+            df = pl.DataFrame(schema=schema)
+        else:
+            needed = with_columns
+            if with_columns is not None and predicate is not None:
+                needed = list(dict.fromkeys([*with_columns, *predicate.meta.root_names()]))
+            df = fetch(bounds, needed)
+            if df.is_empty():
+                df = pl.DataFrame(schema=schema)
+            # Columns skipped by a projected storage read come back as nulls
+            df = df.select(
+                pl.col(name).cast(dtype) if name in df.columns else pl.lit(None, dtype=dtype).alias(name)
+                for name, dtype in schema.items()
+            )
+
+        if predicate is not None:
+            df = df.filter(predicate)
+        if with_columns is not None:
+            df = df.select(with_columns)
+        if n_rows is not None:
+            df = df.head(n_rows)
+        yield df
+
+    return register_io_source(source, schema=schema)
@@ -0,0 +1,203 @@
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+# Latency histogram bounds in seconds (Prometheus-style cumulative buckets)
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Metric names emitted by the library
+STAGE_SECONDS = "unified_data_stage_seconds"
+REQUESTS_TOTAL = "unified_data_requests_total"
+ERRORS_TOTAL = "unified_data_errors_total"
+RETRIES_TOTAL = "unified_data_retries_total"
+ROWS_TOTAL = "unified_data_rows_total"
+BYTES_TOTAL = "unified_data_bytes_total"
+
+_HELP = {
+    STAGE_SECONDS: "Wall time spent per pipeline stage.",
+    REQUESTS_TOTAL: "Outbound vendor requests.",
+    ERRORS_TOTAL: "Stages that raised.",
+    RETRIES_TOTAL: "Vendor requests retried after a transient error.",
+    ROWS_TOTAL: "Kline rows fetched from sources.",
+    BYTES_TOTAL: "Estimated in-memory size of fetched frames.",
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: Mapping[str, object]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class MetricsSink(ABC):
+    """Destination for timing observations and counters."""
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: Mapping[str, object]) -> None:
+        """Record one sample (e.g. a span duration in seconds)."""
+        pass
+
+    @abstractmethod
+    def increment(self, name: str, value: float, labels: Mapping[str, object]) -> None:
+        """Add `value` to a counter."""
+        pass
+
+
+class NullSink(MetricsSink):
+    """Discards everything (disables instrumentation)."""
+
+    def observe(self, name: str, value: float, labels: Mapping[str, object]) -> None:
+        pass
+
+    def increment(self, name: str, value: float, labels: Mapping[str, object]) -> None:
+        pass
+
+
+@dataclass
+class Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)  # per bucket, plus +Inf
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile by linear interpolation within its bucket."""
+        if not self.count:
+            return float("nan")
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+class InMemoryMetrics(MetricsSink):
+    """Thread-safe in-process histograms and counters with Prometheus text export."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: dict[tuple[str, Labels], Histogram] = {}
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, labels: Mapping[str, object]) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram(self.buckets)
+            hist.observe(value)
+
+    def increment(self, name: str, value: float, labels: Mapping[str, object]) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def histogram(self, name: str, **labels: object) -> Histogram | None:
+        """Histogram for an exact label set, or None if nothing was observed."""
+        with self._lock:
+            return self._histograms.get((name, _labels(labels)))
+
+    def counter(self, name: str, **labels: object) -> float:
+        """Counter value for an exact label set."""
+        with self._lock:
+            return self._counters.get((name, _labels(labels)), 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+        lines: list[str] = []
+        seen: set[str] = set()
+
+        def header(name: str, kind: str) -> None:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            header(name, "counter")
+            lines.append(f"{name}{_render(labels)} {_number(value)}")
+        for (name, labels), hist in histograms:
+            header(name, "histogram")
+            cumulative = 0
+            for bound, n in zip((*hist.buckets, float("inf")), hist.counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                lines.append(f"{name}_bucket{_render(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{_render(labels)} {_number(hist.sum)}")
+            lines.append(f"{name}_count{_render(labels)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _render(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+_sink: MetricsSink = InMemoryMetrics()
+
+
+def get_metrics_sink() -> MetricsSink:
+    """The process-wide sink that spans and counters report to."""
+    return _sink
+
+
+def set_metrics_sink(sink: MetricsSink) -> None:
+    """Replace the process-wide sink (e.g. with `NullSink()` or an exporter bridge)."""
+    global _sink
+    _sink = sink
+
+
+@contextmanager
+def span(stage: str, **labels: object) -> Iterator[None]:
+    """Time a pipeline stage into `unified_data_stage_seconds{stage=...}`; exceptions also count as errors."""
+    sink = _sink
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        sink.increment(ERRORS_TOTAL, 1, {"stage": stage, **labels})
+        raise
+    finally:
+        sink.observe(STAGE_SECONDS, time.perf_counter() - start, {"stage": stage, **labels})
+
+
+def count(name: str, value: float = 1, **labels: object) -> None:
+    """Add to a counter on the process-wide sink."""
+    _sink.increment(name, value, labels)
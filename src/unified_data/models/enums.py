@@ -44,3 +44,8 @@ class Market(StrEnum):
     HK = "HK"
     A_SHARE = "A-SHARE"
     UNKNOWN = "UNKNOWN"
+
+class Priority(StrEnum):
+    """Request scheduling lanes."""
+    INTERACTIVE = "interactive"
+    BACKFILL = "backfill"
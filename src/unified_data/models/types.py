@@ -5,5 +5,43 @@ from .enums import Status
 @dataclass
 class KlineData:
     status: Status
+    # A LazyFrame when requested with `pull_kline(..., lazy=True)`
+    data: pl.DataFrame | pl.LazyFrame = field(default_factory=pl.DataFrame)
+    error: str = ""
+
+@dataclass
+class BatchKlineData:
+    status: Status
+    data: pl.DataFrame = field(default_factory=pl.DataFrame)
+    statuses: dict[str, Status] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+@dataclass
+class KlineUpdate:
+    status: Status
+    # Known bars merged with the delta
     data: pl.DataFrame = field(default_factory=pl.DataFrame)
+    # Bars from the last known timestamp onward: the refreshed last bar plus new ones
+    delta: pl.DataFrame = field(default_factory=pl.DataFrame)
     error: str = ""
+
+@dataclass(frozen=True)
+class Tick:
+    """A live quote update delivered by `sub_live_price`."""
+    symbol: str
+    exchange: str
+    ts: int  # Exchange timestamp of the update, ms since epoch (UTC)
+    price: float
+    bid: float | None = None
+    ask: float | None = None
+    volume: float | None = None
+
+@dataclass
+class BackfillReport:
+    status: Status
+    statuses: dict[str, Status] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    # Output file per ticker that returned bars
+    files: dict[str, str] = field(default_factory=dict)
+    # Tickers already completed by an earlier run of the same checkpoint
+    skipped: list[str] = field(default_factory=list)
@@ -0,0 +1,98 @@
+import re
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+
+from .models.enums import Columns
+from .utils import period_to_ms
+
+_DAY_MS = 86_400_000
+
+
+def _calendar_unit(period: str) -> str | None:
+    """'w' or 'M' for calendar-aligned periods, None for fixed-length ones."""
+    match = re.fullmatch(r"(\d+)([a-zA-Z]+)", period)
+    if not match:
+        raise ValueError(f"Unsupported period for resampling: {period}")
+    unit = match.group(2)
+    if unit == "M" or unit.lower() in ("mo", "month"):
+        return "M"
+    if unit.lower() in ("w", "week"):
+        return "w"
+    return None
+
+
+def to_polars_every(period: str) -> str:
+    """Translate a standard period ('4h', '1w', '1M') into a polars duration string."""
+    value = int(re.match(r"\d+", period).group())
+    unit = _calendar_unit(period)
+    if unit == "M":
+        return f"{value}mo"
+    if unit == "w":
+        return f"{value}w"
+    return f"{period_to_ms(period)}ms"
+
+
+def can_derive(source_period: str, target_period: str) -> bool:
+    """
+    Whether `target_period` bars can be built exactly from `source_period` bars:
+    every target bucket boundary must also be a source bucket boundary.
+    """
+    source_ms = period_to_ms(source_period)
+    if _calendar_unit(source_period) is not None:
+        # Weeks and months do not nest into each other
+        return source_period == target_period
+    if _calendar_unit(target_period) is not None:
+        # Week and month buckets start at a UTC midnight
+        return _DAY_MS % source_ms == 0
+    return period_to_ms(target_period) % source_ms == 0
+
+
+def bucket_start(dt: datetime, period: str) -> datetime:
+    """Start of the (UTC-aligned) `period` bucket containing `dt`, in the same timezone style."""
+    ts_ms = int(dt.timestamp() * 1000)
+    unit = _calendar_unit(period)
+    if unit is None:
+        start_ms = ts_ms - ts_ms % period_to_ms(period)
+    else:
+        day = datetime.fromtimestamp(ts_ms // _DAY_MS * _DAY_MS / 1000, tz=timezone.utc)
+        day = day.replace(day=1) if unit == "M" else day - timedelta(days=day.weekday())
+        start_ms = int(day.timestamp() * 1000)
+    return datetime.fromtimestamp(start_ms / 1000, tz=dt.tzinfo)
+
+
+def resample_kline(df: pl.DataFrame, period: str) -> pl.DataFrame:
+    """
+    Aggregate finer kline bars into `period` bars.
+
+    Buckets are aligned in UTC (weeks start on Monday, months on the 1st) and
+    labelled by their start. OHLCV rules: first open, max high, min low, last
+    close, summed volume. Each symbol/exchange series is resampled separately.
+    """
+    if df.is_empty():
+        return df
+
+    ts = Columns.TIMESTAMP.value
+    keys = [c for c in (Columns.SYMBOL.value, Columns.EXCHANGE.value) if c in df.columns]
+    bucket = "_bucket"
+
+    rules = {
+        Columns.OPEN.value: pl.col(Columns.OPEN.value).first(),
+        Columns.HIGH.value: pl.col(Columns.HIGH.value).max(),
+        Columns.LOW.value: pl.col(Columns.LOW.value).min(),
+        Columns.CLOSE.value: pl.col(Columns.CLOSE.value).last(),
+        Columns.VOLUME.value: pl.col(Columns.VOLUME.value).sum(),
+    }
+    aggs = [expr for col, expr in rules.items() if col in df.columns]
+    output = {ts, *keys, *(col for col in rules if col in df.columns)}
+
+    return (
+        df.lazy()
+        .with_columns(pl.from_epoch(ts, time_unit="ms").alias(bucket))
+        .sort([*keys, ts])
+        .group_by_dynamic(bucket, every=to_polars_every(period), group_by=keys or None)
+        .agg(aggs)
+        .with_columns(pl.col(bucket).dt.epoch("ms").alias(ts))
+        .select([c for c in df.columns if c in output])
+        .collect()
+    )
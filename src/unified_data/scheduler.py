@@ -0,0 +1,250 @@
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from .metrics import REQUESTS_TOTAL, RETRIES_TOTAL, count, span
+from .models.enums import Exchange, Priority
+from .utils import get_logger
+
+logger = get_logger("scheduler")
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SourceLimit:
+    """Sustained request rate (per second) and burst size for one source."""
+    rate: float
+    burst: float
+
+
+# Conservative public-endpoint budgets; override with `get_scheduler().configure(...)`
+DEFAULT_LIMITS: dict[str, SourceLimit] = {
+    Exchange.BINANCE: SourceLimit(rate=10.0, burst=20.0),
+    Exchange.COINBASE: SourceLimit(rate=8.0, burst=10.0),
+    Exchange.YFINANCE: SourceLimit(rate=2.0, burst=5.0),
+    Exchange.AKSHARE: SourceLimit(rate=2.0, burst=4.0),
+}
+FALLBACK_LIMIT = SourceLimit(rate=5.0, burst=5.0)
+
+# Exception class names (anywhere in the MRO) that indicate a transient failure:
+# ccxt NetworkError covers RateLimitExceeded, DDoSProtection and RequestTimeout.
+_RETRYABLE_ERROR_NAMES = {"NetworkError", "YFRateLimitError", "ConnectionError", "Timeout", "TimeoutError"}
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "unified_data_priority", default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def request_priority(priority: Priority | str) -> Iterator[None]:
+    """Run the enclosed requests in the given priority lane (e.g. BACKFILL)."""
+    token = _priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether an exception from a vendor SDK looks transient (rate limit, network, 5xx)."""
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    if names & _RETRYABLE_ERROR_NAMES:
+        return True
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in _RETRYABLE_STATUS
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Callers hold no lock while waiting."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token if available and return 0, else return seconds until one is."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+class _SourceLimiter:
+    """Token bucket plus priority lanes: backfill waits while interactive callers are queued."""
+
+    def __init__(self, limit: SourceLimit):
+        self.bucket = TokenBucket(limit.rate, limit.burst)
+        self._cond = threading.Condition()
+        self._interactive_waiting = 0
+
+    def acquire(self, priority: Priority) -> None:
+        interactive = priority == Priority.INTERACTIVE
+        with self._cond:
+            if interactive:
+                self._interactive_waiting += 1
+            try:
+                while True:
+                    if not interactive and self._interactive_waiting:
+                        self._cond.wait(timeout=1 / self.bucket.rate)
+                        continue
+                    wait = self.bucket.try_acquire()
+                    if wait == 0:
+                        return
+                    self._cond.wait(timeout=wait)
+            finally:
+                if interactive:
+                    self._interactive_waiting -= 1
+                self._cond.notify_all()
+
+    async def acquire_async(self, priority: Priority) -> None:
+        interactive = priority == Priority.INTERACTIVE
+        if interactive:
+            with self._cond:
+                self._interactive_waiting += 1
+        try:
+            while True:
+                with self._cond:
+                    blocked = not interactive and self._interactive_waiting > 0
+                if blocked:
+                    await asyncio.sleep(1 / self.bucket.rate)
+                    continue
+                wait = self.bucket.try_acquire()
+                if wait == 0:
+                    return
+                await asyncio.sleep(wait)
+        finally:
+            if interactive:
+                with self._cond:
+                    self._interactive_waiting -= 1
+                    self._cond.notify_all()
+
+
+class RequestScheduler:
+    """
+    Central gate for outbound vendor requests.
+
+    Every adapter call goes through `call` / `acall` with its source name. The
+    scheduler rate-limits per source with a shared token bucket (so all threads
+    and adapter instances draw from one budget), serves the interactive lane
+    before the backfill lane, and retries transient errors with jittered
+    exponential backoff. Every attempt is counted and timed as the `network`
+    stage in `metrics`.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, SourceLimit] | None = None,
+        max_retries: int = 2,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ):
+        self._limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._limiters: dict[str, _SourceLimiter] = {}
+        self._lock = threading.Lock()
+        self.on_retry: Callable[[str, BaseException, int], None] | None = None
+
+    def configure(self, source: str, rate: float, burst: float | None = None) -> None:
+        """Set the rate limit for a source (takes effect for new requests)."""
+        with self._lock:
+            self._limits[source] = SourceLimit(rate=rate, burst=burst if burst is not None else rate)
+            self._limiters.pop(source, None)
+
+    def limit(self, source: str) -> SourceLimit:
+        """The rate limit currently configured for a source."""
+        with self._lock:
+            return self._limits.get(source, FALLBACK_LIMIT)
+
+    def _limiter(self, source: str) -> _SourceLimiter:
+        with self._lock:
+            limiter = self._limiters.get(source)
+            if limiter is None:
+                limiter = _SourceLimiter(self._limits.get(source, FALLBACK_LIMIT))
+                self._limiters[source] = limiter
+            return limiter
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def call(self, source: str, fn: Callable[..., T], *args: Any, priority: Priority | None = None, **kwargs: Any) -> T:
+        """Run a blocking vendor call under the source's rate limit, retrying transient errors."""
+        priority = priority or current_priority()
+        limiter = self._limiter(source)
+        attempt = 0
+        while True:
+            limiter.acquire(priority)
+            count(REQUESTS_TOTAL, exchange=source)
+            try:
+                with span("network", exchange=source):
+                    return fn(*args, **kwargs)
+            except Exception as e:
+                attempt += 1
+                if attempt > self.max_retries or not is_retryable(e):
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(f"{source} request failed ({e}); retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                self._notify_retry(source, e, attempt)
+                time.sleep(delay)
+
+    async def acall(
+        self, source: str, fn: Callable[..., Awaitable[T]], *args: Any, priority: Priority | None = None, **kwargs: Any
+    ) -> T:
+        """Async counterpart of `call` for coroutine functions."""
+        priority = priority or current_priority()
+        limiter = self._limiter(source)
+        attempt = 0
+        while True:
+            await limiter.acquire_async(priority)
+            count(REQUESTS_TOTAL, exchange=source)
+            try:
+                with span("network", exchange=source):
+                    return await fn(*args, **kwargs)
+            except Exception as e:
+                attempt += 1
+                if attempt > self.max_retries or not is_retryable(e):
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(f"{source} request failed ({e}); retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                self._notify_retry(source, e, attempt)
+                await asyncio.sleep(delay)
+
+    def _notify_retry(self, source: str, exc: BaseException, attempt: int) -> None:
+        count(RETRIES_TOTAL, exchange=source)
+        if self.on_retry is not None:
+            self.on_retry(source, exc, attempt)
+
+
+_scheduler = RequestScheduler()
+
+
+def get_scheduler() -> RequestScheduler:
+    """The process-wide scheduler used by all adapters."""
+    return _scheduler
+
+
+def set_scheduler(scheduler: RequestScheduler) -> None:
+    """Replace the process-wide scheduler (e.g. with custom limits)."""
+    global _scheduler
+    _scheduler = scheduler
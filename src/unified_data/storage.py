@@ -0,0 +1,161 @@
+import json
+import os
+import threading
+from pathlib import Path
+from urllib.parse import quote
+
+import polars as pl
+
+from .models.enums import Columns
+from .utils import get_logger, atomic_write
+
+logger = get_logger("kline_store")
+
+
+class KlineStore:
+    """
+    On-disk Parquet store for kline data, partitioned by exchange/symbol/period.
+
+    Each partition directory holds the bars (`data.parquet`) and a coverage
+    manifest (`coverage.json`) listing the millisecond ranges that have already
+    been fetched from the source. Coverage is tracked separately from the bars
+    because market closures mean "no rows" does not imply "not fetched".
+    Writes go to a temporary file that is atomically moved into place.
+    """
+
+    DATA_FILE = "data.parquet"
+    COVERAGE_FILE = "coverage.json"
+
+    def __init__(self, root: str | os.PathLike):
+        self.root = Path(root).expanduser()
+        self._locks: dict[tuple[str, str, str], threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+
+    def partition_path(self, exchange: str, symbol: str, period: str) -> Path:
+        """Directory holding one exchange/symbol/period series."""
+        # Symbols such as 'BTC/USDT' or 'GC=F' are not path-safe, quote every part
+        parts = [quote(str(p), safe="") for p in (exchange, symbol, period)]
+        return self.root.joinpath(*parts)
+
+    def lock(self, exchange: str, symbol: str, period: str) -> threading.RLock:
+        """Per-partition lock serializing read-fill-write cycles within the process."""
+        key = (str(exchange), str(symbol), str(period))
+        with self._locks_guard:
+            if key not in self._locks:
+                self._locks[key] = threading.RLock()
+            return self._locks[key]
+
+    def coverage(self, exchange: str, symbol: str, period: str) -> list[tuple[int, int]]:
+        """Sorted, merged list of inclusive [start_ms, end_ms] ranges already fetched."""
+        path = self.partition_path(exchange, symbol, period) / self.COVERAGE_FILE
+        if not path.exists():
+            return []
+        try:
+            ranges = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable coverage manifest {path}: {e}")
+            return []
+        return _merge_ranges([(int(s), int(e)) for s, e in ranges])
+
+    def missing_ranges(
+        self, exchange: str, symbol: str, period: str, start_ms: int, end_ms: int
+    ) -> list[tuple[int, int]]:
+        """Sub-ranges of [start_ms, end_ms] that are not covered yet."""
+        gaps = []
+        cursor = start_ms
+        for cov_start, cov_end in self.coverage(exchange, symbol, period):
+            if cov_end < cursor:
+                continue
+            if cov_start > end_ms:
+                break
+            if cov_start > cursor:
+                gaps.append((cursor, cov_start - 1))
+            cursor = max(cursor, cov_end + 1)
+            if cursor > end_ms:
+                break
+        if cursor <= end_ms:
+            gaps.append((cursor, end_ms))
+        return gaps
+
+    def scan(self, exchange: str, symbol: str, period: str) -> pl.LazyFrame | None:
+        """Lazy scan of a partition, or None if nothing has been stored yet."""
+        path = self.partition_path(exchange, symbol, period) / self.DATA_FILE
+        if not path.exists():
+            return None
+        return pl.scan_parquet(path)
+
+    def last_timestamp(self, exchange: str, symbol: str, period: str) -> int | None:
+        """Timestamp of the newest stored bar, or None if the partition is empty."""
+        lf = self.scan(exchange, symbol, period)
+        if lf is None:
+            return None
+        return lf.select(pl.col(Columns.TIMESTAMP.value).max()).collect().item()
+
+    def read(
+        self,
+        exchange: str,
+        symbol: str,
+        period: str,
+        start_ms: int | None = None,
+        end_ms: int | None = None,
+        columns: list[str] | None = None,
+    ) -> pl.DataFrame:
+        """
+        Read stored bars, optionally restricted to an inclusive ms range and a
+        subset of columns (the timestamp is always included).
+        """
+        lf = self.scan(exchange, symbol, period)
+        if lf is None:
+            return pl.DataFrame()
+        ts = pl.col(Columns.TIMESTAMP.value)
+        if start_ms is not None:
+            lf = lf.filter(ts >= start_ms)
+        if end_ms is not None:
+            lf = lf.filter(ts <= end_ms)
+        if columns is not None:
+            stored = lf.collect_schema().names()
+            keep = dict.fromkeys([Columns.TIMESTAMP.value, *columns])
+            lf = lf.select([c for c in keep if c in stored])
+        return lf.sort(Columns.TIMESTAMP.value).collect()
+
+    def write(
+        self,
+        exchange: str,
+        symbol: str,
+        period: str,
+        df: pl.DataFrame,
+        covered: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Merge `df` into the partition, deduplicating on the timestamp (new rows
+        win), and record `covered` as fetched.
+        """
+        with self.lock(exchange, symbol, period):
+            part = self.partition_path(exchange, symbol, period)
+            part.mkdir(parents=True, exist_ok=True)
+
+            if not df.is_empty():
+                existing = self.read(exchange, symbol, period)
+                frames = [existing, df] if not existing.is_empty() else [df]
+                merged = (
+                    pl.concat(frames, how="diagonal_relaxed")
+                    .unique(subset=[Columns.TIMESTAMP.value], keep="last", maintain_order=True)
+                    .sort(Columns.TIMESTAMP.value)
+                )
+                atomic_write(part / self.DATA_FILE, lambda f: merged.write_parquet(f))
+
+            if covered is not None:
+                ranges = _merge_ranges(self.coverage(exchange, symbol, period) + [covered])
+                payload = json.dumps(ranges).encode()
+                atomic_write(part / self.COVERAGE_FILE, lambda f: f.write(payload))
+
+
+def _merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or adjacent inclusive ranges."""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
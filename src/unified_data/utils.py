@@ -1,48 +1,70 @@
 import logging
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
 
-def calculate_start_date(end_date: datetime, limit: int, period: str) -> datetime:
+# Size of the shared pool that async callers use to offload blocking SDK calls
+BLOCKING_EXECUTOR_WORKERS = 16
+_blocking_executor: ThreadPoolExecutor | None = None
+_blocking_executor_lock = threading.Lock()
+
+def parse_period(period: str) -> tuple[timedelta, float]:
     """
-    Calculate an approximate start date based on end_date, limit and period.
-    Adds a buffer (2.0x for daily/weekly, 1.5x for intraday) to account for market closures.
+    Parse a period string (e.g. '1d', '4h', '15m', '1M') into the duration of
+    one candle and the market-closure buffer used when estimating windows.
+    Unknown formats fall back to one day.
     """
-    # Parse period, e.g., '1d', '1h', '15m'
     match = re.match(r"(\d+)([a-zA-Z]+)", period)
     if not match:
         # Fallback if period format is unexpected (e.g. 'daily' in akshare)
-        if period.lower() == 'daily':
-            return end_date - timedelta(days=limit * 2)
-        return end_date - timedelta(days=limit)
-    
+        return timedelta(days=1), 2.0
+
     value = int(match.group(1))
     raw_unit = match.group(2)
     unit = raw_unit.lower()
-    
+
     # Calculate duration per candle
     if raw_unit == 'M': # Capital M for Month per standard
-        delta = timedelta(days=value * 30)
-        buffer = 2.0
+        return timedelta(days=value * 30), 2.0
     elif unit in ('m', 'min'):
-        delta = timedelta(minutes=value)
-        buffer = 1.5
+        return timedelta(minutes=value), 1.5
     elif unit in ('h', 'hour'):
-        delta = timedelta(hours=value)
-        buffer = 1.5
+        return timedelta(hours=value), 1.5
     elif unit in ('d', 'day'):
-        delta = timedelta(days=value)
-        buffer = 2.0
+        return timedelta(days=value), 2.0
     elif unit in ('w', 'week'):
-        delta = timedelta(weeks=value)
-        buffer = 2.0
+        return timedelta(weeks=value), 2.0
     elif unit in ('mo', 'month'):
-        delta = timedelta(days=value * 30)
-        buffer = 2.0
-    else:
-        # Fallback
-        delta = timedelta(days=1)
-        buffer = 2.0
-        
+        return timedelta(days=value * 30), 2.0
+
+    # Fallback
+    return timedelta(days=1), 2.0
+
+def period_to_ms(period: str) -> int:
+    """Duration of one candle of `period` in milliseconds."""
+    delta, _ = parse_period(period)
+    return int(delta.total_seconds() * 1000)
+
+def to_datetime(value: datetime | str | None) -> datetime | None:
+    """Coerce an ISO string or datetime into a datetime (None passes through)."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+def calculate_start_date(end_date: datetime, limit: int, period: str) -> datetime:
+    """
+    Calculate an approximate start date based on end_date, limit and period.
+    Adds a buffer (2.0x for daily/weekly, 1.5x for intraday) to account for market closures.
+    """
+    if not re.match(r"(\d+)([a-zA-Z]+)", period) and period.lower() != 'daily':
+        return end_date - timedelta(days=limit)
+
+    delta, buffer = parse_period(period)
+
     # Total history needed
     total_delta = delta * limit * buffer
     return end_date - total_delta
@@ -56,3 +78,25 @@ def get_logger(name: str):
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
     return logger
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """Shared, bounded executor for running blocking vendor calls from asyncio code."""
+    global _blocking_executor
+    with _blocking_executor_lock:
+        if _blocking_executor is None:
+            _blocking_executor = ThreadPoolExecutor(
+                max_workers=BLOCKING_EXECUTOR_WORKERS, thread_name_prefix="unified_data-blocking"
+            )
+        return _blocking_executor
+
+def atomic_write(path: Path, writer) -> None:
+    """Write via a temp file in the same directory, then rename over `path`."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer(f)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
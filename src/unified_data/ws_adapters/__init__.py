@@ -0,0 +1,3 @@
+from .base import BaseStreamAdapter, Subscription
+
+__all__ = ["BaseStreamAdapter", "Subscription"]
@@ -0,0 +1,183 @@
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+
+from ..models.enums import MarketType
+from ..models.types import Tick
+from ..utils import get_logger
+
+logger = get_logger("ws_adapters")
+
+# Most ticks handed to one callback invocation
+DEFAULT_MAX_BATCH = 256
+# Ticks buffered per subscription while its callback is busy; the oldest are
+# dropped beyond this so a slow consumer never stalls the feed
+DEFAULT_MAX_PENDING = 1024
+
+TickCallback = Callable[[list[Tick]], Awaitable[None] | None]
+
+
+@dataclass(eq=False)
+class Subscription:
+    """Handle returned by `sub_live_price`; pass it to `unsubscribe`."""
+    ticker: str
+    symbol: str
+    exchange: str
+    callback: TickCallback = field(repr=False)
+    max_batch: int = DEFAULT_MAX_BATCH
+    max_pending: int = DEFAULT_MAX_PENDING
+    # Ticks discarded because the callback fell behind
+    dropped: int = 0
+    _pending: deque = field(init=False, repr=False)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _task: asyncio.Task | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self._pending = deque(maxlen=self.max_pending)
+
+    def _offer(self, tick: Tick) -> None:
+        if len(self._pending) == self.max_pending:
+            self.dropped += 1
+        self._pending.append(tick)
+        self._ready.set()
+
+    async def _deliver(self) -> None:
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self._pending:
+                n = min(self.max_batch, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(n)]
+                try:
+                    result = self.callback(batch)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"Live price callback for {self.ticker} failed: {e}")
+
+
+class BaseStreamAdapter(ABC):
+    """
+    Abstract base class for live quote streams.
+
+    One instance serves every subscription for its source over a single
+    connection: `_watch`/`_unwatch` add and remove symbols on that
+    connection, and `_run` pumps updates until `_running` is cleared,
+    handing them to `_publish`. Each subscription buffers its ticks in a
+    bounded queue and receives them in batches from its own task, so a slow
+    callback only loses its own oldest ticks.
+    """
+
+    exchange: str
+
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH, max_pending: int = DEFAULT_MAX_PENDING):
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self._subs: dict[str, list[Subscription]] = {}
+        self._running = False
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._running and self._task is not None and not self._task.done()
+
+    async def subscribe(
+        self,
+        ticker: str,
+        market_type: MarketType | str,
+        callback: TickCallback,
+        max_batch: int | None = None,
+        max_pending: int | None = None,
+    ) -> Subscription:
+        """Start streaming `ticker` to `callback`, connecting on first use."""
+        symbol = self.get_exchange_symbol(ticker, market_type)
+        if not self.running:
+            await self._start()
+            self._running = True
+            self._task = asyncio.create_task(self._pump())
+        if symbol not in self._subs:
+            await self._watch(symbol)
+            self._subs[symbol] = []
+        sub = Subscription(
+            ticker=ticker,
+            symbol=symbol,
+            exchange=self.exchange,
+            callback=callback,
+            max_batch=max_batch or self.max_batch,
+            max_pending=max_pending or self.max_pending,
+        )
+        sub._task = asyncio.create_task(sub._deliver())
+        self._subs[symbol].append(sub)
+        return sub
+
+    async def unsubscribe(self, sub: Subscription) -> None:
+        """Stop delivering to `sub`; the symbol is unwatched once nobody listens."""
+        subs = self._subs.get(sub.symbol, [])
+        if sub in subs:
+            subs.remove(sub)
+        if sub._task is not None:
+            sub._task.cancel()
+        if not subs and self._subs.pop(sub.symbol, None) is not None and self.running:
+            await self._unwatch(sub.symbol)
+
+    async def close(self) -> None:
+        """Stop the pump and every subscription, then release the connection."""
+        self._running = False
+        if self._task is not None and not self._task.done():
+            # Don't wait out a blocked receive; `_pump` still runs `_stop`
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def _publish(self, ticks: Sequence[Tick]) -> None:
+        """Fan ticks out to the subscriptions of their symbols (event loop thread only)."""
+        for tick in ticks:
+            for sub in self._subs.get(tick.symbol, ()):
+                sub._offer(tick)
+
+    async def _pump(self) -> None:
+        try:
+            await self._run()
+        except Exception as e:
+            logger.error(f"{self.exchange} live price stream stopped: {e}")
+        finally:
+            self._running = False
+            for subs in self._subs.values():
+                for sub in subs:
+                    if sub._task is not None:
+                        sub._task.cancel()
+            self._subs.clear()
+            try:
+                await self._stop()
+            except Exception as e:
+                logger.warning(f"Failed to close {self.exchange} stream: {e}")
+
+    @abstractmethod
+    def get_exchange_symbol(self, ticker: str, market_type: MarketType | str) -> str:
+        """Convert a standard ticker to the symbol the stream subscribes to."""
+        pass
+
+    @abstractmethod
+    async def _start(self) -> None:
+        """Open the connection."""
+        pass
+
+    @abstractmethod
+    async def _watch(self, symbol: str) -> None:
+        """Add `symbol` to the open connection."""
+        pass
+
+    async def _unwatch(self, symbol: str) -> None:
+        """Drop `symbol` from the open connection (no-op if the source cannot)."""
+        pass
+
+    @abstractmethod
+    async def _run(self) -> None:
+        """Receive updates and `_publish` them until `_running` is False."""
+        pass
+
+    async def _stop(self) -> None:
+        """Release the connection after `_run` returns."""
+        pass
@@ -0,0 +1,156 @@
+import asyncio
+import inspect
+import math
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from tqsdk import TqApi, TqAuth
+
+from .base import BaseStreamAdapter
+from ..models.enums import Exchange, MarketType
+from ..models.types import Tick
+from ..utils import get_logger
+
+logger = get_logger("tqsdk_stream")
+
+# Quote timestamps are exchange local time (China Standard Time)
+QUOTE_TZ = ZoneInfo("Asia/Shanghai")
+
+
+class _ApiThread:
+    """Runs every TqApi call on one daemon thread, in submission order (TqApi is not thread-safe)."""
+
+    def __init__(self):
+        self._calls: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._serve, name="unified_data-tqsdk", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args) -> Future:
+        future: Future = Future()
+        self._calls.put((future, fn, args))
+        return future
+
+    def stop(self) -> None:
+        self._calls.put(None)
+
+    def _serve(self) -> None:
+        while (item := self._calls.get()) is not None:
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+def _number(value: Any) -> float | None:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(value) else value
+
+
+class TqSdkStreamAdapter(BaseStreamAdapter):
+    """
+    Live futures quotes from TqSdk.
+
+    Every subscription shares one TqApi connection and one `wait_update`
+    loop: each round trip reports the quotes that changed (`is_changing`)
+    and they are published as one batch. `wait_update` blocks, so the api
+    lives on a dedicated thread and the event loop only awaits its results;
+    symbols are TqSdk instrument ids (e.g. "SHFE.rb2505") and are passed
+    through unchanged. Credentials default to the TQ_USER / TQ_PASSWORD
+    environment variables.
+    """
+
+    exchange = Exchange.TQSDK
+
+    def __init__(self, user: str | None = None, password: str | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.user = user or os.environ.get("TQ_USER")
+        self.password = password or os.environ.get("TQ_PASSWORD")
+        self._api = None
+        self._api_thread: _ApiThread | None = None
+        self._quotes: dict[str, Any] = {}
+
+    def get_exchange_symbol(self, ticker: str, market_type: MarketType | str) -> str:
+        return ticker
+
+    async def _call(self, fn, *args):
+        return await asyncio.wrap_future(self._api_thread.submit(fn, *args))
+
+    async def _start(self) -> None:
+        self._api_thread = _ApiThread()
+        self._quotes = {}
+        self._api = await self._call(self._connect)
+
+    def _connect(self):
+        auth = TqAuth(self.user, self.password) if self.user and self.password else None
+        return TqApi(auth=auth, disable_print=True)
+
+    async def _watch(self, symbol: str) -> None:
+        # Queued behind the running wait_update, which returns on the next update
+        await self._call(self._add_quote, symbol)
+
+    async def _unwatch(self, symbol: str) -> None:
+        await self._call(self._quotes.pop, symbol, None)
+
+    def _add_quote(self, symbol: str) -> None:
+        self._quotes[symbol] = self._api.get_quote(symbol)
+
+    async def _run(self) -> None:
+        while self._running:
+            pending, ticks = await self._call(self._step)
+            if pending is not None:
+                await pending
+                ticks = await self._call(self._collect)
+            if ticks:
+                self._publish(ticks)
+
+    async def _stop(self) -> None:
+        api, api_thread = self._api, self._api_thread
+        self._api = self._api_thread = None
+        if api_thread is None:
+            return
+        # Not awaited: a blocked wait_update must not hold up shutdown
+        if api is not None:
+            api_thread.submit(api.close)
+        api_thread.stop()
+
+    def _step(self) -> tuple[Any, list[Tick]]:
+        """One wait_update round on the api thread; an awaitable result is handed back to the loop."""
+        updated = self._api.wait_update()
+        if inspect.isawaitable(updated):
+            return updated, []
+        return None, self._collect() if updated else []
+
+    def _collect(self) -> list[Tick]:
+        ticks = []
+        for symbol, quote in self._quotes.items():
+            if self._api.is_changing(quote):
+                tick = self._to_tick(symbol, quote)
+                if tick is not None:
+                    ticks.append(tick)
+        return ticks
+
+    def _to_tick(self, symbol: str, quote: Any) -> Tick | None:
+        price = _number(quote.last_price)
+        if not quote.datetime or price is None:
+            return None
+        dt = datetime.strptime(quote.datetime, "%Y-%m-%d %H:%M:%S.%f").replace(tzinfo=QUOTE_TZ)
+        return Tick(
+            symbol=symbol,
+            exchange=self.exchange,
+            ts=int(dt.timestamp() * 1000),
+            price=price,
+            bid=_number(quote.bid_price1),
+            ask=_number(quote.ask_price1),
+            volume=_number(quote.volume),
+        )
@@ -0,0 +1,82 @@
+from .models.enums import MarketType, Exchange
+from .utils import get_logger
+from .ws_adapters.base import BaseStreamAdapter, Subscription, TickCallback
+
+logger = get_logger("ws_api")
+
+# Process-wide stream registry, keyed by exchange. One adapter (and so one
+# connection) serves every subscription for its source on the running loop.
+_ADAPTERS: dict[str, BaseStreamAdapter] = {}
+
+
+def _create_stream_adapter(exchange: str) -> BaseStreamAdapter:
+    """Build a new streaming adapter for an exchange."""
+    if exchange == Exchange.TQSDK:
+        from .ws_adapters.tqsdk_adapter import TqSdkStreamAdapter
+        return TqSdkStreamAdapter()
+    raise ValueError(f"Unsupported streaming exchange: {exchange}")
+
+
+def _get_stream_adapter(market_type: str, exchange: Exchange | str | None) -> BaseStreamAdapter:
+    if exchange is None:
+        if market_type == MarketType.FUTURES:
+            exchange = Exchange.TQSDK
+        else:
+            raise ValueError(f"No default live price source for market type: {market_type}")
+    exchange = Exchange(exchange)
+    adapter = _ADAPTERS.get(exchange)
+    if adapter is None or (adapter._task is not None and not adapter.running):
+        # First use, or the previous stream stopped
+        adapter = _create_stream_adapter(exchange)
+        _ADAPTERS[exchange] = adapter
+    return adapter
+
+
+async def sub_live_price(
+    ticker: str,
+    market_type: MarketType | str,
+    exchange: Exchange | str | None = None,
+    callback: TickCallback | None = None,
+    max_batch: int | None = None,
+    max_pending: int | None = None,
+) -> Subscription:
+    """
+    Stream live prices for a ticker.
+
+    Args:
+        ticker: Symbol understood by the streaming source (e.g. "SHFE.rb2505" for TqSdk).
+        market_type: Market type (futures streams default to TqSdk).
+        exchange: Streaming source; see `Exchange`.
+        callback: Called with a list of `Tick`s (sync or async). Ticks that
+            arrive while it runs are batched into the next call.
+        max_batch: Most ticks per callback invocation.
+        max_pending: Ticks buffered while the callback is busy; beyond this the
+            oldest are dropped and counted in `Subscription.dropped`.
+
+    Returns:
+        Subscription: Handle for `unsubscribe`.
+    """
+    if callback is None:
+        raise ValueError("callback is required")
+    adapter = _get_stream_adapter(market_type, exchange)
+    sub = await adapter.subscribe(ticker, market_type, callback, max_batch=max_batch, max_pending=max_pending)
+    logger.info(f"Subscribed to live prices for {ticker} on {adapter.exchange}")
+    return sub
+
+
+async def unsubscribe(sub: Subscription) -> None:
+    """Stop a subscription returned by `sub_live_price`."""
+    adapter = _ADAPTERS.get(sub.exchange)
+    if adapter is not None:
+        await adapter.unsubscribe(sub)
+
+
+async def close_streams() -> None:
+    """Stop every live stream and drop the adapters."""
+    adapters = list(_ADAPTERS.values())
+    _ADAPTERS.clear()
+    for adapter in adapters:
+        try:
+            await adapter.close()
+        except Exception as e:
+            logger.warning(f"Failed to close stream {adapter!r}: {e}")
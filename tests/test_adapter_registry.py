@@ -0,0 +1,75 @@
+import sys
+import os
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data import api
+from unified_data.api import _get_adapter, close_adapters
+from unified_data.adapters.ccxt_adapter import CCXTAdapter
+from unified_data.adapters.yfinance_adapter import YFinanceAdapter
+from unified_data.adapters.ccxt_strategies.binance import BinanceStrategy
+from unified_data.models.enums import MarketType, Exchange
+
+
+class TestAdapterRegistry(unittest.TestCase):
+
+    def setUp(self):
+        close_adapters()
+        self.addCleanup(close_adapters)
+
+    def test_adapters_are_reused(self):
+        first, name = _get_adapter(MarketType.CRYPTO, None)
+        second, _ = _get_adapter(MarketType.CRYPTO, Exchange.CCXT)
+        self.assertEqual(name, Exchange.COINBASE)
+        self.assertIs(first, second)
+        self.assertIs(first.strategy.get_exchange(), second.strategy.get_exchange())
+
+        stock, name = _get_adapter(MarketType.STOCK, None)
+        self.assertIsInstance(stock, YFinanceAdapter)
+        self.assertIs(stock, _get_adapter(MarketType.STOCK, Exchange.YFINANCE)[0])
+
+    def test_explicit_ccxt_exchange(self):
+        adapter, name = _get_adapter(MarketType.CRYPTO, Exchange.BINANCE)
+        self.assertEqual(name, Exchange.BINANCE)
+        self.assertIsInstance(adapter.strategy, BinanceStrategy)
+
+    def test_concurrent_lookup_builds_one_instance(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            adapters = list(pool.map(lambda _: _get_adapter(MarketType.CRYPTO, None)[0], range(32)))
+        self.assertEqual(len({id(a) for a in adapters}), 1)
+
+    def test_close_adapters_resets_registry(self):
+        adapter, _ = _get_adapter(MarketType.CRYPTO, Exchange.BINANCE)
+        with patch.object(adapter, "close") as mock_close:
+            close_adapters()
+        mock_close.assert_called_once()
+        self.assertEqual(api._ADAPTERS, {})
+        self.assertIsNot(_get_adapter(MarketType.CRYPTO, Exchange.BINANCE)[0], adapter)
+
+    def test_async_exchange_is_bound_per_loop(self):
+        adapter = CCXTAdapter("binance")
+        created = []
+
+        def make_exchange():
+            exchange = MagicMock()
+            created.append(exchange)
+            return exchange
+
+        async def get_twice():
+            return adapter.strategy.get_async_exchange(), adapter.strategy.get_async_exchange()
+
+        with patch.object(adapter.strategy, "_initialize_async_exchange", side_effect=make_exchange):
+            a, b = asyncio.run(get_twice())
+            c, _ = asyncio.run(get_twice())
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertEqual(len(created), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
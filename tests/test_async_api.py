@@ -0,0 +1,94 @@
+import sys
+import os
+import threading
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.api import pull_kline_async
+from unified_data.adapters.base import BaseAdapter
+from unified_data.adapters.ccxt_adapter import CCXTAdapter
+from unified_data.adapters.ccxt_strategies.coinbase import CoinbaseStrategy
+from unified_data.adapters.ccxt_strategies.markets import MARKETS_CACHE
+from unified_data.models.enums import MarketType, Exchange, Columns, Status
+
+OHLCV = [[1_700_000_000_000 + i * 60_000, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(3)]
+
+
+class BlockingAdapter(BaseAdapter):
+    """Sync-only adapter; the async default must offload it to the shared executor."""
+
+    def __init__(self):
+        self.thread_name = None
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        self.thread_name = threading.current_thread().name
+        return CCXTAdapter._to_frame(OHLCV, ticker)
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker.upper()
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestAsyncApi(unittest.IsolatedAsyncioTestCase):
+
+    def _async_exchange(self):
+        exchange = MagicMock()
+        exchange.fetch_ohlcv = AsyncMock(return_value=OHLCV)
+        exchange.close = AsyncMock()
+        return exchange
+
+    async def test_ccxt_native_async(self):
+        adapter = CCXTAdapter("binance")
+        exchange = self._async_exchange()
+        with patch.object(adapter.strategy, "_initialize_async_exchange", return_value=exchange):
+            df = await adapter.get_kline_async("BTC_USDT", "1m", limit=3)
+            await adapter.aclose()
+
+        exchange.fetch_ohlcv.assert_awaited_once_with("BTC/USDT", timeframe="1m", since=None, limit=3)
+        exchange.close.assert_awaited_once()
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df.schema[Columns.TIMESTAMP.value], pl.Int64)
+
+    async def test_coinbase_async_symbol_fallback(self):
+        MARKETS_CACHE.invalidate()
+        self.addCleanup(MARKETS_CACHE.invalidate)
+        strategy = CoinbaseStrategy()
+        exchange = self._async_exchange()
+        exchange.markets = {}
+
+        async def load_markets(reload=False):
+            exchange.markets = {"SOL/USD": {}}
+        exchange.load_markets = AsyncMock(side_effect=load_markets)
+
+        with patch.object(strategy, "_initialize_async_exchange", return_value=exchange):
+            self.assertEqual(await strategy.get_exchange_symbol_async("SOL_USDT", MarketType.CRYPTO), "SOL/USD")
+            self.assertEqual(await strategy.get_exchange_symbol_async("ETH_BTC", MarketType.CRYPTO), "ETH/BTC")
+        exchange.load_markets.assert_awaited_once()
+
+    async def test_blocking_adapter_is_offloaded(self):
+        adapter = BlockingAdapter()
+        df = await adapter.get_kline_async("AAPL", "1d", limit=3)
+        self.assertEqual(len(df), 3)
+        self.assertTrue(adapter.thread_name.startswith("unified_data-blocking"))
+
+    async def test_pull_kline_async(self):
+        adapter = BlockingAdapter()
+        with patch("unified_data.api._get_adapter", return_value=(adapter, Exchange.YFINANCE)):
+            res = await pull_kline_async("aapl", MarketType.STOCK, "1d", limit=3)
+        self.assertEqual(res.status, Status.OK)
+        self.assertEqual(res.data[Columns.SYMBOL.value][0], "aapl")
+        self.assertEqual(res.data[Columns.EXCHANGE.value][0], Exchange.YFINANCE)
+
+        res = await pull_kline_async("X", "UNKNOWN_TYPE", "1d")
+        self.assertEqual(res.status, Status.FAILED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import sys
+import os
+import json
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data import api
+from unified_data.adapters.base import BaseAdapter
+from unified_data.backfill import MANIFEST_FILE, backfill, load_universe, main, output_path
+from unified_data.models.enums import Columns, Exchange, MarketType, Status
+
+
+class OfflineAdapter(BaseAdapter):
+    """Serves two bars per ticker, tagging the volume with the serving process id."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        if ticker in self.fail:
+            raise RuntimeError(f"no data for {ticker}")
+        return pl.DataFrame({
+            Columns.TIMESTAMP.value: [1_700_000_000_000, 1_700_086_400_000],
+            Columns.OPEN.value: [1.0, 2.0],
+            Columns.HIGH.value: [1.0, 2.0],
+            Columns.LOW.value: [1.0, 2.0],
+            Columns.CLOSE.value: [1.0, 2.0],
+            Columns.VOLUME.value: [float(os.getpid())] * 2,
+            Columns.SYMBOL.value: [ticker, ticker],
+        })
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker.upper()
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestBackfill(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = Path(self.tmp.name) / "out"
+        self.saved = dict(api._ADAPTERS)
+        self.install(OfflineAdapter(fail={"BAD"}))
+        # Forked workers inherit the offline adapters installed above
+        self.enterContext(warnings.catch_warnings())
+        warnings.filterwarnings("ignore", message=".*fork.*", category=DeprecationWarning)
+
+    def tearDown(self):
+        api._ADAPTERS.clear()
+        api._ADAPTERS.update(self.saved)
+        self.tmp.cleanup()
+
+    def install(self, adapter):
+        api._ADAPTERS[Exchange.YFINANCE] = adapter
+        api._ADAPTERS[Exchange.AKSHARE] = adapter
+
+    def run_backfill(self, universe, **kwargs):
+        return backfill(
+            universe, MarketType.STOCK, "1d", "2023-11-01", "2023-12-01", self.out,
+            shard_size=2, mp_context="fork", **kwargs
+        )
+
+    def test_writes_files_in_worker_processes(self):
+        universe = ["AAPL", "MSFT", "BAD", ("600519", MarketType.STOCK, Exchange.AKSHARE), "AAPL", ("X", "bonds")]
+        report = self.run_backfill(universe)
+
+        self.assertEqual(report.status, Status.OK)
+        self.assertEqual(list(report.statuses), ["AAPL", "MSFT", "BAD", "600519", "X"])
+        self.assertEqual(report.statuses["BAD"], Status.FAILED)
+        self.assertIn("no data for BAD", report.errors["BAD"])
+        self.assertIn("Unsupported market type", report.errors["X"])
+        self.assertEqual(set(report.files), {"AAPL", "MSFT", "600519"})
+
+        path = output_path(self.out, Exchange.AKSHARE, "600519", "1d")
+        self.assertEqual(report.files["600519"], str(path))
+        df = pl.read_parquet(path)
+        self.assertEqual(df[Columns.EXCHANGE.value].to_list(), [Exchange.AKSHARE] * 2)
+        self.assertNotEqual(df[Columns.VOLUME.value][0], float(os.getpid()), "Fetched in a worker process")
+
+        manifest = json.loads((self.out / MANIFEST_FILE).read_text())
+        self.assertEqual(manifest["tickers"]["AAPL"]["rows"], 2)
+        self.assertEqual(manifest["tickers"]["BAD"]["status"], Status.FAILED)
+
+    def test_resume_skips_completed_tickers(self):
+        self.run_backfill(["AAPL", "BAD"])
+        # The retry now succeeds for BAD; AAPL would fail if it were fetched again
+        self.install(OfflineAdapter(fail={"AAPL"}))
+        report = self.run_backfill(["AAPL", "BAD"])
+        self.assertEqual(report.skipped, ["AAPL"])
+        self.assertEqual(report.statuses, {"AAPL": Status.OK, "BAD": Status.OK})
+
+        with self.assertRaises(ValueError):
+            backfill(["AAPL"], MarketType.STOCK, "1h", "2023-11-01", "2023-12-01", self.out)
+        report = self.run_backfill(["AAPL"], resume=False)
+        self.assertEqual(report.statuses, {"AAPL": Status.FAILED})
+
+    def test_ipc_output_and_cli(self):
+        universe = Path(self.tmp.name) / "universe.txt"
+        universe.write_text("ticker,market_type,exchange\n# US\nAAPL\n\n600519,,akshare  # A-share\n")
+        self.assertEqual(load_universe(universe), ["AAPL", ("600519", None, "akshare")])
+
+        report = self.run_backfill(universe, fmt="ipc")
+        self.assertEqual(report.statuses, {"AAPL": Status.OK, "600519": Status.OK})
+        self.assertEqual(pl.read_ipc(report.files["600519"]).height, 2)
+
+        argv = [str(universe), "--market-type", "stock", "--start", "2023-11-01", "--end", "2023-12-01",
+                "--out", str(self.out / "cli"), "--start-method", "fork"]
+        self.assertEqual(main(argv), 0)
+        self.assertTrue(output_path(self.out / "cli", Exchange.YFINANCE, "AAPL", "1d").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import sys
+import os
+import unittest
+
+import numpy as np
+import polars as pl
+from polars.testing import assert_frame_equal
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.bar_builder import BarBuilder, BAR_SCHEMA
+from unified_data.models.enums import Columns
+from unified_data.models.types import Tick
+from unified_data.resample import resample_kline
+
+MIN_MS = 60_000
+T0 = 1_735_689_600_000  # 2025-01-01 00:00 UTC
+
+
+class TestBarBuilder(unittest.TestCase):
+
+    def test_builds_bars_and_closes_on_next_bucket(self):
+        b = BarBuilder("1m", exchange="tqsdk")
+        for ts, price, vol in [(T0 + 1000, 10.0, 1), (T0 + 2000, 12.0, 2), (T0 + 3000, 9.0, 1), (T0 + 59_000, 11.0, 3)]:
+            b.add("RB", ts, price, vol)
+        self.assertTrue(b.drain().is_empty(), "The forming bar is not emitted")
+
+        b.add("RB", T0 + MIN_MS + 5, 11.5, 1)
+        bars = b.drain()
+        self.assertEqual(bars.schema, pl.Schema(BAR_SCHEMA))
+        self.assertEqual(bars.row(0), (T0, 10.0, 12.0, 9.0, 11.0, 7.0, "RB", "tqsdk"))
+
+        b.flush()
+        self.assertEqual(b.drain().row(0), (T0 + MIN_MS, 11.5, 11.5, 11.5, 11.5, 1.0, "RB", "tqsdk"))
+
+    def test_late_ticks_within_grace(self):
+        b = BarBuilder("1m", grace_ms=2000)
+        b.add("RB", T0 + 50_000, 10.0)
+        b.add("RB", T0 + MIN_MS + 500, 20.0)
+        # Late, out of order tick for the first bar: still inside the grace window
+        b.add("RB", T0 + 40_000, 8.0)
+        self.assertTrue(b.drain().is_empty())
+
+        b.add("RB", T0 + MIN_MS + 2000, 21.0)
+        bars = b.drain()
+        self.assertEqual(bars.select("ts", "open", "high", "low", "close").row(0), (T0, 8.0, 10.0, 8.0, 10.0))
+
+        b.add("RB", T0 + 59_000, 99.0)
+        self.assertEqual(b.late_dropped, 1)
+        b.flush()
+        self.assertEqual(b.drain()[Columns.HIGH.value].to_list(), [21.0])
+
+    def test_advance_closes_quiet_symbols(self):
+        b = BarBuilder("1m")
+        for k in range(500):
+            b.add(f"S{k}", T0 + k, float(k))
+        self.assertEqual(b.symbols, 500)
+        self.assertEqual(b.advance(T0 + MIN_MS - 1), 0)
+        self.assertEqual(b.advance(T0 + MIN_MS), 500)
+        bars = b.drain()
+        self.assertEqual(bars.height, 500)
+        self.assertEqual(bars.filter(pl.col("symbol") == "S42")["close"].item(), 42.0)
+
+    def test_cumulative_volume(self):
+        b = BarBuilder("1m", cumulative_volume=True)
+        b.add_ticks([
+            Tick("RB", "tqsdk", T0, 1.0, volume=1000),
+            Tick("RB", "tqsdk", T0 + 10, 1.0, volume=1004),
+            Tick("RB", "tqsdk", T0 + MIN_MS, 1.0, volume=1010),
+        ])
+        b.flush()
+        self.assertEqual(b.drain()["vol"].to_list(), [4.0, 6.0])
+
+    def test_matches_resampled_one_second_bars(self):
+        rng = np.random.default_rng(0)
+        ts = np.sort(rng.integers(T0, T0 + 10 * MIN_MS, 2000))
+        price = rng.normal(100, 1, len(ts))
+        vol = rng.integers(1, 10, len(ts)).astype(float)
+
+        b = BarBuilder("1m", exchange="x")
+        for t, p, v in zip(ts.tolist(), price.tolist(), vol.tolist()):
+            b.add("A", t, p, v)
+        b.flush()
+
+        ticks = pl.DataFrame({
+            "ts": ts, "open": price, "high": price, "low": price, "close": price, "vol": vol,
+            "symbol": ["A"] * len(ts), "exchange": ["x"] * len(ts),
+        })
+        assert_frame_equal(b.drain(), resample_kline(ticks, "1m"), check_column_order=False, check_row_order=True)
+
+    def test_rejects_calendar_periods_and_wide_grace(self):
+        with self.assertRaises(ValueError):
+            BarBuilder("1w")
+        with self.assertRaises(ValueError):
+            BarBuilder("1m", grace_ms=MIN_MS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import sys
+import os
+import unittest
+
+# Add src and the repo root (for the benchmarks package) to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.bench_pull_kline import SOURCES, compare, fit_overhead, run
+from unified_data.scheduler import get_scheduler
+
+
+class TestOfflineBenchmark(unittest.TestCase):
+
+    def test_replays_every_adapter_offline(self):
+        scheduler = get_scheduler()
+        results = run(list(SOURCES), limits=[5, 300], concurrency=[1, 2], calls=3)
+        self.assertIs(get_scheduler(), scheduler, "The benchmark restores the process scheduler")
+
+        self.assertEqual(len(results), len(SOURCES) * 4)
+        for r in results:
+            # Every call returned exactly `limit` rows
+            self.assertEqual(r.rows, r.calls * r.limit, r.key)
+            self.assertGreater(r.rows_per_s, 0)
+            self.assertLessEqual(r.p50_ms, r.p99_ms)
+            self.assertGreater(r.peak_kib, 0)
+        self.assertEqual(set(fit_overhead(results)), set(SOURCES))
+
+        baseline = {"results": {r.key: {"p50_ms": r.p50_ms / 10, "rows_per_s": r.rows_per_s} for r in results[:1]}}
+        self.assertEqual(compare(results, baseline, threshold=0.25), [results[0].key])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import sys
+import os
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.adapters.ccxt_adapter import CCXTAdapter
+from unified_data.models.enums import Columns
+
+MINUTE_MS = 60_000
+T0 = 1_700_000_040_000 - (1_700_000_040_000 % MINUTE_MS)
+
+
+def fake_ohlcv(page_size):
+    """fetch_ohlcv stand-in: one bar per minute from `since`, capped at the page size."""
+    lock = threading.Lock()
+    calls = []
+
+    def fetch_ohlcv(symbol, timeframe=None, since=None, limit=None):
+        with lock:
+            calls.append((since, limit))
+        time.sleep(0.005)
+        n = min(limit or page_size, page_size)
+        return [[since + i * MINUTE_MS, 1.0, 2.0, 0.5, 1.5, 1.0] for i in range(n)]
+    return fetch_ohlcv, calls
+
+
+class TestCCXTPagination(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = CCXTAdapter("binance")
+        self.fetch, self.calls = fake_ohlcv(self.adapter.strategy.max_page_size)
+        exchange = MagicMock()
+        exchange.fetch_ohlcv.side_effect = self.fetch
+        patcher = patch.object(self.adapter.strategy, "get_exchange", return_value=exchange)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_single_page_is_one_call(self):
+        df = self.adapter.get_kline("BTC_USDT", "1m", start_date=datetime.fromtimestamp(T0 / 1000), limit=500)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(len(df), 500)
+
+    def test_limit_beyond_page_from_start(self):
+        start = datetime.fromtimestamp(T0 / 1000)
+        df = self.adapter.get_kline("BTC_USDT", "1m", start_date=start, limit=2500)
+        self.assertEqual(sorted(self.calls), [(T0, 1000), (T0 + 1000 * MINUTE_MS, 1000), (T0 + 2000 * MINUTE_MS, 500)])
+        self.assertEqual(len(df), 2500)
+        ts = df[Columns.TIMESTAMP.value]
+        self.assertEqual(ts[0], T0)
+        self.assertTrue(ts.is_sorted())
+        self.assertEqual(ts.n_unique(), 2500)
+
+    def test_range_is_bounded_by_end_date(self):
+        start = datetime.fromtimestamp(T0 / 1000)
+        end = datetime.fromtimestamp((T0 + 2999 * MINUTE_MS) / 1000)
+        df = self.adapter.get_kline("BTC_USDT", "1m", start_date=start, end_date=end, limit=0)
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(len(df), 3000)
+        self.assertEqual(df[Columns.TIMESTAMP.value].max(), T0 + 2999 * MINUTE_MS)
+
+    def test_latest_bars_without_dates(self):
+        df = self.adapter.get_kline("BTC_USDT", "1m", limit=1500)
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(len(df), 1500)
+
+    def test_pages_stream_as_they_arrive(self):
+        start = datetime.fromtimestamp(T0 / 1000)
+        pages = self.adapter.iter_kline_pages("BTC_USDT", "1m", start_date=start, limit=3000)
+        first = next(pages)
+        self.assertEqual(len(first), 1000)
+        self.assertEqual(sum(len(p) for p in pages) + len(first), 3000)
+
+
+class TestCCXTPaginationAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def test_async_pagination(self):
+        adapter = CCXTAdapter("coinbase")
+        fetch, calls = fake_ohlcv(adapter.strategy.max_page_size)
+        exchange = MagicMock()
+        exchange.fetch_ohlcv = AsyncMock(side_effect=fetch)
+        with patch.object(adapter.strategy, "get_async_exchange", return_value=exchange):
+            df = await adapter.get_kline_async("ETH_BTC", "1m", start_date=datetime.fromtimestamp(T0 / 1000), limit=1000)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(len(df), 1000)
+        self.assertEqual(df[Columns.TIMESTAMP.value].n_unique(), 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import sys
+import os
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.api import pull_kline
+from unified_data.adapters.base import BaseAdapter
+from unified_data.coalesce import REQUEST_COALESCER
+from unified_data.models.enums import MarketType, Exchange, Columns, Status
+
+HOUR_MS = 3_600_000
+START_MS = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+class SlowRangeAdapter(BaseAdapter):
+    """Serves hourly bars for the requested range after a delay, counting calls."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        with self.lock:
+            self.calls.append((start_date, end_date, limit))
+        time.sleep(0.1)
+        if self.fail:
+            raise RuntimeError("source down")
+        if start_date is None:
+            ts = [START_MS + i * HOUR_MS for i in range(limit)]
+        else:
+            start_ms = int(start_date.timestamp() * 1000)
+            ts = list(range(start_ms, int(end_date.timestamp() * 1000) + 1, HOUR_MS))
+        return pl.DataFrame({
+            Columns.TIMESTAMP.value: ts,
+            Columns.OPEN.value: [1.0] * len(ts),
+            Columns.HIGH.value: [1.0] * len(ts),
+            Columns.LOW.value: [1.0] * len(ts),
+            Columns.CLOSE.value: [1.0] * len(ts),
+            Columns.VOLUME.value: [1.0] * len(ts),
+            Columns.SYMBOL.value: [ticker] * len(ts),
+        })
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker
+
+    def to_exchange_period(self, period):
+        return period
+
+
+def run_concurrently(calls):
+    results = [None] * len(calls)
+
+    def worker(i, kwargs):
+        results[i] = pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", **kwargs)
+
+    threads = [threading.Thread(target=worker, args=(i, kw)) for i, kw in enumerate(calls)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def utc(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+class TestCoalescing(unittest.TestCase):
+
+    def use_adapter(self, adapter):
+        patcher = patch("unified_data.api._get_adapter", return_value=(adapter, Exchange.BINANCE))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_identical_requests_share_one_fetch(self):
+        adapter = SlowRangeAdapter()
+        self.use_adapter(adapter)
+        results = run_concurrently([{"limit": 24}] * 8)
+        self.assertEqual(len(adapter.calls), 1)
+        self.assertTrue(all(r.status == Status.OK and r.data.height == 24 for r in results))
+
+    def test_overlapping_ranges_merge_and_slice(self):
+        adapter = SlowRangeAdapter()
+        self.use_adapter(adapter)
+        patcher = patch.object(REQUEST_COALESCER, "window", 0.05)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        a = {"start_date": utc(START_MS), "end_date": utc(START_MS + 99 * HOUR_MS), "limit": 0}
+        b = {"start_date": utc(START_MS + 50 * HOUR_MS), "end_date": utc(START_MS + 149 * HOUR_MS), "limit": 10}
+        res_a, res_b = run_concurrently([a, b])
+
+        self.assertEqual(len(adapter.calls), 1)
+        start, end, n_bars = adapter.calls[0]
+        self.assertEqual(int(start.timestamp() * 1000), START_MS)
+        self.assertEqual(int(end.timestamp() * 1000), START_MS + 149 * HOUR_MS)
+        self.assertEqual(n_bars, 150)
+
+        ts_a = res_a.data[Columns.TIMESTAMP.value]
+        self.assertEqual((ts_a.min(), ts_a.max(), len(ts_a)), (START_MS, START_MS + 99 * HOUR_MS, 100))
+        ts_b = res_b.data[Columns.TIMESTAMP.value]
+        self.assertEqual(ts_b.to_list(), [START_MS + h * HOUR_MS for h in range(140, 150)])
+
+    def test_errors_reach_every_caller(self):
+        adapter = SlowRangeAdapter(fail=True)
+        self.use_adapter(adapter)
+        results = run_concurrently([{"limit": 24}] * 4)
+        self.assertEqual(len(adapter.calls), 1)
+        self.assertTrue(all(r.status == Status.FAILED and "source down" in r.error for r in results))
+
+        # Nothing lingers after a failed flight
+        adapter.fail = False
+        self.assertEqual(pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", limit=24).status, Status.OK)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import sys
+import os
+import json
+import subprocess
+import unittest
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+
+# Cumulative import time allowed for a bare `import unified_data`
+IMPORT_BUDGET_US = 50_000
+
+HEAVY = ("polars", "pandas", "pyarrow", "ccxt", "yfinance", "akshare", "tqsdk")
+
+
+def run_isolated(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Run `code` in a fresh interpreter with src on the path."""
+    prelude = f"import sys, json; sys.path.insert(0, {SRC!r})\n"
+    return subprocess.run(
+        [sys.executable, *flags, "-c", prelude + code], capture_output=True, text=True, timeout=120, check=True
+    )
+
+
+def loaded_after(code: str) -> set[str]:
+    out = run_isolated(code + f"\nprint(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))").stdout
+    return set(json.loads(out.strip().splitlines()[-1]))
+
+
+class TestImportBudget(unittest.TestCase):
+
+    def test_bare_import_and_enums_load_nothing_heavy(self):
+        self.assertEqual(loaded_after("import unified_data\nfrom unified_data import MarketType, Exchange, Columns"), set())
+
+    def test_api_loads_polars_but_no_vendor_sdk(self):
+        self.assertEqual(loaded_after("from unified_data import pull_kline"), {"polars"})
+
+    def test_adapter_loads_only_its_own_sdk(self):
+        code = "from unified_data.api import _create_adapter\n_create_adapter('binance')"
+        self.assertEqual(loaded_after(code), {"polars", "ccxt"})
+
+    def test_import_time_budget(self):
+        stderr = run_isolated("import unified_data", "-X", "importtime").stderr
+        line = next(l for l in stderr.splitlines() if l.rstrip().endswith("| unified_data"))
+        cumulative_us = int(line.split("|")[1])
+        self.assertLess(cumulative_us, IMPORT_BUDGET_US)
+
+    def test_lazy_attributes(self):
+        out = run_isolated(
+            "import unified_data\n"
+            "from unified_data.api import pull_kline\n"
+            "print(unified_data.pull_kline is pull_kline, 'KlineStore' in dir(unified_data))"
+        ).stdout
+        self.assertEqual(out.split(), ["True", "True"])
+        with self.assertRaises(subprocess.CalledProcessError):
+            run_isolated("import unified_data\nunified_data.no_such_name")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import sys
+import os
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data import KlineCache, pull_kline
+from unified_data.adapters.base import BaseAdapter
+from unified_data.models.enums import MarketType, Exchange, Columns, Status
+
+
+def frame(n: int, ticker: str = "AAPL") -> pl.DataFrame:
+    return pl.DataFrame({
+        Columns.TIMESTAMP.value: list(range(n)),
+        Columns.OPEN.value: [1.0] * n,
+        Columns.HIGH.value: [1.0] * n,
+        Columns.LOW.value: [1.0] * n,
+        Columns.CLOSE.value: [1.0] * n,
+        Columns.VOLUME.value: [1.0] * n,
+        Columns.SYMBOL.value: [ticker] * n,
+    })
+
+
+class CountingAdapter(BaseAdapter):
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        self.calls += 1
+        return frame(3, ticker)
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker.upper()
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestKlineCache(unittest.TestCase):
+
+    def test_ttl_by_period(self):
+        cache = KlineCache()
+        now = time.time()
+        self.assertEqual(cache.ttl("1m", None, now), 3.0)
+        self.assertEqual(cache.ttl("1d", None, now), cache.max_live_ttl)
+        closed_end = int((now - 3 * 86400) * 1000)
+        self.assertEqual(cache.ttl("1d", closed_end, now), cache.closed_ttl)
+        # An end inside the forming bar is still live
+        self.assertEqual(cache.ttl("1d", int(now * 1000) - 1000, now), cache.max_live_ttl)
+
+    def test_lru_eviction_by_bytes(self):
+        size = frame(100).estimated_size()
+        cache = KlineCache(max_bytes=size * 2)
+        keys = [("x", s, "1d", None, None, 100, None) for s in "ABC"]
+        cache.put(keys[0], frame(100))
+        cache.put(keys[1], frame(100))
+        self.assertIsNotNone(cache.get(keys[0]))  # A is now most recent
+        cache.put(keys[2], frame(100))
+
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[0]))
+        stats = cache.stats()
+        self.assertEqual(stats.evictions, 1)
+        self.assertEqual(stats.entries, 2)
+        self.assertLessEqual(stats.bytes, stats.max_bytes)
+
+        cache.put(("x", "BIG", "1d", None, None, 0, None), frame(1000))
+        self.assertEqual(cache.stats().entries, 2, "Frames larger than the budget are not cached")
+
+    def test_expiry(self):
+        cache = KlineCache(max_live_ttl=1.0)
+        key = ("x", "A", "1m", None, None, 10, None)
+        cache.put(key, frame(1))
+        with patch("unified_data.cache.time.monotonic", return_value=time.monotonic() + 2):
+            self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.stats().expirations, 1)
+
+
+class TestPullKlineCache(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = CountingAdapter()
+        patcher = patch("unified_data.api._get_adapter", return_value=(self.adapter, Exchange.YFINANCE))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_hits_skip_the_adapter(self):
+        cache = KlineCache()
+        end = datetime.now() - timedelta(days=10)
+        first = pull_kline("aapl", MarketType.STOCK, "1d", end_date=end, limit=3, cache=cache)
+        # Same resolved symbol and range, different spelling and date type
+        second = pull_kline("AAPL", MarketType.STOCK, "1d", end_date=end.isoformat(), limit=3, cache=cache)
+
+        self.assertEqual(self.adapter.calls, 1)
+        self.assertEqual(second.status, Status.OK)
+        self.assertEqual(first.data[Columns.SYMBOL.value][0], "aapl")
+        self.assertEqual(second.data[Columns.SYMBOL.value][0], "AAPL")
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
+        pull_kline("AAPL", MarketType.STOCK, "1d", end_date=end, limit=5, cache=cache)
+        self.assertEqual(self.adapter.calls, 2)
+
+    def test_without_cache(self):
+        pull_kline("AAPL", MarketType.STOCK, "1d", limit=3)
+        pull_kline("AAPL", MarketType.STOCK, "1d", limit=3)
+        self.assertEqual(self.adapter.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
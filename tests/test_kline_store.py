@@ -0,0 +1,105 @@
+import sys
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.api import pull_kline
+from unified_data.storage import KlineStore
+from unified_data.adapters.base import BaseAdapter
+from unified_data.models.enums import MarketType, Columns, Status
+
+DAY_MS = 24 * 3600 * 1000
+
+
+class FakeDailyAdapter(BaseAdapter):
+    """Offline adapter producing one bar per day and recording every request."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        self.calls.append((start_date, end_date))
+        start_ms = int(start_date.timestamp() * 1000)
+        end_ms = int(end_date.timestamp() * 1000)
+        first = -(-start_ms // DAY_MS) * DAY_MS
+        ts = list(range(first, end_ms + 1, DAY_MS))
+        return pl.DataFrame({
+            Columns.TIMESTAMP.value: ts,
+            Columns.OPEN.value: [float(t // DAY_MS) for t in ts],
+            Columns.HIGH.value: [float(t // DAY_MS) + 1 for t in ts],
+            Columns.LOW.value: [float(t // DAY_MS) - 1 for t in ts],
+            Columns.CLOSE.value: [float(t // DAY_MS) for t in ts],
+            Columns.VOLUME.value: [1.0 for _ in ts],
+            Columns.SYMBOL.value: [ticker for _ in ts],
+        }, schema_overrides={Columns.TIMESTAMP.value: pl.Int64})
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker.upper()
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestKlineStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = KlineStore(self.tmp.name)
+        self.adapter = FakeDailyAdapter()
+        patcher = patch("unified_data.api._get_adapter", return_value=(self.adapter, "fake"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def _pull(self, start, end):
+        return pull_kline("abc", MarketType.STOCK, "1d", start_date=start, end_date=end, limit=0, store=self.store)
+
+    def test_repeat_query_is_served_locally(self):
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+        first = self._pull(start, end)
+        self.assertEqual(first.status, Status.OK)
+        self.assertEqual(len(self.adapter.calls), 1)
+
+        second = self._pull(start, end)
+        self.assertEqual(len(self.adapter.calls), 1, "Covered range should not hit the adapter")
+        self.assertTrue(first.data.equals(second.data))
+        self.assertEqual(second.data[Columns.SYMBOL.value][0], "abc")
+        self.assertEqual(second.data[Columns.EXCHANGE.value][0], "fake")
+
+    def test_only_missing_ranges_are_fetched(self):
+        self._pull(datetime(2024, 1, 10), datetime(2024, 1, 20))
+        self.adapter.calls.clear()
+
+        res = self._pull(datetime(2024, 1, 1), datetime(2024, 1, 31))
+        self.assertEqual(len(self.adapter.calls), 2)
+        (s1, e1), (s2, e2) = self.adapter.calls
+        self.assertLess(e1, datetime(2024, 1, 10))
+        self.assertGreater(s2, datetime(2024, 1, 20))
+
+        ts = res.data[Columns.TIMESTAMP.value]
+        self.assertTrue(ts.is_sorted())
+        self.assertEqual(ts.n_unique(), len(ts), "Merged data must be deduplicated on timestamp")
+
+    def test_limit_tails_stored_range(self):
+        end = datetime(2024, 3, 1)
+        res = pull_kline("abc", MarketType.STOCK, "1d", start_date=end - timedelta(days=30),
+                         end_date=end, limit=5, store=self.store)
+        self.assertEqual(len(res.data), 5)
+
+    def test_missing_ranges(self):
+        self.store.write("x", "Y/Z", "1h", pl.DataFrame(), covered=(100, 200))
+        self.store.write("x", "Y/Z", "1h", pl.DataFrame(), covered=(201, 300))
+        self.assertEqual(self.store.coverage("x", "Y/Z", "1h"), [(100, 300)])
+        self.assertEqual(self.store.missing_ranges("x", "Y/Z", "1h", 50, 400), [(50, 99), (301, 400)])
+        self.assertEqual(self.store.missing_ranges("x", "Y/Z", "1h", 120, 250), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
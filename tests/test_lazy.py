@@ -0,0 +1,132 @@
+import sys
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.api import pull_kline
+from unified_data.adapters.base import BaseAdapter
+from unified_data.lazy import conjuncts, timestamp_bounds
+from unified_data.models.enums import MarketType, Exchange, Columns, Status
+from unified_data.storage import KlineStore
+
+HOUR_MS = 3_600_000
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 1, 10, 23, tzinfo=timezone.utc)
+START_MS = int(START.timestamp() * 1000)
+END_MS = int(END.timestamp() * 1000)
+TS = pl.col(Columns.TIMESTAMP.value)
+
+
+class RangeAdapter(BaseAdapter):
+    """Serves synthetic hourly bars for whatever range is requested."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        start_ms = int(start_date.timestamp() * 1000)
+        end_ms = int(end_date.timestamp() * 1000)
+        self.calls.append((start_ms, end_ms))
+        ts = list(range(start_ms - start_ms % HOUR_MS, end_ms + 1, HOUR_MS))
+        return pl.DataFrame({
+            Columns.TIMESTAMP.value: ts,
+            Columns.OPEN.value: [float(t // HOUR_MS % 100) for t in ts],
+            Columns.HIGH.value: [1.0] * len(ts),
+            Columns.LOW.value: [0.0] * len(ts),
+            Columns.CLOSE.value: [float(t // HOUR_MS % 100) for t in ts],
+            Columns.VOLUME.value: [1.0] * len(ts),
+            Columns.SYMBOL.value: [ticker] * len(ts),
+        })
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestTimestampBounds(unittest.TestCase):
+
+    def test_conjuncts(self):
+        pred = (TS >= 5) & (pl.col("close") > 1) & TS.is_between(1, 9)
+        self.assertEqual(len(conjuncts(pred)), 3)
+        self.assertEqual(len(conjuncts((TS >= 5) | (TS < 2))), 1)
+
+    def test_bounds(self):
+        lo = START_MS + 48 * HOUR_MS
+        hi = START_MS + 72 * HOUR_MS
+        bounds = timestamp_bounds((TS >= lo) & (TS < hi) & (pl.col("close") > 1), START_MS, END_MS, HOUR_MS)
+        self.assertLessEqual(bounds[0], lo)
+        self.assertGreater(bounds[0], lo - HOUR_MS)
+        self.assertGreaterEqual(bounds[1], hi - 1)
+        self.assertLess(bounds[1], hi + HOUR_MS)
+
+        self.assertIsNone(timestamp_bounds(pl.col("close") > 1, START_MS, END_MS, HOUR_MS))
+        empty = timestamp_bounds(TS > END_MS + 10 * HOUR_MS, START_MS, END_MS, HOUR_MS)
+        self.assertGreater(empty[0], empty[1])
+
+
+class TestLazyPull(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = RangeAdapter()
+        patcher = patch("unified_data.api._get_adapter", return_value=(self.adapter, Exchange.BINANCE))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_eager_and_pushes_down_window(self):
+        eager = pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", start_date=START, end_date=END, limit=0)
+        res = pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", start_date=START, end_date=END, limit=0, lazy=True)
+        self.assertEqual(res.status, Status.OK)
+        self.assertIsInstance(res.data, pl.LazyFrame)
+        self.assertEqual(len(self.adapter.calls), 1, "Nothing is fetched before collect")
+
+        lo = START_MS + 24 * HOUR_MS
+        hi = START_MS + 30 * HOUR_MS
+        query = lambda frame: frame.filter(TS.is_between(lo, hi) & (pl.col(Columns.CLOSE.value) > 25)) \
+            .select(Columns.TIMESTAMP.value, Columns.CLOSE.value)
+        got = query(res.data).collect()
+        assert_frame_equal(got, query(eager.data))
+
+        fetch_start, fetch_end = self.adapter.calls[-1]
+        self.assertGreater(fetch_start, lo - HOUR_MS)
+        self.assertLess(fetch_end, hi + HOUR_MS)
+
+    def test_store_scan(self):
+        with tempfile.TemporaryDirectory() as root:
+            store = KlineStore(root)
+            res = pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", start_date=START, end_date=END,
+                             limit=0, store=store, lazy=True)
+            df = res.data.filter(TS >= START_MS + 200 * HOUR_MS).select(Columns.CLOSE.value).collect()
+            self.assertEqual(df.columns, [Columns.CLOSE.value])
+            self.assertEqual(df.height, (END_MS - START_MS) // HOUR_MS + 1 - 200)
+
+            # The full window only fetches the part the first query skipped
+            full = res.data.select(Columns.SYMBOL.value, Columns.EXCHANGE.value).collect()
+            self.assertEqual(full.height, (END_MS - START_MS) // HOUR_MS + 1)
+            self.assertEqual(full.row(0), ("BTC_USDT", Exchange.BINANCE))
+            self.assertEqual(len(self.adapter.calls), 2)
+            self.assertEqual(self.adapter.calls[1][0], START_MS)
+            self.assertLess(self.adapter.calls[1][1], START_MS + 200 * HOUR_MS)
+
+            # and is then served from disk
+            res.data.collect()
+            self.assertEqual(len(self.adapter.calls), 2)
+
+    def test_empty_window_skips_fetch(self):
+        res = pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", start_date=START, end_date=END, limit=0, lazy=True)
+        df = res.data.filter(TS < START_MS - 10 * HOUR_MS).collect()
+        self.assertTrue(df.is_empty())
+        self.assertEqual(self.adapter.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import sys
+import os
+import json
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.adapters.ccxt_strategies.coinbase import CoinbaseStrategy
+from unified_data.adapters.ccxt_strategies.markets import MARKETS_CACHE, MarketsCache, SymbolIndex
+from unified_data.models.enums import MarketType
+
+
+def make_exchange(symbols):
+    """Mock sync exchange whose load_markets populates `markets` (with a small delay)."""
+    exchange = MagicMock()
+    exchange.markets = None
+
+    def load_markets(reload=False):
+        time.sleep(0.01)
+        exchange.markets = {s: {} for s in symbols}
+        return exchange.markets
+    exchange.load_markets.side_effect = load_markets
+    return exchange
+
+
+class TestMarketsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        MARKETS_CACHE.invalidate()
+        self.addCleanup(MARKETS_CACHE.invalidate)
+
+    def test_symbol_index(self):
+        index = SymbolIndex.from_symbols(["BTC/USDT", "BTC/USD", "SOL/USD", "ETH/BTC"])
+        self.assertEqual(index.resolve("BTC/USDT"), "BTC/USDT")
+        self.assertEqual(index.resolve("SOL/USDT"), "SOL/USD")
+        self.assertEqual(index.resolve("XYZ/USDT"), "XYZ/USDT")
+        self.assertEqual(index.usdt_fallbacks, {"SOL/USDT": "SOL/USD"})
+
+    @patch('ccxt.coinbase')
+    def test_shared_across_strategy_instances(self, mock_ccxt_coinbase):
+        first = make_exchange(["SOL/USD"])
+        second = make_exchange(["SOL/USD"])
+        mock_ccxt_coinbase.side_effect = [first, second]
+
+        self.assertEqual(CoinbaseStrategy().get_exchange_symbol("SOL_USDT", MarketType.CRYPTO), "SOL/USD")
+        self.assertEqual(CoinbaseStrategy().get_exchange_symbol("SOL_USDT", MarketType.CRYPTO), "SOL/USD")
+        first.load_markets.assert_called_once()
+        second.load_markets.assert_not_called()
+
+    def test_concurrent_resolution_loads_once(self):
+        cache = MarketsCache()
+        exchange = make_exchange(["SOL/USD"])
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            indexes = list(pool.map(lambda _: cache.get_index("coinbase", exchange), range(16)))
+        self.assertEqual(exchange.load_markets.call_count, 1)
+        self.assertTrue(all(i.resolve("SOL/USDT") == "SOL/USD" for i in indexes))
+
+    def test_ttl_expiry_reloads(self):
+        cache = MarketsCache(ttl=0)
+        exchange = make_exchange(["SOL/USD"])
+        cache.get_index("coinbase", exchange)
+        cache.get_index("coinbase", exchange)
+        self.assertEqual(exchange.load_markets.call_count, 2)
+        self.assertEqual(exchange.load_markets.call_args.kwargs, {"reload": True})
+
+    def test_snapshot_serves_cold_process_offline(self):
+        warm = MarketsCache(snapshot_dir=self.tmp.name)
+        warm.get_index("coinbase", make_exchange(["SOL/USD", "BTC/USDT"]))
+        with open(os.path.join(self.tmp.name, "coinbase_markets.json")) as f:
+            self.assertEqual(json.load(f)["symbols"], ["BTC/USDT", "SOL/USD"])
+
+        cold = MarketsCache(snapshot_dir=self.tmp.name)
+        offline = make_exchange([])
+        offline.load_markets.side_effect = ConnectionError("no network")
+        index = cold.get_index("coinbase", offline)
+        offline.load_markets.assert_not_called()
+        self.assertEqual(index.resolve("SOL/USDT"), "SOL/USD")
+
+    def test_load_failure_without_snapshot(self):
+        exchange = make_exchange([])
+        exchange.load_markets.side_effect = ConnectionError("no network")
+        self.assertIsNone(MarketsCache().get_index("coinbase", exchange))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data import pull_kline
+from unified_data.adapters.base import BaseAdapter
+from unified_data.metrics import (
+    InMemoryMetrics, get_metrics_sink, set_metrics_sink, span,
+    STAGE_SECONDS, REQUESTS_TOTAL, ERRORS_TOTAL, RETRIES_TOTAL, ROWS_TOTAL, BYTES_TOTAL,
+)
+from unified_data.models.enums import MarketType, Exchange, Columns, Status
+from unified_data.scheduler import RequestScheduler, SourceLimit, get_scheduler
+
+
+class StaticAdapter(BaseAdapter):
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        def fetch():
+            return pl.DataFrame({
+                Columns.TIMESTAMP.value: list(range(limit)),
+                Columns.OPEN.value: [1.0] * limit,
+                Columns.HIGH.value: [1.0] * limit,
+                Columns.LOW.value: [1.0] * limit,
+                Columns.CLOSE.value: [1.0] * limit,
+                Columns.VOLUME.value: [1.0] * limit,
+                Columns.SYMBOL.value: [ticker] * limit,
+            })
+        return get_scheduler().call(Exchange.YFINANCE, fetch)
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        previous = get_metrics_sink()
+        self.metrics = InMemoryMetrics()
+        set_metrics_sink(self.metrics)
+        self.addCleanup(set_metrics_sink, previous)
+
+    def test_span_records_duration_and_errors(self):
+        with span("convert", exchange="x"):
+            pass
+        with self.assertRaises(RuntimeError):
+            with span("convert", exchange="x"):
+                raise RuntimeError("boom")
+        self.assertEqual(self.metrics.histogram(STAGE_SECONDS, stage="convert", exchange="x").count, 2)
+        self.assertEqual(self.metrics.counter(ERRORS_TOTAL, stage="convert", exchange="x"), 1)
+
+    def test_histogram_quantiles(self):
+        for ms in range(1, 101):
+            self.metrics.observe("lat", ms / 1000, {})
+        hist = self.metrics.histogram("lat")
+        self.assertAlmostEqual(hist.sum, 5.05)
+        self.assertGreater(hist.quantile(0.95), 0.05)
+        self.assertLessEqual(hist.quantile(0.95), 0.1)
+
+    def test_pull_kline_stages(self):
+        with patch("unified_data.api._get_adapter", return_value=(StaticAdapter(), Exchange.YFINANCE)):
+            res = pull_kline("AAPL", MarketType.STOCK, "1d", limit=7)
+        self.assertEqual(res.status, Status.OK)
+
+        for stage in ("pull_kline", "resolve_symbol", "fetch", "network", "standardize"):
+            hist = self.metrics.histogram(STAGE_SECONDS, stage=stage, exchange=Exchange.YFINANCE)
+            self.assertIsNotNone(hist, stage)
+            self.assertEqual(hist.count, 1, stage)
+        self.assertEqual(self.metrics.counter(REQUESTS_TOTAL, exchange=Exchange.YFINANCE), 1)
+        self.assertEqual(self.metrics.counter(ROWS_TOTAL, exchange=Exchange.YFINANCE), 7)
+        self.assertGreater(self.metrics.counter(BYTES_TOTAL, exchange=Exchange.YFINANCE), 0)
+
+    def test_scheduler_retries_and_errors(self):
+        scheduler = RequestScheduler({"src": SourceLimit(rate=1000, burst=1000)}, max_retries=1, base_delay=0)
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            raise TimeoutError("slow")
+
+        with self.assertRaises(TimeoutError):
+            scheduler.call("src", flaky)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.metrics.counter(REQUESTS_TOTAL, exchange="src"), 2)
+        self.assertEqual(self.metrics.counter(RETRIES_TOTAL, exchange="src"), 1)
+        self.assertEqual(self.metrics.counter(ERRORS_TOTAL, stage="network", exchange="src"), 2)
+
+    def test_prometheus_exposition(self):
+        self.metrics.increment(REQUESTS_TOTAL, 3, {"exchange": "binance"})
+        self.metrics.observe(STAGE_SECONDS, 0.003, {"stage": "network", "exchange": "binance"})
+        text = self.metrics.to_prometheus()
+        self.assertIn(f"# TYPE {REQUESTS_TOTAL} counter", text)
+        self.assertIn(f'{REQUESTS_TOTAL}{{exchange="binance"}} 3', text)
+        self.assertIn(f"# TYPE {STAGE_SECONDS} histogram", text)
+        self.assertIn(f'{STAGE_SECONDS}_bucket{{exchange="binance",stage="network",le="0.0025"}} 0', text)
+        self.assertIn(f'{STAGE_SECONDS}_bucket{{exchange="binance",stage="network",le="0.005"}} 1', text)
+        self.assertIn(f'{STAGE_SECONDS}_bucket{{exchange="binance",stage="network",le="+Inf"}} 1', text)
+        self.assertIn(f'{STAGE_SECONDS}_count{{exchange="binance",stage="network"}} 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import sys
+import os
+import unittest
+from datetime import date
+
+import pandas as pd
+import polars as pl
+from polars.testing import assert_frame_equal
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.adapters.normalize import KLINE_SCHEMA, from_ohlcv_rows, from_pandas
+from unified_data.adapters.yfinance_adapter import YFINANCE_COLUMNS
+from unified_data.adapters.akshare_adapter import AKSHARE_COLUMNS
+from unified_data.models.enums import Columns
+
+REQUIRED = [c.value for c in (Columns.TIMESTAMP, Columns.OPEN, Columns.HIGH, Columns.LOW,
+                              Columns.CLOSE, Columns.VOLUME, Columns.SYMBOL)]
+
+
+def legacy_pandas_path(pdf, ticker, rename_map, lowercase):
+    """The per-adapter conversion used before the shared normalization stage."""
+    df = pl.from_pandas(pdf.reset_index() if lowercase else pdf)
+    if lowercase:
+        df = df.select(pl.all().name.to_lowercase())
+    df = df.rename({k: v for k, v in rename_map.items() if k in df.columns})
+    ts = Columns.TIMESTAMP.value
+    dtype = df.schema[ts]
+    if dtype == pl.String:
+        df = df.with_columns(pl.col(ts).str.strptime(pl.Date, "%Y-%m-%d").cast(pl.Datetime).dt.timestamp("ms"))
+    else:
+        df = df.with_columns(pl.col(ts).cast(pl.Datetime).dt.timestamp("ms"))
+    df = df.with_columns(pl.lit(ticker).alias(Columns.SYMBOL.value))
+    return df.select([c for c in REQUIRED if c in df.columns])
+
+
+class TestNormalize(unittest.TestCase):
+
+    def assert_same_values(self, new, old):
+        self.assertEqual(new.schema, pl.Schema(KLINE_SCHEMA))
+        assert_frame_equal(new, old.cast(KLINE_SCHEMA))
+
+    def test_yfinance_frame_matches_legacy(self):
+        index = pd.date_range("2024-01-02 09:30", periods=5, freq="1h", tz="America/New_York", name="Datetime")
+        pdf = pd.DataFrame({
+            "Open": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "High": [2.0, 3.0, 4.0, 5.0, 6.0],
+            "Low": [0.5, 1.5, 2.5, 3.5, 4.5],
+            "Close": [1.5, 2.5, 3.5, 4.5, 5.5],
+            "Volume": [100, 200, 300, 400, 500],
+            "Dividends": [0.0] * 5,
+            "Stock Splits": [0.0] * 5,
+        }, index=index)
+        new = from_pandas(pdf, "AAPL", YFINANCE_COLUMNS)
+        self.assert_same_values(new, legacy_pandas_path(pdf, "AAPL", YFINANCE_COLUMNS, lowercase=True))
+        self.assertEqual(new[Columns.TIMESTAMP.value][0], 1704205800000)
+
+    def test_akshare_frames_match_legacy(self):
+        stock = pd.DataFrame({
+            "日期": [date(2024, 1, 2), date(2024, 1, 3)],
+            "股票代码": ["000001", "000001"],
+            "开盘": [9.0, 9.1],
+            "收盘": [9.2, 9.3],
+            "最高": [9.4, 9.5],
+            "最低": [8.9, 9.0],
+            "成交量": [1000, 2000],
+            "成交额": [1e6, 2e6],
+        })
+        self.assert_same_values(
+            from_pandas(stock, "000001", AKSHARE_COLUMNS),
+            legacy_pandas_path(stock, "000001", AKSHARE_COLUMNS, lowercase=False),
+        )
+
+        futures = pd.DataFrame({
+            "date": ["2024-01-02", "2024-01-03"],
+            "open": [3900, 3910], "high": [3950, 3960], "low": [3880, 3890],
+            "close": [3920, 3930], "volume": [5000, 6000], "hold": [1, 2], "settle": [3915, 3925],
+        })
+        self.assert_same_values(
+            from_pandas(futures, "RB0", AKSHARE_COLUMNS),
+            legacy_pandas_path(futures, "RB0", AKSHARE_COLUMNS, lowercase=False),
+        )
+
+    def test_ohlcv_rows(self):
+        rows = [[1_700_000_000_000, 1.0, 2.0, 0.5, 1.5, 10.0],
+                [1_700_000_060_000, 1.5, 2.5, 1.0, 2.0, None]]
+        df = from_ohlcv_rows(rows, "BTC_USDT")
+        self.assertEqual(df.schema, pl.Schema(KLINE_SCHEMA))
+        self.assertEqual(df[Columns.TIMESTAMP.value].to_list(), [1_700_000_000_000, 1_700_000_060_000])
+        self.assertEqual(df[Columns.VOLUME.value].to_list(), [10.0, None])
+        self.assertEqual(df[Columns.SYMBOL.value].to_list(), ["BTC_USDT", "BTC_USDT"])
+
+        empty = from_ohlcv_rows([], "BTC_USDT")
+        self.assertTrue(empty.is_empty())
+        self.assertEqual(empty.schema, pl.Schema(KLINE_SCHEMA))
+
+
+if __name__ == '__main__':
+    unittest.main()
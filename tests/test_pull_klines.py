@@ -0,0 +1,104 @@
+import sys
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.api import pull_klines
+from unified_data.adapters.base import BaseAdapter
+from unified_data.models.enums import MarketType, Exchange, Columns, Status
+
+
+class CountingAdapter(BaseAdapter):
+    """Offline adapter that tracks how many calls are in flight at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(0.02)
+            if ticker == "BAD":
+                raise RuntimeError("boom")
+            return pl.DataFrame({
+                Columns.TIMESTAMP.value: [1, 2],
+                Columns.OPEN.value: [1.0, 2.0],
+                Columns.HIGH.value: [1.0, 2.0],
+                Columns.LOW.value: [1.0, 2.0],
+                Columns.CLOSE.value: [1.0, 2.0],
+                Columns.VOLUME.value: [1.0, 2.0],
+                Columns.SYMBOL.value: [ticker, ticker],
+            })
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker.upper()
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestPullKlines(unittest.TestCase):
+
+    def setUp(self):
+        self.crypto = CountingAdapter()
+        self.stock = CountingAdapter()
+
+        def fake_get_adapter(market_type, exchange):
+            if market_type == MarketType.CRYPTO:
+                return self.crypto, Exchange.COINBASE
+            if market_type == MarketType.STOCK:
+                return self.stock, Exchange.YFINANCE
+            raise ValueError(f"Unsupported market type: {market_type}")
+
+        patcher = patch("unified_data.api._get_adapter", side_effect=fake_get_adapter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_grouped_fan_out_with_caps(self):
+        stocks = [f"S{i}" for i in range(12)]
+        cryptos = [(f"C{i}_USDT", MarketType.CRYPTO) for i in range(6)]
+        res = pull_klines(stocks + cryptos, MarketType.STOCK, "1d",
+                          max_workers={Exchange.YFINANCE: 3, Exchange.COINBASE: 2})
+
+        self.assertEqual(res.status, Status.OK)
+        self.assertEqual(len(res.statuses), 18)
+        self.assertTrue(all(s == Status.OK for s in res.statuses.values()))
+        self.assertEqual(len(res.data), 36)
+        self.assertLessEqual(self.stock.peak, 3)
+        self.assertLessEqual(self.crypto.peak, 2)
+        self.assertGreater(self.stock.peak, 1, "Stock group should run concurrently")
+
+        # Output follows input order and carries symbol/exchange keys
+        symbols = res.data[Columns.SYMBOL.value].unique(maintain_order=True).to_list()
+        self.assertEqual(symbols, stocks + [t for t, _ in cryptos])
+        exchanges = dict(res.data.select(Columns.SYMBOL.value, Columns.EXCHANGE.value).unique().iter_rows())
+        self.assertEqual(exchanges["S0"], Exchange.YFINANCE)
+        self.assertEqual(exchanges["C0_USDT"], Exchange.COINBASE)
+
+    def test_per_ticker_failures(self):
+        res = pull_klines(["AAPL", "BAD", ("X", "UNKNOWN_TYPE")], MarketType.STOCK, "1d")
+        self.assertEqual(res.status, Status.OK)
+        self.assertEqual(res.statuses["AAPL"], Status.OK)
+        self.assertEqual(res.statuses["BAD"], Status.FAILED)
+        self.assertEqual(res.statuses["X"], Status.FAILED)
+        self.assertIn("boom", res.errors["BAD"])
+        self.assertIn("Unsupported market type", res.errors["X"])
+        self.assertEqual(res.data[Columns.SYMBOL.value].unique().to_list(), ["AAPL"])
+
+
+if __name__ == '__main__':
+    unittest.main()
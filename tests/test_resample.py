@@ -0,0 +1,140 @@
+import sys
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.api import pull_kline
+from unified_data.adapters.base import BaseAdapter
+from unified_data.models.enums import MarketType, Exchange, Columns, Status
+from unified_data.resample import bucket_start, can_derive, resample_kline
+from unified_data.storage import KlineStore
+
+HOUR_MS = 3_600_000
+# 2024-01-01 00:00 UTC, a Monday
+START_MS = 1_704_067_200_000
+
+
+def hourly_bars(start_ms: int, n: int, symbol: str = "BTC_USDT") -> pl.DataFrame:
+    return pl.DataFrame({
+        Columns.TIMESTAMP.value: [start_ms + i * HOUR_MS for i in range(n)],
+        Columns.OPEN.value: [float(i) for i in range(n)],
+        Columns.HIGH.value: [float(i) + 0.5 for i in range(n)],
+        Columns.LOW.value: [float(i) - 0.5 for i in range(n)],
+        Columns.CLOSE.value: [float(i) + 0.25 for i in range(n)],
+        Columns.VOLUME.value: [1.0] * n,
+        Columns.SYMBOL.value: [symbol] * n,
+    })
+
+
+class RangeAdapter(BaseAdapter):
+    """Serves synthetic hourly bars for whatever range is requested."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        self.calls.append((period, start_date, end_date, limit))
+        start_ms = int(start_date.timestamp() * 1000)
+        end_ms = int(end_date.timestamp() * 1000)
+        n = (end_ms - start_ms) // HOUR_MS + 1
+        return hourly_bars(start_ms, n, ticker)
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestResample(unittest.TestCase):
+
+    def test_ohlcv_rules(self):
+        df = resample_kline(hourly_bars(START_MS, 8), "4h")
+        self.assertEqual(df.columns, hourly_bars(START_MS, 1).columns)
+        self.assertEqual(df[Columns.TIMESTAMP.value].to_list(), [START_MS, START_MS + 4 * HOUR_MS])
+        first = df.row(0, named=True)
+        self.assertEqual(first[Columns.OPEN.value], 0.0)
+        self.assertEqual(first[Columns.HIGH.value], 3.5)
+        self.assertEqual(first[Columns.LOW.value], -0.5)
+        self.assertEqual(first[Columns.CLOSE.value], 3.25)
+        self.assertEqual(first[Columns.VOLUME.value], 4.0)
+
+    def test_calendar_buckets_and_groups(self):
+        bars = pl.concat([hourly_bars(START_MS, 24 * 40, "A"), hourly_bars(START_MS, 24 * 40, "B")])
+        weekly = resample_kline(bars, "1w")
+        self.assertEqual(weekly.filter(pl.col(Columns.SYMBOL.value) == "A").height, 6)
+        self.assertEqual(weekly[Columns.VOLUME.value][0], 168.0)
+
+        monthly = resample_kline(bars, "1M")
+        feb_1 = int(datetime(2024, 2, 1, tzinfo=timezone.utc).timestamp() * 1000)
+        self.assertEqual(monthly.filter(pl.col(Columns.SYMBOL.value) == "A")[Columns.TIMESTAMP.value].to_list(),
+                         [START_MS, feb_1])
+
+    def test_can_derive(self):
+        self.assertTrue(can_derive("1h", "4h"))
+        self.assertTrue(can_derive("1h", "1d"))
+        self.assertTrue(can_derive("1d", "1w"))
+        self.assertTrue(can_derive("1d", "1M"))
+        self.assertFalse(can_derive("1d", "4h"))
+        self.assertFalse(can_derive("1w", "1M"))
+        self.assertFalse(can_derive("7h", "1d"))
+
+    def test_bucket_start(self):
+        dt = datetime(2024, 1, 10, 13, 0, tzinfo=timezone.utc)
+        self.assertEqual(bucket_start(dt, "4h"), datetime(2024, 1, 10, 12, 0, tzinfo=timezone.utc))
+        self.assertEqual(bucket_start(dt, "1w"), datetime(2024, 1, 8, tzinfo=timezone.utc))
+        self.assertEqual(bucket_start(dt, "1M"), datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+class TestDeriveFrom(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = RangeAdapter()
+        patcher = patch("unified_data.api._get_adapter", return_value=(self.adapter, Exchange.BINANCE))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_native_fetch_by_default(self):
+        pull_kline("BTC_USDT", MarketType.CRYPTO, "4h", limit=5)
+        self.assertEqual(self.adapter.calls[0][0], "4h")
+
+    def test_derived_pull(self):
+        start = datetime(2024, 1, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 3, tzinfo=timezone.utc)
+        res = pull_kline("BTC_USDT", MarketType.CRYPTO, "1d", start_date=start, end_date=end,
+                         limit=0, derive_from="1h")
+        self.assertEqual(res.status, Status.OK)
+        period, fetch_start, _, _ = self.adapter.calls[0]
+        self.assertEqual(period, "1h")
+        # Source range starts on the daily boundary
+        self.assertEqual(fetch_start, datetime(2024, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(res.data[Columns.VOLUME.value].to_list(), [24.0, 24.0, 1.0])
+        self.assertEqual(res.data[Columns.EXCHANGE.value][0], Exchange.BINANCE)
+
+    def test_derived_pull_reuses_store(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, 23, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as root:
+            store = KlineStore(root)
+            pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", start_date=start, end_date=end, store=store)
+            res = pull_kline("BTC_USDT", MarketType.CRYPTO, "4h", start_date=start, end_date=end,
+                             limit=0, store=store, derive_from="1h")
+        self.assertEqual(len(self.adapter.calls), 1)
+        self.assertEqual(res.data.height, 12)
+
+    def test_rejects_non_nesting_periods(self):
+        res = pull_kline("BTC_USDT", MarketType.CRYPTO, "4h", derive_from="1d")
+        self.assertEqual(res.status, Status.FAILED)
+        self.assertIn("Cannot derive", res.error)
+        self.assertEqual(self.adapter.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
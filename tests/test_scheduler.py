@@ -0,0 +1,112 @@
+import sys
+import os
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import ccxt
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.scheduler import RequestScheduler, SourceLimit, TokenBucket, request_priority, current_priority
+from unified_data.adapters.ccxt_adapter import CCXTAdapter
+from unified_data.models.enums import Priority
+
+OHLCV = [[1_700_000_000_000 + i * 60_000, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(3)]
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10.0, burst=2.0)
+        self.assertEqual(bucket.try_acquire(), 0.0)
+        self.assertEqual(bucket.try_acquire(), 0.0)
+        wait = bucket.try_acquire()
+        self.assertGreater(wait, 0.0)
+        self.assertLessEqual(wait, 0.1 + 1e-6)
+
+
+class TestRequestScheduler(unittest.TestCase):
+
+    def test_rate_is_shared_across_threads(self):
+        scheduler = RequestScheduler(limits={"test": SourceLimit(rate=50.0, burst=1.0)})
+        calls = []
+
+        def worker():
+            for _ in range(5):
+                scheduler.call("test", calls.append, time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 20 calls at 50/s with a burst of 1 need at least ~19 refill intervals
+        self.assertEqual(len(calls), 20)
+        self.assertGreaterEqual(time.monotonic() - start, 19 / 50 * 0.9)
+
+    def test_backfill_yields_to_interactive(self):
+        scheduler = RequestScheduler(limits={"test": SourceLimit(rate=20.0, burst=1.0)})
+        order = []
+        scheduler.call("test", order.append, "warmup")
+
+        def backfill():
+            with request_priority(Priority.BACKFILL):
+                scheduler.call("test", order.append, "backfill")
+
+        def interactive():
+            scheduler.call("test", order.append, "interactive")
+
+        bf = threading.Thread(target=backfill)
+        bf.start()
+        time.sleep(0.005)
+        it = threading.Thread(target=interactive)
+        it.start()
+        bf.join()
+        it.join()
+        self.assertEqual(order, ["warmup", "interactive", "backfill"])
+
+    def test_retries_transient_errors(self):
+        scheduler = RequestScheduler(max_retries=2, base_delay=0.001)
+        retries = []
+        scheduler.on_retry = lambda source, exc, attempt: retries.append(attempt)
+        fn = MagicMock(side_effect=[ccxt.RateLimitExceeded("slow down"), ccxt.NetworkError("reset"), "ok"])
+        self.assertEqual(scheduler.call("binance", fn), "ok")
+        self.assertEqual(fn.call_count, 3)
+        self.assertEqual(retries, [1, 2])
+
+        fn = MagicMock(side_effect=ccxt.NetworkError("down"))
+        with self.assertRaises(ccxt.NetworkError):
+            scheduler.call("binance", fn)
+        self.assertEqual(fn.call_count, 3)
+
+    def test_does_not_retry_permanent_errors(self):
+        scheduler = RequestScheduler(base_delay=0.001)
+        fn = MagicMock(side_effect=ccxt.BadSymbol("nope"))
+        with self.assertRaises(ccxt.BadSymbol):
+            scheduler.call("binance", fn)
+        self.assertEqual(fn.call_count, 1)
+
+    def test_priority_context(self):
+        self.assertEqual(current_priority(), Priority.INTERACTIVE)
+        with request_priority("backfill"):
+            self.assertEqual(current_priority(), Priority.BACKFILL)
+        self.assertEqual(current_priority(), Priority.INTERACTIVE)
+
+    def test_ccxt_adapter_routes_through_scheduler(self):
+        adapter = CCXTAdapter("binance")
+        scheduler = MagicMock()
+        scheduler.call.side_effect = lambda source, fn, *a, **kw: fn(*a, **kw)
+        with patch.object(adapter.strategy.get_exchange(), "fetch_ohlcv", return_value=OHLCV), \
+                patch("unified_data.adapters.ccxt_adapter.get_scheduler", return_value=scheduler):
+            df = adapter.get_kline("BTC_USDT", "1m", limit=3)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(scheduler.call.call_args.args[0], "binance")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import sys
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data import pull_kline, update_kline, KlineStore
+from unified_data.adapters.base import BaseAdapter
+from unified_data.models.enums import MarketType, Exchange, Columns, Status
+
+HOUR_MS = 3_600_000
+
+
+class LiveAdapter(BaseAdapter):
+    """Hourly bars up to a movable 'now'; the forming bar's close is `self.tick`."""
+
+    def __init__(self):
+        self.shift_ms = 0
+        self.tick = 1.0
+        self.calls = []
+
+    def now_ms(self):
+        return int(time.time() * 1000) + self.shift_ms
+
+    def get_kline(self, ticker, period, start_date=None, end_date=None, limit=100, market_type=None):
+        self.calls.append((start_date, limit))
+        now = self.now_ms()
+        last = now - now % HOUR_MS
+        end = min(last, int(end_date.timestamp() * 1000)) if end_date else last
+        if start_date is None:
+            ts = [end - i * HOUR_MS for i in range(limit)][::-1]
+        else:
+            start = int(start_date.timestamp() * 1000)
+            ts = list(range(start - start % HOUR_MS, end + 1, HOUR_MS))[:limit]
+        return pl.DataFrame({
+            Columns.TIMESTAMP.value: ts,
+            Columns.OPEN.value: [1.0] * len(ts),
+            Columns.HIGH.value: [1.0] * len(ts),
+            Columns.LOW.value: [1.0] * len(ts),
+            Columns.CLOSE.value: [self.tick if t == last else 1.0 for t in ts],
+            Columns.VOLUME.value: [1.0] * len(ts),
+            Columns.SYMBOL.value: [ticker] * len(ts),
+        })
+
+    def get_exchange_symbol(self, ticker, market_type):
+        return ticker
+
+    def to_exchange_period(self, period):
+        return period
+
+
+class TestUpdateKline(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = LiveAdapter()
+        patcher = patch("unified_data.api._get_adapter", return_value=(self.adapter, Exchange.BINANCE))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_refreshes_forming_bar(self):
+        initial = pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", limit=5).data
+        last_ts = initial[Columns.TIMESTAMP.value].max()
+
+        self.adapter.tick = 2.0
+        upd = update_kline("BTC_USDT", MarketType.CRYPTO, "1h", since_df=initial)
+        self.assertEqual(upd.status, Status.OK)
+        start, n_bars = self.adapter.calls[-1]
+        self.assertEqual(int(start.timestamp() * 1000), last_ts)
+        self.assertLessEqual(n_bars, 3)
+        self.assertEqual(upd.delta[Columns.TIMESTAMP.value].to_list(), [last_ts])
+        self.assertEqual(upd.data.height, 5)
+        self.assertEqual(upd.data[Columns.CLOSE.value][-1], 2.0)
+        self.assertEqual(upd.data.columns, initial.columns)
+
+    def test_appends_new_bars(self):
+        # The known series ends two hours ago
+        self.adapter.shift_ms = -2 * HOUR_MS
+        initial = pull_kline("BTC_USDT", MarketType.CRYPTO, "1h", limit=5).data
+        last_ts = initial[Columns.TIMESTAMP.value].max()
+
+        self.adapter.shift_ms = 0
+        upd = update_kline("BTC_USDT", MarketType.CRYPTO, "1h", since_df=initial, limit=6)
+        self.assertEqual(upd.delta[Columns.TIMESTAMP.value].to_list(), [last_ts + h * HOUR_MS for h in range(3)])
+        self.assertEqual(upd.delta[Columns.EXCHANGE.value][0], Exchange.BINANCE)
+        self.assertEqual(upd.data.height, 6)
+        self.assertEqual(upd.data[Columns.TIMESTAMP.value].max(), last_ts + 2 * HOUR_MS)
+        self.assertTrue(upd.data[Columns.TIMESTAMP.value].is_sorted())
+
+    def test_store_backed(self):
+        with tempfile.TemporaryDirectory() as root:
+            store = KlineStore(root)
+            self.adapter.shift_ms = -2 * HOUR_MS
+            first = update_kline("BTC_USDT", MarketType.CRYPTO, "1h", store=store, limit=24)
+            self.assertEqual(first.status, Status.OK)
+            self.assertEqual(first.data.height, 24)
+            last_ts = first.data[Columns.TIMESTAMP.value].max()
+
+            self.adapter.shift_ms = 0
+            self.adapter.tick = 3.0
+            calls = len(self.adapter.calls)
+            upd = update_kline("BTC_USDT", MarketType.CRYPTO, "1h", store=store, limit=24)
+            # One request, starting after the bars the store already covers
+            self.assertEqual(len(self.adapter.calls), calls + 1)
+            start, _ = self.adapter.calls[-1]
+            self.assertEqual(int(start.timestamp() * 1000), last_ts + HOUR_MS)
+            self.assertEqual(upd.delta[Columns.TIMESTAMP.value].to_list(), [last_ts + h * HOUR_MS for h in range(3)])
+            self.assertEqual(upd.data.height, 24)
+            self.assertEqual(upd.data[Columns.CLOSE.value][-1], 3.0)
+            self.assertEqual(store.last_timestamp(Exchange.BINANCE, "BTC_USDT", "1h"), last_ts + 2 * HOUR_MS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import sys
+import os
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add src to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from unified_data.ws_api import sub_live_price, unsubscribe, close_streams, _ADAPTERS
+from unified_data.models.enums import Exchange
+
+
+class FakeTqApi:
+    """Local stand-in for a TqSdk feed: `push` publishes quotes that the next wait_update reports."""
+
+    def __init__(self, **kwargs):
+        self.cond = threading.Condition()
+        self.quotes = {}
+        self.pending = set()
+        self.changed = set()
+        self.get_quote_calls = []
+        self.wait_threads = set()
+        self.closed = False
+
+    def get_quote(self, symbol):
+        self.get_quote_calls.append(symbol)
+        quote = SimpleNamespace(datetime="", last_price=float("nan"), bid_price1=float("nan"),
+                                ask_price1=float("nan"), volume=0)
+        self.quotes[symbol] = quote
+        return quote
+
+    def push(self, symbol, price, second=0):
+        with self.cond:
+            quote = self.quotes[symbol]
+            quote.datetime = f"2025-01-02 09:00:{second:02d}.000000"
+            quote.last_price = price
+            quote.bid_price1 = price - 1
+            quote.ask_price1 = price + 1
+            self.pending.add(symbol)
+            self.cond.notify_all()
+
+    def wait_update(self):
+        self.wait_threads.add(threading.get_ident())
+        with self.cond:
+            self.cond.wait_for(lambda: self.pending, timeout=0.05)
+            self.changed, self.pending = self.pending, set()
+            return bool(self.changed)
+
+    def is_changing(self, quote):
+        return any(self.quotes[s] is quote for s in self.changed)
+
+    def close(self):
+        self.closed = True
+
+
+async def wait_for(cond, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not cond():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestLivePrice(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.api = FakeTqApi()
+        patcher = patch("unified_data.ws_adapters.tqsdk_adapter.TqApi", return_value=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addAsyncCleanup(close_streams)
+
+    async def test_multiplexes_over_one_connection(self):
+        got = {"SHFE.rb2505": [], "SHFE.cu2505": []}
+
+        async def on_rb(ticks):
+            got["SHFE.rb2505"].extend(ticks)
+
+        sub_rb = await sub_live_price("SHFE.rb2505", "futures", "tqsdk", on_rb)
+        sub_cu = await sub_live_price("SHFE.cu2505", "futures", "tqsdk", got["SHFE.cu2505"].extend)
+        await sub_live_price("SHFE.rb2505", "futures", "tqsdk", lambda ticks: None)
+        self.assertEqual(self.api.get_quote_calls, ["SHFE.rb2505", "SHFE.cu2505"])
+
+        self.api.push("SHFE.rb2505", 3500.0)
+        self.api.push("SHFE.cu2505", 78000.0)
+        await wait_for(lambda: got["SHFE.rb2505"] and got["SHFE.cu2505"])
+
+        tick = got["SHFE.rb2505"][0]
+        self.assertEqual((tick.symbol, tick.exchange, tick.price, tick.bid, tick.ask), ("SHFE.rb2505", Exchange.TQSDK, 3500.0, 3499.0, 3501.0))
+        # 09:00 in Shanghai is 01:00 UTC
+        self.assertEqual(tick.ts, 1735779600000)
+        self.assertEqual(got["SHFE.cu2505"][0].price, 78000.0)
+        self.assertEqual(len(self.api.wait_threads), 1, "One wait_update loop serves every subscription")
+
+        await unsubscribe(sub_cu)
+        self.api.push("SHFE.rb2505", 3501.0, second=1)
+        await wait_for(lambda: len(got["SHFE.rb2505"]) == 2)
+        self.assertEqual(len(got["SHFE.cu2505"]), 1)
+        self.assertEqual(sub_rb.dropped, 0)
+
+    async def test_slow_callback_gets_batches_and_latest_ticks(self):
+        batches = []
+        release = asyncio.Event()
+
+        async def slow(ticks):
+            batches.append([t.price for t in ticks])
+            await release.wait()
+
+        sub = await sub_live_price("SHFE.rb2505", "futures", "tqsdk", slow, max_pending=3)
+        self.api.push("SHFE.rb2505", 1.0)
+        await wait_for(lambda: batches)
+        # The callback is busy: later ticks queue up and only the newest three are kept
+        for i in range(2, 8):
+            self.api.push("SHFE.rb2505", float(i), second=i)
+            await wait_for(lambda: not self.api.pending)
+            await asyncio.sleep(0.02)
+        release.set()
+        await wait_for(lambda: len(batches) == 2)
+
+        self.assertEqual(batches, [[1.0], [5.0, 6.0, 7.0]])
+        self.assertEqual(sub.dropped, 3)
+
+    async def test_close_stops_the_loop(self):
+        await sub_live_price("SHFE.rb2505", "futures", "tqsdk", lambda ticks: None)
+        adapter = _ADAPTERS[Exchange.TQSDK]
+        await close_streams()
+        self.assertFalse(adapter.running)
+        await wait_for(lambda: self.api.closed)
+        self.assertNotIn(Exchange.TQSDK, _ADAPTERS)
+
+    async def test_unsupported_exchange(self):
+        with self.assertRaises(ValueError):
+            await sub_live_price("AAPL", "stock", "yfinance", lambda ticks: None)
+
+
+if __name__ == '__main__':
+    unittest.main()